@@ -0,0 +1,216 @@
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+import config
+from driver_metrics import get_command_stats
+from stats import summarize
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+BENCHMARK_WEBSITE = "benchmark.local"
+BENCHMARK_USER = "benchmark"
+BENCHMARK_PASSWORD = "benchmark-password"
+
+FORM_DATA = {
+    'full_name': "Ada Lovelace",
+    'email': "ada@example.com",
+    'phone': "555-0100",
+    'company': "Analytical Engines",
+    'country': "Canada",
+    'agree': True
+}
+
+def login_job(site, index, path="/login"):
+    return {
+        'id': str(index),
+        'type': 'login',
+        'website': BENCHMARK_WEBSITE,
+        'username': BENCHMARK_USER,
+        'login_config': {
+            'login_url': site.base_url + path,
+            'success_indicators': ['logout', 'dashboard']
+        }
+    }
+
+def form_job(site, index, path="/form", fields=None):
+    fields = fields or list(FORM_DATA)
+    field_types = {'country': 'select', 'agree': 'checkbox'}
+    return {
+        'id': str(index),
+        'type': 'form_submission',
+        'website': BENCHMARK_WEBSITE,
+        'form_config': {
+            'form_url': site.base_url + path,
+            'fields': {
+                name: {'selector': f'[name="{name}"]', 'by': 'css', 'type': field_types.get(name, 'text')}
+                for name in fields
+            },
+            'submit_button': {'selector': 'button[type="submit"]', 'by': 'css'},
+            'success_indicators': ['thank you', 'submitted']
+        },
+        'form_data': {name: FORM_DATA[name] for name in fields}
+    }
+
+WORKLOADS = {
+    'login': lambda site, index: login_job(site, index),
+    'form': lambda site, index: form_job(site, index),
+    'slow': lambda site, index: login_job(site, index, "/slow/login"),
+    'captcha': lambda site, index: form_job(site, index, "/captcha-form", ['full_name', 'email']),
+    'failure': lambda site, index: login_job(site, index, "/fail/login")
+}
+
+MIXED_WORKLOADS = tuple(sorted(WORKLOADS))
+
+def mixed_job(site, index):
+    return WORKLOADS[MIXED_WORKLOADS[index % len(MIXED_WORKLOADS)]](site, index)
+
+WORKLOADS['mixed'] = mixed_job
+
+def process_tree():
+    if psutil is None:
+        return []
+    process = psutil.Process()
+    return [process] + process.children(recursive=True)
+
+def tree_cpu_seconds():
+    total = 0.0
+    for process in process_tree():
+        try:
+            times = process.cpu_times()
+            total += times.user + times.system
+        except psutil.Error:
+            pass
+    return total
+
+def tree_rss_mb():
+    total = 0
+    for process in process_tree():
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+def use_benchmark_database(directory):
+    config.DATABASE_FILE = Path(directory) / "benchmark.db"
+    config.ENCRYPTION_KEY_FILE = Path(directory) / "benchmark.key"
+
+    from database import CredentialManager
+    CredentialManager().add_credential(BENCHMARK_WEBSITE, BENCHMARK_USER, BENCHMARK_PASSWORD, "benchmark")
+
+def run_workload(site, workload, job_count, workers, headless=True):
+    from batch_runner import BatchRunner
+
+    jobs = [WORKLOADS[workload](site, index) for index in range(job_count)]
+    runner = BatchRunner(workers=workers, headless=headless)
+    command_stats = get_command_stats()
+    command_stats.reset()
+
+    cpu_before = tree_cpu_seconds() if psutil else None
+    started = time.perf_counter()
+    try:
+        results = runner.run(jobs)
+        wall_time = time.perf_counter() - started
+        cpu_seconds = tree_cpu_seconds() - cpu_before if psutil else None
+        rss_mb = tree_rss_mb() if psutil else None
+    finally:
+        runner.shutdown()
+
+    commands = command_stats.snapshot()['commands']
+    command_count = sum(summary['count'] for summary in commands.values())
+
+    return {
+        'workload': workload,
+        'workers': workers,
+        'jobs': len(results),
+        'succeeded': sum(1 for result in results if result['success']),
+        'jobs_per_second': len(results) / wall_time if wall_time else None,
+        'latency': summarize([result['elapsed'] for result in results]),
+        'cpu_percent': cpu_seconds / wall_time * 100 if cpu_seconds is not None and wall_time else None,
+        'rss_mb': rss_mb,
+        'rss_mb_per_worker': rss_mb / workers if rss_mb is not None else None,
+        'commands_per_job': command_count / len(results) if results else None,
+        'commands': commands
+    }
+
+def format_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+def format_number(value, suffix=""):
+    return "-" if value is None else f"{value:.1f}{suffix}"
+
+def print_report(results):
+    print(f"{'Workload':<10} {'Workers':>7} {'Jobs':>5} {'OK':>5} {'Jobs/s':>8} {'p50 ms':>8} "
+          f"{'p95 ms':>8} {'p99 ms':>8} {'CPU':>8} {'RSS MB':>8} {'MB/wkr':>8}")
+    print("-" * 96)
+    for result in results:
+        latency = result['latency']
+        print(f"{result['workload']:<10} {result['workers']:>7} {result['jobs']:>5} {result['succeeded']:>5} "
+              f"{format_number(result['jobs_per_second']):>8} {format_ms(latency['p50']):>8} "
+              f"{format_ms(latency['p95']):>8} {format_ms(latency['p99']):>8} "
+              f"{format_number(result['cpu_percent'], '%'):>8} {format_number(result['rss_mb']):>8} "
+              f"{format_number(result['rss_mb_per_worker']):>8}")
+
+    for result in results:
+        commands = sorted(result['commands'].items(), key=lambda item: item[1]['total'], reverse=True)
+        if not commands:
+            continue
+
+        print(f"\nWebDriver commands: {result['workload']} / {result['workers']} worker(s), "
+              f"{format_number(result['commands_per_job'])} per job")
+        print(f"{'Command':<32} {'Count':>7} {'Total s':>9} {'Mean ms':>9} {'p95 ms':>9}")
+        for command, summary in commands[:config.BENCHMARK_TOP_COMMANDS]:
+            print(f"{command:<32} {summary['count']:>7} {summary['total']:>9.2f} "
+                  f"{format_ms(summary['mean']):>9} {format_ms(summary['p95']):>9}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="main.py --benchmark", description="End-to-end automation benchmark")
+    parser.add_argument("--workloads", nargs="+", default=["login", "form"], choices=sorted(WORKLOADS),
+                       help="Workloads to run against the local test site")
+    parser.add_argument("--jobs", type=int, default=20, help="Jobs per workload and worker count")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4], help="Worker counts to run")
+    parser.add_argument("--slow-delay", type=float, default=1.0, help="Server delay for the slow workload")
+    parser.add_argument("--show-browser", action="store_true", help="Run browsers with a visible window")
+    parser.add_argument("--no-delays", action="store_true", help="Skip the security delays between steps")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+
+    args = parser.parse_args(argv)
+
+    from benchmark_site import BenchmarkSite
+
+    if args.no_delays:
+        config.SECURITY_DELAY_MIN = 0
+        config.SECURITY_DELAY_MAX = 0
+
+    site = BenchmarkSite(slow_delay=args.slow_delay, users={BENCHMARK_USER: BENCHMARK_PASSWORD}).start()
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            use_benchmark_database(directory)
+
+            if not args.json:
+                print("Automation Benchmark")
+                print("=" * 96)
+                print(f"Site: {site.base_url}   Jobs per run: {args.jobs}")
+
+            for workload in args.workloads:
+                for workers in args.workers:
+                    result = run_workload(site, workload, args.jobs, workers, not args.show_browser)
+                    results.append(result)
+                    if args.json:
+                        print(json.dumps(result), flush=True)
+
+            if not args.json:
+                print_report(results)
+    finally:
+        site.stop()
+
+    return results
+
+if __name__ == "__main__":
+    main()
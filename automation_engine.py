@@ -1,5 +1,6 @@
 import logging
 import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -8,15 +9,39 @@ import config
 from browser_automation import BrowserAutomation
 from database import CredentialManager
 from captcha_solver import CaptchaSolver
+from job_control import CancellationToken, Deadline, DeadlineExceeded, JobCancelled
+from ocr_service import get_ocr_service
+from page_matching import match_indicators, captcha_indicator_sets, captcha_type_from_matches
+from tracing import JobTrace
+from driver_metrics import get_command_stats
+import metrics
+from log_setup import job_context
+from profiling import get_job_profiler
 
 logger = logging.getLogger(__name__)
 
+CAPTCHA_ELEMENTS = {
+    'image': ('css', 'img[src*="captcha"], .captcha img'),
+    'input': ('css', 'input[name*="captcha"], .captcha input'),
+    'math': ('css', '.captcha-text, .math-captcha'),
+    'recaptcha': ('css', 'iframe[src*="recaptcha"], .g-recaptcha')
+}
+
+CAPTCHA_REQUIRED_ELEMENTS = {
+    'text': ('image', 'input'),
+    'math': ('math', 'input')
+}
+
 class AutomationEngine:
     def __init__(self):
         self.browser = None
         self.credential_manager = CredentialManager()
         self.captcha_solver = CaptchaSolver()
         self.current_website = None
+        self.locator_hints = {}
+        self.listeners = []
+        self.cancel_token = CancellationToken()
+        self.trace = None
     
     def start_automation(self, website, username, headless=False):
         try:
@@ -45,15 +70,72 @@ class AutomationEngine:
             logger.error(f"Error stopping automation: {e}")
             return False
     
-    def login_to_website(self, website, username, login_config):
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+    
+    def _emit(self, event, **data):
+        for listener in list(self.listeners):
+            try:
+                listener(event, data)
+            except Exception as e:
+                logger.error(f"Error in automation listener: {e}")
+    
+    def _set_step(self, step):
+        if self.trace is not None:
+            self.trace.mark(step)
+        self._emit('job_step', website=self.current_website, step=step)
+    
+    def _begin_trace(self, website, job_id=None):
+        if self.trace is not None or not config.TRACE_JOBS:
+            return False
+        self.trace = JobTrace(job_id, website)
+        return True
+    
+    def _end_trace(self):
+        trace, self.trace = self.trace, None
+        for step, _, duration in trace.finish():
+            metrics.STEP_SECONDS.observe(duration, step=step)
+        self.credential_manager.save_job_trace(trace)
+    
+    def cancel(self, reason="Stopped by user"):
+        self.cancel_token.cancel(reason)
+    
+    def reset_cancellation(self):
+        self.cancel_token = CancellationToken()
+    
+    def _checkpoint(self):
+        if self.browser and self.browser.deadline is not None:
+            self.browser.deadline.check()
+        else:
+            self.cancel_token.check()
+    
+    def _pause(self, seconds):
+        if self.browser and self.browser.deadline is not None:
+            self.browser.deadline.sleep(seconds)
+        else:
+            time.sleep(seconds)
+    
+    def login_to_website(self, website, username, login_config, deadline=None):
+        owns_trace = self._begin_trace(website)
         try:
             if not self.browser:
                 logger.error("Browser not started")
                 return False
             
+            self.browser.deadline = deadline or Deadline.for_job(login_config.get('timeout'), self.cancel_token)
+            self.browser.website = website
+            self.browser.job_id = self.trace.trace_id if self.trace else None
+            self.current_website = website
+            
+            self._set_step('navigate')
             if not self.browser.navigate_to(login_config['login_url']):
                 return False
             
+            self._set_step('page_load')
             self.browser.wait_for_page_load()
             
             credentials = self.credential_manager.get_credential(website, username)
@@ -61,16 +143,19 @@ class AutomationEngine:
                 logger.error(f"No credentials found for {website} - {username}")
                 return False
             
-            username_field = login_config.get('username_field', 'username')
-            password_field = login_config.get('password_field', 'password')
-            submit_button = login_config.get('submit_button', 'submit')
+            username_field = login_config.get('username_field', {})
+            password_field = login_config.get('password_field', {})
+            submit_button = login_config.get('submit_button', {})
             
-            if not self._fill_login_form(credentials, username_field, password_field, submit_button):
+            self._set_step('fill')
+            if not self._fill_login_form(username, credentials, username_field, password_field, submit_button):
                 return False
             
+            self._set_step('captcha')
             if self._handle_captcha_if_present():
                 logger.info("CAPTCHA handled during login")
             
+            self._set_step('verify')
             if self._verify_login_success(login_config.get('success_indicators', [])):
                 logger.info(f"Successfully logged into {website}")
                 self.credential_manager.log_automation(website, "login", "success")
@@ -80,64 +165,163 @@ class AutomationEngine:
                 self.credential_manager.log_automation(website, "login", "failed")
                 return False
                 
+        except JobCancelled as e:
+            logger.info(f"Login to {website} cancelled: {e}")
+            self.credential_manager.log_automation(website, "login", "cancelled", str(e))
+            return False
+        except DeadlineExceeded as e:
+            logger.error(f"Login to {website} timed out: {e}")
+            self.credential_manager.log_automation(website, "login", "timeout", str(e))
+            return False
         except Exception as e:
             logger.error(f"Error during login: {e}")
             self.credential_manager.log_automation(website, "login", "error", str(e))
             return False
+        finally:
+            if self.browser:
+                self.browser.deadline = None
+                self.browser.job_id = None
+            if owns_trace:
+                self._end_trace()
+    
+    def _field_locators(self, field_config, default_selector):
+        if not isinstance(field_config, dict):
+            field_config = {'selector': field_config}
+        
+        selectors = field_config.get('selector') or default_selector
+        default_by = field_config.get('by', 'css')
+        if not isinstance(selectors, list):
+            selectors = [selectors]
+        
+        locators = []
+        for selector in selectors:
+            if isinstance(selector, dict):
+                locators.append((selector.get('by', default_by), selector['selector']))
+            elif isinstance(selector, (list, tuple)):
+                locators.append((selector[0], selector[1]))
+            else:
+                locators.append((default_by, selector))
+        return locators
+    
+    def _resolve_field(self, field_key, locators, timeout=None):
+        website = self.current_website
+        if website not in self.locator_hints:
+            self.locator_hints[website] = self.credential_manager.get_locator_hints(website)
+        
+        hint = self.locator_hints[website].get(field_key)
+        if hint in locators:
+            locators = [hint] + [locator for locator in locators if locator != hint]
+        
+        index, element = self.browser.find_first_element(locators, timeout)
+        if element is None:
+            return None
+        
+        matched = tuple(locators[index])
+        if matched != hint:
+            self.locator_hints[website][field_key] = matched
+            self.credential_manager.save_locator_hint(website, field_key, *matched)
+        return element
     
-    def _fill_login_form(self, credentials, username_field, password_field, submit_button):
+    def _fill_login_form(self, username, credentials, username_field, password_field, submit_button):
         try:
-            username_selector = username_field.get('selector', 'input[name="username"]')
-            password_selector = password_field.get('selector', 'input[name="password"]')
-            submit_selector = submit_button.get('selector', 'input[type="submit"]')
-            
-            username_by = username_field.get('by', 'css')
-            password_by = password_field.get('by', 'css')
-            submit_by = submit_button.get('by', 'css')
-            
-            if not self.browser.type_text(username_by, username_selector, credentials['password']):
+            username_element = self._resolve_field(
+                'username', self._field_locators(username_field, 'input[name="username"]')
+            )
+            if not username_element or not self.browser.type_into_element(username_element, username):
                 logger.error("Failed to enter username")
                 return False
             
-            if not self.browser.type_text(password_by, password_selector, credentials['password']):
+            self._checkpoint()
+            password_element = self._resolve_field(
+                'password', self._field_locators(password_field, 'input[name="password"]')
+            )
+            if not password_element or not self.browser.type_into_element(password_element, credentials['password']):
                 logger.error("Failed to enter password")
                 return False
             
-            if not self.browser.click_element(submit_by, submit_selector):
+            self._checkpoint()
+            submit_element = self._resolve_field(
+                'login_submit', self._field_locators(submit_button, 'input[type="submit"]')
+            )
+            if not submit_element or not self.browser.click_on_element(submit_element):
                 logger.error("Failed to click submit button")
                 return False
             
-            time.sleep(config.SECURITY_DELAY_MIN)
+            self._pause(config.SECURITY_DELAY_MIN)
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error filling login form: {e}")
             return False
     
     def _handle_captcha_if_present(self):
         try:
-            page_source = self.browser.get_page_source()
-            if not page_source:
+            matches = self._match_page_indicators(captcha_indicator_sets())
+            if 'captcha' not in matches:
+                return True
+            
+            logger.info("CAPTCHA detected, attempting to solve")
+            captcha_type = captcha_type_from_matches(matches)
+            if captcha_type not in CAPTCHA_REQUIRED_ELEMENTS:
+                logger.warning(f"Unsupported CAPTCHA type: {captcha_type}")
                 return False
             
-            if self.captcha_solver.detect_captcha_presence(page_source):
-                logger.info("CAPTCHA detected, attempting to solve")
-                
-                captcha_type = self.captcha_solver.detect_captcha_type(page_source)
-                if captcha_type == "text":
-                    return self._solve_text_captcha()
-                elif captcha_type == "math":
-                    return self._solve_math_captcha()
-                else:
-                    logger.warning(f"Unsupported CAPTCHA type: {captcha_type}")
-                    return False
+            present = self.browser.probe_elements(CAPTCHA_ELEMENTS)
+            missing = [name for name in CAPTCHA_REQUIRED_ELEMENTS[captcha_type] if not present[name]]
+            if missing:
+                logger.warning(f"{captcha_type} CAPTCHA detected but missing elements: {', '.join(missing)}")
+                return False
             
-            return True
+            if captcha_type == "text":
+                return self._solve_text_captcha()
+            return self._solve_math_captcha()
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error handling CAPTCHA: {e}")
             return False
     
+    def _match_page_indicators(self, indicator_sets):
+        if config.INDICATOR_MODE == "browser":
+            matches = self.browser.evaluate_indicators(indicator_sets)
+            if matches is not None:
+                return matches
+        
+        page_source = self.browser.get_page_source()
+        if not page_source:
+            return {}
+        return match_indicators(page_source, indicator_sets)
+    
+    def _solve_captcha_image(self, image, captcha_type):
+        with metrics.OCR_SECONDS.time(captcha_type=captcha_type):
+            if config.OCR_WORKERS <= 0:
+                return self.captcha_solver.solve_captcha(image, captcha_type)
+            return self._solve_with_ocr_service(image, captcha_type)
+    
+    def _solve_with_ocr_service(self, image, captcha_type):
+        deadline = self.browser.deadline
+        timeout = deadline.timeout(config.CAPTCHA_TIMEOUT) if deadline else config.CAPTCHA_TIMEOUT
+        future = get_ocr_service().submit(image, captcha_type)
+        expires_at = time.monotonic() + timeout
+        try:
+            while True:
+                remaining = expires_at - time.monotonic()
+                try:
+                    return future.result(timeout=max(0, min(config.CANCEL_POLL_INTERVAL, remaining)))
+                except FutureTimeoutError:
+                    if deadline:
+                        deadline.check()
+                    if remaining <= config.CANCEL_POLL_INTERVAL:
+                        logger.warning(f"CAPTCHA OCR timed out after {timeout:.1f}s")
+                        future.cancel()
+                        return None
+        except DeadlineExceeded:
+            future.cancel()
+            raise
+    
     def _solve_text_captcha(self):
         try:
             captcha_image = self.browser.find_element('css', 'img[src*="captcha"], .captcha img')
@@ -145,11 +329,11 @@ class AutomationEngine:
                 logger.warning("CAPTCHA image not found")
                 return False
             
-            screenshot_path = self.browser.take_screenshot("captcha.png")
-            if not screenshot_path:
+            captcha_pixels = self.browser.capture_element_image(captcha_image)
+            if captcha_pixels is None:
                 return False
             
-            captcha_text = self.captcha_solver.solve_captcha(screenshot_path, "text")
+            captcha_text = self._solve_captcha_image(captcha_pixels, "text")
             if not captcha_text:
                 return False
             
@@ -158,12 +342,14 @@ class AutomationEngine:
                 logger.warning("CAPTCHA input field not found")
                 return False
             
-            if not self.browser.type_text('css', captcha_input.get_attribute('name'), captcha_text):
+            if not self.browser.type_into_element(captcha_input, captcha_text):
                 return False
             
             logger.info(f"CAPTCHA solved: {captcha_text}")
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error solving text CAPTCHA: {e}")
             return False
@@ -186,12 +372,14 @@ class AutomationEngine:
             if not captcha_input:
                 return False
             
-            if not self.browser.type_text('css', captcha_input.get_attribute('name'), math_result):
+            if not self.browser.type_into_element(captcha_input, math_result):
                 return False
             
             logger.info(f"Math CAPTCHA solved: {captcha_text} = {math_result}")
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error solving math CAPTCHA: {e}")
             return False
@@ -199,43 +387,49 @@ class AutomationEngine:
     def _verify_login_success(self, success_indicators):
         try:
             if not success_indicators:
-                success_indicators = ['logout', 'profile', 'dashboard', 'welcome']
-            
-            page_source = self.browser.get_page_source()
-            if not page_source:
-                return False
+                success_indicators = config.LOGIN_SUCCESS_INDICATORS
             
-            page_lower = page_source.lower()
-            for indicator in success_indicators:
-                if indicator.lower() in page_lower:
-                    return True
-            
-            return False
+            matches = self._match_page_indicators({'success': success_indicators})
+            return 'success' in matches
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error verifying login success: {e}")
             return False
     
-    def submit_form(self, website, form_config, form_data):
+    def submit_form(self, website, form_config, form_data, deadline=None):
+        owns_trace = self._begin_trace(website)
         try:
             if not self.browser:
                 logger.error("Browser not started")
                 return False
             
+            self.browser.deadline = deadline or Deadline.for_job(form_config.get('timeout'), self.cancel_token)
+            self.browser.website = website
+            self.browser.job_id = self.trace.trace_id if self.trace else None
+            self.current_website = website
+            
+            self._set_step('navigate')
             if not self.browser.navigate_to(form_config['form_url']):
                 return False
             
+            self._set_step('page_load')
             self.browser.wait_for_page_load()
             
+            self._set_step('fill')
             if not self._fill_form_fields(form_config['fields'], form_data):
                 return False
             
+            self._set_step('captcha')
             if self._handle_captcha_if_present():
                 logger.info("CAPTCHA handled during form submission")
             
+            self._set_step('submit')
             if not self._submit_form(form_config['submit_button']):
                 return False
             
+            self._set_step('verify')
             if self._verify_form_submission_success(form_config.get('success_indicators', [])):
                 logger.info(f"Form submitted successfully to {website}")
                 self.credential_manager.log_automation(website, "form_submission", "success")
@@ -245,70 +439,90 @@ class AutomationEngine:
                 self.credential_manager.log_automation(website, "form_submission", "failed")
                 return False
                 
+        except JobCancelled as e:
+            logger.info(f"Form submission to {website} cancelled: {e}")
+            self.credential_manager.log_automation(website, "form_submission", "cancelled", str(e))
+            return False
+        except DeadlineExceeded as e:
+            logger.error(f"Form submission to {website} timed out: {e}")
+            self.credential_manager.log_automation(website, "form_submission", "timeout", str(e))
+            return False
         except Exception as e:
             logger.error(f"Error during form submission: {e}")
             self.credential_manager.log_automation(website, "form_submission", "error", str(e))
             return False
+        finally:
+            if self.browser:
+                self.browser.deadline = None
+                self.browser.job_id = None
+            if owns_trace:
+                self._end_trace()
     
     def _fill_form_fields(self, fields_config, form_data):
         try:
             for field_name, field_config in fields_config.items():
+                self._checkpoint()
                 if field_name not in form_data:
                     continue
                 
-                selector = field_config.get('selector', f'input[name="{field_name}"]')
                 field_type = field_config.get('type', 'text')
-                field_by = field_config.get('by', 'css')
+                locators = self._field_locators(field_config, f'input[name="{field_name}"]')
+                element = self._resolve_field(f'fields.{field_name}', locators)
+                if not element:
+                    logger.warning(f"Field not found: {field_name}")
+                    continue
                 
                 if field_type == 'text':
-                    if not self.browser.type_text(field_by, selector, form_data[field_name]):
+                    if not self.browser.type_into_element(element, form_data[field_name]):
                         logger.warning(f"Failed to fill field: {field_name}")
                         continue
                 elif field_type == 'select':
-                    if not self._select_option(field_by, selector, form_data[field_name]):
+                    if not self._select_option(element, form_data[field_name]):
                         logger.warning(f"Failed to select option for field: {field_name}")
                         continue
                 elif field_type == 'checkbox':
                     if form_data[field_name]:
-                        if not self.browser.click_element(field_by, selector):
+                        if not self.browser.click_on_element(element):
                             logger.warning(f"Failed to check checkbox: {field_name}")
                             continue
                 
-                time.sleep(config.SECURITY_DELAY_MIN)
+                self._pause(config.SECURITY_DELAY_MIN)
             
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error filling form fields: {e}")
             return False
     
-    def _select_option(self, by, selector, value):
+    def _select_option(self, select_element, value):
         try:
-            select_element = self.browser.find_element(by, selector)
-            if not select_element:
-                return False
-            
             from selenium.webdriver.support.ui import Select
             select = Select(select_element)
             select.select_by_visible_text(value)
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error selecting option: {e}")
             return False
     
     def _submit_form(self, submit_config):
         try:
-            selector = submit_config.get('selector', 'input[type="submit"], button[type="submit"]')
-            submit_by = submit_config.get('by', 'css')
+            locators = self._field_locators(submit_config, 'input[type="submit"], button[type="submit"]')
+            submit_element = self._resolve_field('form_submit', locators)
             
-            if not self.browser.click_element(submit_by, selector):
+            if not submit_element or not self.browser.click_on_element(submit_element):
                 logger.error("Failed to submit form")
                 return False
             
-            time.sleep(config.SECURITY_DELAY_MIN)
+            self._pause(config.SECURITY_DELAY_MIN)
             return True
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error submitting form: {e}")
             return False
@@ -316,49 +530,94 @@ class AutomationEngine:
     def _verify_form_submission_success(self, success_indicators):
         try:
             if not success_indicators:
-                success_indicators = ['success', 'thank you', 'submitted', 'received']
-            
-            page_source = self.browser.get_page_source()
-            if not page_source:
-                return False
+                success_indicators = config.FORM_SUCCESS_INDICATORS
             
-            page_lower = page_source.lower()
-            for indicator in success_indicators:
-                if indicator.lower() in page_lower:
-                    return True
-            
-            return False
+            matches = self._match_page_indicators({'success': success_indicators})
+            return 'success' in matches
             
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error verifying form submission: {e}")
             return False
     
-    def batch_process(self, websites, process_type="login"):
+    def _job_result(self, job, success, elapsed, cancelled=False):
+        return {
+            'id': job.get('id'),
+            'website': job['website'],
+            'username': job.get('username'),
+            'type': job.get('type', 'login'),
+            'success': success,
+            'cancelled': cancelled,
+            'elapsed': elapsed,
+            'timestamp': time.time()
+        }
+    
+    def run_job(self, job, deadline=None):
+        job_type = job.get('type', 'login')
+        website = job['website']
+        username = job.get('username')
+        deadline = deadline or Deadline.for_job(job.get('timeout'), self.cancel_token)
+        
+        metrics.JOBS_STARTED.inc(website=website)
+        self._emit('job_started', job_id=job.get('id'), website=website, username=username, type=job_type)
+        
+        profiler = get_job_profiler()
+        profile = profiler.start(job)
+        profile_path = None
+        owns_trace = self._begin_trace(website, job.get('id'))
+        trace_id = self.trace.trace_id if self.trace else None
+        with job_context(job_id=job.get('id'), website=website, trace_id=trace_id):
+            try:
+                logger.info(f"Processing {website} for {username}")
+                if self.browser is not None and not self._prepare_browser():
+                    logger.error(f"No healthy browser available for {website}")
+                    success = False
+                elif job_type == "login":
+                    success = self.login_to_website(website, username, job['login_config'], deadline)
+                elif job_type == "form_submission":
+                    success = self.submit_form(website, job['form_config'], job['form_data'], deadline)
+                else:
+                    logger.warning(f"Unknown process type: {job_type}")
+                    success = False
+            finally:
+                if owns_trace:
+                    self._end_trace()
+                if profile is not None:
+                    profile_path = profiler.finish(profile, job)
+            
+            result = self._job_result(job, success, deadline.elapsed(), not success and deadline.cancelled())
+            result['trace_id'] = trace_id
+            if profile_path is not None:
+                result['profile'] = str(profile_path)
+            if trace_id is not None and config.INSTRUMENT_WEBDRIVER:
+                result['webdriver_commands'] = get_command_stats().job_totals(trace_id)['count']
+            metrics.record_job_result(result)
+            self._emit('job_finished', **result)
+            return result
+    
+    def _prepare_browser(self):
+        self._set_step('browser_health')
+        return self.browser.prepare_for_job()
+    
+    def batch_process(self, websites, process_type="login", job_timeout=None):
         try:
             results = []
             
             for website_config in websites:
-                website = website_config['website']
-                username = website_config['username']
-                
-                logger.info(f"Processing {website} for {username}")
-                
-                if process_type == "login":
-                    success = self.login_to_website(website, username, website_config['login_config'])
-                elif process_type == "form_submission":
-                    success = self.submit_form(website, website_config['form_config'], website_config['form_data'])
-                else:
+                if process_type not in ("login", "form_submission"):
                     logger.warning(f"Unknown process type: {process_type}")
                     continue
                 
-                results.append({
-                    'website': website,
-                    'username': username,
-                    'success': success,
-                    'timestamp': time.time()
-                })
+                job = dict(website_config, type=process_type)
+                if self.cancel_token.cancelled():
+                    results.append(self._job_result(job, False, 0.0, cancelled=True))
+                    continue
+                
+                deadline = Deadline.for_job(website_config.get('timeout', job_timeout), self.cancel_token)
+                results.append(self.run_job(job, deadline))
                 
-                time.sleep(config.SECURITY_DELAY_MAX)
+                self.cancel_token.wait(config.SECURITY_DELAY_MAX)
             
             return results
             
@@ -381,6 +640,12 @@ class AutomationEngine:
                     'window_size': self.browser.get_window_size()
                 })
             
+            if config.INSTRUMENT_WEBDRIVER:
+                status['webdriver_commands'] = get_command_stats().snapshot(website=self.current_website)
+            
+            if self.browser and config.DRIVER_HEALTH_CHECKS:
+                status['driver_health'] = self.browser.health_snapshot()
+            
             return status
             
         except Exception as e:
@@ -0,0 +1,231 @@
+import json
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+import config
+from automation_engine import AutomationEngine
+from job_control import CancellationToken, Deadline
+import metrics
+from stats import summarize
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+REQUIRED_JOB_FIELDS = {
+    'login': ['website', 'username', 'login_config'],
+    'form_submission': ['website', 'form_config', 'form_data']
+}
+
+def load_jobs(path):
+    jobs = []
+    with open(path, 'r') as jobs_file:
+        for line_number, line in enumerate(jobs_file, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping invalid job on line {line_number}: {e}")
+                continue
+            error = prepare_job(job, str(line_number))
+            if error:
+                logger.error(f"Skipping job on line {line_number}: {error}")
+                continue
+            
+            jobs.append(job)
+    return jobs
+
+def prepare_job(job, default_id):
+    if not isinstance(job, dict):
+        return "job is not a JSON object"
+    job.setdefault('id', default_id)
+    job.setdefault('type', 'form_submission' if 'form_config' in job else 'login')
+    
+    required = REQUIRED_JOB_FIELDS.get(job['type'])
+    if required is None:
+        return f"unknown type {job['type']}"
+    missing = [field for field in required if field not in job]
+    if missing:
+        return f"missing {', '.join(missing)}"
+    return None
+
+def future_result(job, future):
+    if future.cancelled():
+        return {'id': job.get('id'), 'website': job.get('website'), 'success': False, 'cancelled': True}
+    error = future.exception()
+    if error is not None:
+        return {'id': job.get('id'), 'website': job.get('website'), 'success': False, 'error': str(error)}
+    return future.result()
+
+class BatchRunner:
+    def __init__(self, workers=None, headless=True, listener=None, job_timeout=None):
+        self.workers = workers or config.BATCH_WORKERS
+        self.headless = headless
+        self.listener = listener
+        self.job_timeout = job_timeout
+        self.jobs = queue.Queue()
+        self.threads = []
+        self.worker_states = {}
+        self.durations = []
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.started_at = None
+        self.cancel_token = CancellationToken()
+        self._lock = threading.Lock()
+    
+    def start(self):
+        if self.threads:
+            return
+        
+        self.started_at = time.monotonic()
+        for index in range(self.workers):
+            name = f"worker-{index + 1}"
+            self.worker_states[name] = {'status': 'idle', 'website': None, 'step': None, 'job_started': None}
+            thread = threading.Thread(target=self._worker_loop, args=(name,), name=name, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        logger.info(f"Started batch runner with {self.workers} workers")
+    
+    def submit(self, job):
+        future = Future()
+        self.jobs.put((job, future))
+        metrics.QUEUE_DEPTH.set(self.jobs.qsize())
+        self._notify('job_queued', website=job.get('website'), job_id=job.get('id'))
+        return future
+    
+    def run(self, jobs):
+        self.start()
+        futures = [self.submit(job) for job in jobs]
+        return [future.result() for future in futures]
+    
+    def stop(self, cancel_running=False):
+        if cancel_running:
+            self.cancel_token.cancel("Batch stopped")
+        
+        cancelled = 0
+        try:
+            while True:
+                item = self.jobs.get_nowait()
+                if item is not _STOP and item[1].cancel():
+                    cancelled += 1
+                    with self._lock:
+                        self.cancelled += 1
+                    self._notify('job_cancelled', website=item[0].get('website'), job_id=item[0].get('id'))
+        except queue.Empty:
+            pass
+        metrics.QUEUE_DEPTH.set(0)
+        
+        for _ in self.threads:
+            self.jobs.put(_STOP)
+        logger.info(f"Stopping batch runner, cancelled {cancelled} queued jobs")
+        self._notify('runner_stopping', cancelled=cancelled)
+    
+    def join(self, timeout=None):
+        for thread in self.threads:
+            thread.join(timeout)
+        self.threads = []
+    
+    def shutdown(self):
+        self.stop()
+        self.join()
+    
+    def _worker_loop(self, name):
+        engine = AutomationEngine()
+        engine.add_listener(lambda event, data: self._on_engine_event(name, event, data))
+        
+        try:
+            while True:
+                item = self.jobs.get()
+                metrics.QUEUE_DEPTH.set(self.jobs.qsize())
+                if item is _STOP:
+                    break
+                
+                job, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                
+                try:
+                    future.set_result(self._run_job(engine, job))
+                except Exception as e:
+                    logger.error(f"Error running job for {job.get('website')}: {e}")
+                    future.set_exception(e)
+        finally:
+            engine.stop_automation()
+            self._update_worker(name, status='stopped', website=None, step=None, job_started=None)
+    
+    def _run_job(self, engine, job):
+        deadline = Deadline.for_job(job.get('timeout', self.job_timeout), self.cancel_token)
+        
+        if engine.browser is None:
+            engine._set_step('browser_start')
+            if not engine.start_automation(job['website'], job.get('username'), self.headless):
+                engine.browser = None
+                result = engine._job_result(job, False, deadline.elapsed())
+                metrics.JOBS_STARTED.inc(website=job['website'])
+                metrics.record_job_result(result)
+                engine._emit('job_finished', **result)
+                return result
+        
+        return engine.run_job(job, deadline)
+    
+    def _on_engine_event(self, name, event, data):
+        if event == 'job_started':
+            self._update_worker(name, status='running', website=data['website'], step=None,
+                                job_started=time.monotonic())
+        elif event == 'job_step':
+            self._update_worker(name, step=data['step'])
+        elif event == 'job_finished':
+            with self._lock:
+                self.durations.append(data['elapsed'])
+                if data['success']:
+                    self.completed += 1
+                elif data.get('cancelled'):
+                    self.cancelled += 1
+                else:
+                    self.failed += 1
+            self._update_worker(name, status='idle', website=None, step=None, job_started=None)
+        
+        self._notify(event, worker=name, **data)
+    
+    def _update_worker(self, name, **changes):
+        with self._lock:
+            self.worker_states.setdefault(name, {}).update(changes)
+    
+    def _notify(self, event, **data):
+        if self.listener is None:
+            return
+        try:
+            self.listener(event, data)
+        except Exception as e:
+            logger.error(f"Error in batch listener: {e}")
+    
+    def snapshot(self):
+        now = time.monotonic()
+        with self._lock:
+            finished = self.completed + self.failed
+            elapsed_minutes = (now - self.started_at) / 60 if self.started_at else 0
+            workers = []
+            for name, state in sorted(self.worker_states.items()):
+                job_started = state.get('job_started')
+                workers.append({
+                    'name': name,
+                    'status': state.get('status'),
+                    'website': state.get('website'),
+                    'step': state.get('step'),
+                    'running_for': now - job_started if job_started else None
+                })
+            
+            return {
+                'queue_depth': self.jobs.qsize(),
+                'completed': self.completed,
+                'failed': self.failed,
+                'cancelled': self.cancelled,
+                'jobs_per_minute': finished / elapsed_minutes if elapsed_minutes else 0.0,
+                'duration': summarize(self.durations),
+                'workers': workers
+            }
@@ -0,0 +1,176 @@
+import html
+import logging
+import random
+import string
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import cv2
+from captcha_benchmark import render_challenge
+
+logger = logging.getLogger(__name__)
+
+PAGE_TEMPLATE = '''<!DOCTYPE html>
+<html>
+<head><title>{title}</title></head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+'''
+
+LOGIN_FORM = '''<form method="post" action="{action}">
+<label>Username <input type="text" name="username"></label>
+<label>Password <input type="password" name="password"></label>
+<input type="submit" value="Sign in">
+</form>
+<a href="#">Forgot password?</a>
+'''
+
+APPLICATION_FORM = '''<form method="post" action="/form">
+<label>Full name <input type="text" name="full_name"></label>
+<label>Email <input type="text" name="email"></label>
+<label>Phone <input type="text" name="phone"></label>
+<label>Company <input type="text" name="company"></label>
+<label>Country <select name="country">
+<option>United States</option><option>Canada</option><option>Germany</option><option>India</option>
+</select></label>
+<label><input type="checkbox" name="agree" value="yes"> I agree to the terms</label>
+<button type="submit">Apply</button>
+</form>
+'''
+
+CAPTCHA_FORM = '''<form method="post" action="/captcha-form">
+<label>Full name <input type="text" name="full_name"></label>
+<label>Email <input type="text" name="email"></label>
+<div class="captcha">
+<p>Type the characters shown below to prove you are human.</p>
+<img src="/captcha/{token}.png" alt="captcha">
+<input type="text" name="captcha_answer">
+<input type="hidden" name="captcha_token" value="{token}">
+</div>
+<button type="submit">Send</button>
+</form>
+'''
+
+FORM_FIELDS = ['full_name', 'email', 'phone', 'company', 'country', 'agree']
+
+class BenchmarkSiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        site = self.server.site
+        path = urlparse(self.path).path
+        
+        if path in ("/login", "/slow/login", "/fail/login"):
+            if path.startswith("/slow"):
+                time.sleep(site.slow_delay)
+            self._send_page("Member Login", LOGIN_FORM.format(action=path))
+        elif path == "/form":
+            self._send_page("Job Application", APPLICATION_FORM)
+        elif path == "/captcha-form":
+            self._send_page("Contact Us", CAPTCHA_FORM.format(token=site.new_challenge()))
+        elif path.startswith("/captcha/") and path.endswith(".png"):
+            image = site.challenge_image(path[len("/captcha/"):-len(".png")])
+            if image is None:
+                self._send(404, "text/plain", b"Unknown challenge")
+            else:
+                self._send(200, "image/png", image)
+        else:
+            self._send_page("Not Found", "<p>No such page.</p>", status=404)
+    
+    def do_POST(self):
+        site = self.server.site
+        path = urlparse(self.path).path
+        length = int(self.headers.get('Content-Length', 0))
+        fields = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode()).items()}
+        
+        if path in ("/login", "/slow/login"):
+            if path.startswith("/slow"):
+                time.sleep(site.slow_delay)
+            if site.users.get(fields.get('username')) == fields.get('password'):
+                self._send_page("Dashboard", f"<p>Welcome back, {html.escape(fields['username'])}.</p>"
+                                             '<a href="/login">Logout</a>')
+            else:
+                self._send_page("Member Login", "<p>Invalid password. Please try again.</p>"
+                                + LOGIN_FORM.format(action=path))
+        elif path == "/fail/login":
+            self._send_page("Member Login", "<p>Login failed: access denied.</p>" + LOGIN_FORM.format(action=path))
+        elif path == "/form":
+            missing = [name for name in FORM_FIELDS if not fields.get(name)]
+            if missing:
+                self._send_page("Job Application", f"<p>Missing fields: {', '.join(missing)}</p>" + APPLICATION_FORM)
+            else:
+                self._send_page("Application Received", "<p>Thank you! Your application was submitted.</p>")
+        elif path == "/captcha-form":
+            if site.check_challenge(fields.get('captcha_token'), fields.get('captcha_answer')):
+                self._send_page("Message Sent", "<p>Thank you! Your message was submitted.</p>")
+            else:
+                self._send_page("Contact Us", "<p>Wrong answer, try again.</p>"
+                                + CAPTCHA_FORM.format(token=site.new_challenge()))
+        else:
+            self._send_page("Not Found", "<p>No such page.</p>", status=404)
+    
+    def _send_page(self, title, body, status=200):
+        self._send(status, "text/html; charset=utf-8", PAGE_TEMPLATE.format(title=title, body=body).encode())
+    
+    def _send(self, status, content_type, data):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+class BenchmarkSite:
+    def __init__(self, host="127.0.0.1", port=0, slow_delay=1.0, users=None, seed=0):
+        self.host = host
+        self.port = port
+        self.slow_delay = slow_delay
+        self.users = dict(users or {'benchmark': 'benchmark-password'})
+        self.challenges = {}
+        self.server = None
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), BenchmarkSiteHandler)
+        self.server.daemon_threads = True
+        self.server.site = self
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, name="benchmark-site", daemon=True).start()
+        logger.info(f"Benchmark site listening on {self.base_url}")
+        return self
+    
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+    
+    def new_challenge(self):
+        with self._lock:
+            answer = ''.join(self._rng.choice(string.ascii_uppercase + string.digits) for _ in range(5))
+            image = render_challenge(answer, self._rng)
+            token = uuid.uuid4().hex
+            self.challenges[token] = (answer, cv2.imencode('.png', image)[1].tobytes())
+        return token
+    
+    def challenge_image(self, token):
+        with self._lock:
+            challenge = self.challenges.get(token)
+        return challenge[1] if challenge else None
+    
+    def check_challenge(self, token, answer):
+        with self._lock:
+            challenge = self.challenges.pop(token, None)
+        return challenge is not None and (answer or '').strip().upper() == challenge[0]
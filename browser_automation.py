@@ -1,6 +1,8 @@
 import time
 import logging
 import platform
+import threading
+from contextlib import contextmanager
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,17 +18,109 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 import config
+from driver_health import DriverHealth, get_watchdog, kill_process_tree
+from driver_metrics import get_command_stats, instrument_driver
+from job_control import DeadlineExceeded
+import metrics
 
 logger = logging.getLogger(__name__)
 
+BY_ALIASES = {
+    'css': By.CSS_SELECTOR,
+    'id': By.ID,
+    'xpath': By.XPATH,
+    'name': By.NAME,
+    'class': By.CLASS_NAME,
+    'tag': By.TAG_NAME,
+    'link_text': By.LINK_TEXT,
+    'partial_link_text': By.PARTIAL_LINK_TEXT
+}
+
+SCRIPT_LOCATOR_KINDS = {
+    By.CSS_SELECTOR, By.ID, By.XPATH, By.NAME, By.CLASS_NAME, By.TAG_NAME,
+    By.LINK_TEXT, By.PARTIAL_LINK_TEXT
+}
+
+LOCATE_JS = '''
+function locate(by, value) {
+    try {
+        if (by === 'xpath') {
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        if (by === 'id') return document.getElementById(value);
+        if (by === 'name') return document.getElementsByName(value)[0] || null;
+        if (by === 'class name') return document.getElementsByClassName(value)[0] || null;
+        if (by === 'tag name') return document.getElementsByTagName(value)[0] || null;
+        if (by === 'link text' || by === 'partial link text') {
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = (links[i].innerText || '').trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) return links[i];
+            }
+            return null;
+        }
+        return document.querySelector(value);
+    } catch (e) {
+        return null;
+    }
+}
+'''
+
+PROBE_SCRIPT = LOCATE_JS + '''
+return arguments[0].map(function(locator) {
+    return locate(locator[0], locator[1]) !== null;
+});
+'''
+
+FIRST_MATCH_SCRIPT = LOCATE_JS + '''
+var locators = arguments[0];
+for (var i = 0; i < locators.length; i++) {
+    var element = locate(locators[i][0], locators[i][1]);
+    if (element !== null) return [i, element];
+}
+return null;
+'''
+
+INDICATOR_SCRIPT = '''
+var indicatorSets = arguments[0];
+var parts = [document.title || '', document.body ? document.body.innerText : ''];
+var attributes = ['id', 'class', 'name', 'src', 'title', 'alt', 'placeholder', 'aria-label', 'action'];
+var nodes = document.querySelectorAll('body *:not(script):not(style):not(noscript):not(template)');
+for (var i = 0; i < nodes.length; i++) {
+    for (var j = 0; j < attributes.length; j++) {
+        var value = nodes[i].getAttribute(attributes[j]);
+        if (value) parts.push(value);
+    }
+}
+var haystack = parts.join('\\n').toLowerCase();
+var matches = {};
+Object.keys(indicatorSets).forEach(function(label) {
+    var matched = indicatorSets[label].filter(function(indicator) {
+        return haystack.indexOf(indicator.toLowerCase()) !== -1;
+    });
+    if (matched.length) matches[label] = matched;
+});
+return matches;
+'''
+
+def resolve_by(by):
+    return BY_ALIASES.get(by, by)
+
 class BrowserAutomation:
     def __init__(self, browser_type=None, headless=False):
         self.browser_type = browser_type or config.BROWSER_TYPE
         self.headless = headless or config.HEADLESS
         self.driver = None
         self.wait = None
+        self.deadline = None
+        self.implicit_wait = config.DRIVER_IMPLICIT_WAIT
+        self.website = None
+        self.job_id = None
+        self.command_stats = None
+        self.health = None
     
     def start_browser(self):
+        started = time.perf_counter()
         try:
             if self.browser_type.lower() == "chrome":
                 self.driver = self._setup_chrome()
@@ -37,15 +131,33 @@ class BrowserAutomation:
             else:
                 raise ValueError(f"Unsupported browser type: {self.browser_type}")
             
-            self.driver.implicitly_wait(config.IMPLICIT_WAIT)
+            self.command_stats = get_command_stats() if config.INSTRUMENT_WEBDRIVER else None
+            self.health = DriverHealth() if config.DRIVER_HEALTH_CHECKS else None
+            if self.command_stats or self.health:
+                instrument_driver(self.driver, self.command_stats, lambda: (self.website, self.job_id), self.health)
+            if self.health and config.DRIVER_COMMAND_TIMEOUT:
+                get_watchdog().watch(self)
+            
+            self.implicit_wait = config.DRIVER_IMPLICIT_WAIT
+            self.driver.implicitly_wait(self.implicit_wait)
             self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
             self.wait = WebDriverWait(self.driver, config.IMPLICIT_WAIT)
             
+            metrics.ACTIVE_BROWSERS.inc()
+            metrics.BROWSER_STARTUP_SECONDS.observe(time.perf_counter() - started, browser=self.browser_type.lower())
             logger.info(f"Started {self.browser_type} browser successfully")
             return True
             
         except Exception as e:
             logger.error(f"Error starting browser: {e}")
+            if self.driver is not None:
+                get_watchdog().unwatch(self)
+                try:
+                    self.driver.quit()
+                except Exception as quit_error:
+                    logger.error(f"Error closing half-started browser: {quit_error}")
+                self.driver = None
+                self.wait = None
             return False
     
     def _setup_chrome(self):
@@ -60,11 +172,11 @@ class BrowserAutomation:
         
         if platform.system() == "Windows":
             if platform.machine().endswith('64'):
-                service = Service(ChromeDriverManager(os_type="win64").install())
+                service = ChromeService(ChromeDriverManager(os_type="win64").install())
             else:
-                service = Service(ChromeDriverManager(os_type="win32").install())
+                service = ChromeService(ChromeDriverManager(os_type="win32").install())
         else:
-            service = Service(ChromeDriverManager().install())
+            service = ChromeService(ChromeDriverManager().install())
         return webdriver.Chrome(service=service, options=chrome_options)
     
     def _setup_firefox(self):
@@ -74,7 +186,7 @@ class BrowserAutomation:
         firefox_options.add_argument("--width=1920")
         firefox_options.add_argument("--height=1080")
         
-        service = Service(GeckoDriverManager().install())
+        service = FirefoxService(GeckoDriverManager().install())
         return webdriver.Firefox(service=service, options=firefox_options)
     
     def _setup_edge(self):
@@ -85,10 +197,11 @@ class BrowserAutomation:
         edge_options.add_argument("--disable-dev-shm-usage")
         edge_options.add_argument("--window-size=1920,1080")
         
-        service = Service(EdgeChromiumDriverManager().install())
+        service = EdgeService(EdgeChromiumDriverManager().install())
         return webdriver.Edge(service=service, options=edge_options)
     
     def close_browser(self):
+        get_watchdog().unwatch(self)
         if self.driver:
             try:
                 self.driver.quit()
@@ -96,25 +209,182 @@ class BrowserAutomation:
             except Exception as e:
                 logger.error(f"Error closing browser: {e}")
             finally:
+                metrics.ACTIVE_BROWSERS.dec()
                 self.driver = None
                 self.wait = None
     
+    def driver_pid(self):
+        process = getattr(getattr(self.driver, 'service', None), 'process', None)
+        return process.pid if process else None
+    
+    def is_responsive(self, timeout=None):
+        outcome = {}
+        
+        def probe():
+            try:
+                outcome['url'] = self.driver.current_url
+            except Exception as e:
+                outcome['error'] = e
+        
+        thread = threading.Thread(target=probe, name="driver-ping", daemon=True)
+        thread.start()
+        thread.join(timeout or config.DRIVER_PING_TIMEOUT)
+        if 'url' not in outcome:
+            logger.warning(f"Browser did not answer a health ping: {outcome.get('error', 'timed out')}")
+            return False
+        return True
+    
+    def health_snapshot(self):
+        if self.health is None or self.driver is None:
+            return {}
+        return self.health.snapshot(self.driver_pid())
+    
+    def check_health(self):
+        if self.health is None or self.driver is None:
+            return None, {}
+        if self.health.killed_reason is not None:
+            return self.health.killed_reason, self.health_snapshot()
+        
+        reason, snapshot = self.health.recycle_reason(self.driver_pid())
+        if snapshot['rss_mb'] is not None:
+            metrics.BROWSER_RSS_MB.observe(snapshot['rss_mb'])
+        if reason is None and not self.is_responsive():
+            reason = 'unresponsive'
+        return reason, snapshot
+    
+    def kill_driver(self, reason):
+        if self.health is not None:
+            self.health.killed_reason = reason
+        try:
+            if not kill_process_tree(self.driver_pid()) and self.driver is not None:
+                self.driver.service.stop()
+        except Exception as e:
+            logger.error(f"Error killing browser driver: {e}")
+    
+    def recycle(self, reason, snapshot=None):
+        logger.warning(f"Recycling {self.browser_type} browser ({reason}): {snapshot or {}}")
+        metrics.BROWSER_RECYCLES.inc(reason=reason)
+        if reason == 'unresponsive':
+            self.kill_driver(reason)
+        self.close_browser()
+        return self.start_browser()
+    
+    def prepare_for_job(self):
+        if not config.DRIVER_HEALTH_CHECKS:
+            return self.driver is not None
+        if self.driver is None:
+            metrics.BROWSER_RECYCLES.inc(reason='missing')
+            if not self.start_browser():
+                return False
+        
+        reason, snapshot = self.check_health()
+        if reason is not None and not self.recycle(reason, snapshot):
+            return False
+        if self.health is not None:
+            self.health.record_job()
+        return True
+    
+    def _timeout(self, timeout, default):
+        wait_time = timeout or default
+        if self.deadline is not None:
+            wait_time = self.deadline.timeout(wait_time)
+        return wait_time
+    
+    def _wait_until(self, condition, timeout, default=None):
+        wait_time = self._timeout(timeout, default or config.IMPLICIT_WAIT)
+        deadline = self.deadline
+        if deadline is None:
+            return WebDriverWait(self.driver, wait_time).until(condition)
+        
+        def checked_condition(driver):
+            deadline.check()
+            return condition(driver)
+        
+        return WebDriverWait(self.driver, wait_time, poll_frequency=config.CANCEL_POLL_INTERVAL).until(checked_condition)
+    
+    @contextmanager
+    def implicit_wait_disabled(self):
+        if not self.implicit_wait:
+            yield
+            return
+        
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(self.implicit_wait)
+    
+    @contextmanager
+    def deadline_page_load_timeout(self):
+        if self.deadline is None:
+            yield
+            return
+        
+        self.driver.set_page_load_timeout(self._timeout(None, config.PAGE_LOAD_TIMEOUT))
+        try:
+            yield
+        finally:
+            self.driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+    
+    def probe_elements(self, locators):
+        try:
+            names = list(locators)
+            resolved = [(resolve_by(by), value) for by, value in locators.values()]
+            scripted = [locator for locator in resolved if locator[0] in SCRIPT_LOCATOR_KINDS]
+            
+            found = {}
+            if scripted:
+                found.update(zip(scripted, self.driver.execute_script(PROBE_SCRIPT, scripted)))
+            
+            remaining = [locator for locator in resolved if locator not in found]
+            if remaining:
+                with self.implicit_wait_disabled():
+                    for by, value in remaining:
+                        found[(by, value)] = len(self.driver.find_elements(by, value)) > 0
+            
+            return {name: bool(found[locator]) for name, locator in zip(names, resolved)}
+        except Exception as e:
+            logger.error(f"Error probing elements: {e}")
+            return {name: False for name in locators}
+    
+    def find_first_element(self, locators, timeout=None):
+        try:
+            resolved = [[resolve_by(by), value] for by, value in locators]
+            index, element = self._wait_until(
+                lambda driver: driver.execute_script(FIRST_MATCH_SCRIPT, resolved),
+                timeout
+            )
+            return index, element
+        except DeadlineExceeded:
+            raise
+        except TimeoutException:
+            logger.warning(f"None of {len(locators)} locators matched: {locators}")
+            return None, None
+        except Exception as e:
+            logger.error(f"Error resolving locators {locators}: {e}")
+            return None, None
+    
     def navigate_to(self, url):
         try:
-            self.driver.get(url)
-            logger.info(f"Navigated to: {url}")
+            with self.deadline_page_load_timeout():
+                self.driver.get(url)
+            logger.debug("Navigated to: %s", url)
             return True
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error navigating to {url}: {e}")
             return False
     
     def find_element(self, by, value, timeout=None):
         try:
-            wait_time = timeout or config.IMPLICIT_WAIT
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located((by, value))
+            element = self._wait_until(
+                EC.presence_of_element_located((resolve_by(by), value)),
+                timeout
             )
             return element
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             logger.warning(f"Element not found: {by}={value}")
             return None
@@ -124,11 +394,13 @@ class BrowserAutomation:
     
     def find_elements(self, by, value, timeout=None):
         try:
-            wait_time = timeout or config.IMPLICIT_WAIT
-            elements = WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_all_elements_located((by, value))
+            elements = self._wait_until(
+                EC.presence_of_all_elements_located((resolve_by(by), value)),
+                timeout
             )
             return elements
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             logger.warning(f"Elements not found: {by}={value}")
             return None
@@ -141,9 +413,11 @@ class BrowserAutomation:
             element = self.find_element(by, value, timeout)
             if element:
                 element.click()
-                logger.info(f"Clicked element: {by}={value}")
+                logger.debug("Clicked element: %s=%s", by, value)
                 return True
             return False
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error clicking element {by}={value}: {e}")
             return False
@@ -155,32 +429,56 @@ class BrowserAutomation:
                 if clear_first:
                     element.clear()
                 element.send_keys(text)
-                logger.info(f"Typed text into {by}={value}")
+                logger.debug("Typed text into %s=%s", by, value)
                 return True
             return False
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error typing text into {by}={value}: {e}")
             return False
     
+    def click_on_element(self, element):
+        try:
+            element.click()
+            return True
+        except Exception as e:
+            logger.error(f"Error clicking element: {e}")
+            return False
+    
+    def type_into_element(self, element, text, clear_first=True):
+        try:
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+            return True
+        except Exception as e:
+            logger.error(f"Error typing text into element: {e}")
+            return False
+    
     def submit_form(self, by, value, timeout=None):
         try:
             element = self.find_element(by, value, timeout)
             if element:
                 element.submit()
-                logger.info(f"Submitted form: {by}={value}")
+                logger.debug("Submitted form: %s=%s", by, value)
                 return True
             return False
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error submitting form {by}={value}: {e}")
             return False
     
     def wait_for_element(self, by, value, timeout=None):
         try:
-            wait_time = timeout or config.IMPLICIT_WAIT
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.presence_of_element_located((by, value))
+            element = self._wait_until(
+                EC.presence_of_element_located((resolve_by(by), value)),
+                timeout
             )
             return element
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             logger.warning(f"Timeout waiting for element: {by}={value}")
             return None
@@ -190,12 +488,15 @@ class BrowserAutomation:
     
     def wait_for_page_load(self, timeout=None):
         try:
-            wait_time = timeout or config.PAGE_LOAD_TIMEOUT
-            WebDriverWait(self.driver, wait_time).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            self._wait_until(
+                lambda driver: driver.execute_script("return document.readyState") == "complete",
+                timeout,
+                config.PAGE_LOAD_TIMEOUT
             )
-            logger.info("Page loaded completely")
+            logger.debug("Page loaded completely")
             return True
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             logger.warning("Page load timeout")
             return False
@@ -209,6 +510,7 @@ class BrowserAutomation:
                 timestamp = int(time.time())
                 filename = f"screenshot_{timestamp}.png"
             
+            config.ensure_directories()
             filepath = config.SCREENSHOTS_DIR / filename
             self.driver.save_screenshot(str(filepath))
             logger.info(f"Screenshot saved: {filepath}")
@@ -217,6 +519,16 @@ class BrowserAutomation:
             logger.error(f"Error taking screenshot: {e}")
             return None
     
+    def capture_element_image(self, element):
+        try:
+            import cv2
+            import numpy as np
+            png = element.screenshot_as_png
+            return cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+        except Exception as e:
+            logger.error(f"Error capturing element image: {e}")
+            return None
+    
     def get_page_title(self):
         try:
             return self.driver.title
@@ -234,7 +546,7 @@ class BrowserAutomation:
     def execute_script(self, script):
         try:
             result = self.driver.execute_script(script)
-            logger.info(f"Executed script: {script[:50]}...")
+            logger.debug("Executed script: %s...", script[:50])
             return result
         except Exception as e:
             logger.error(f"Error executing script: {e}")
@@ -243,7 +555,7 @@ class BrowserAutomation:
     def switch_to_frame(self, frame_reference):
         try:
             self.driver.switch_to.frame(frame_reference)
-            logger.info(f"Switched to frame: {frame_reference}")
+            logger.debug("Switched to frame: %s", frame_reference)
             return True
         except Exception as e:
             logger.error(f"Error switching to frame: {e}")
@@ -252,7 +564,7 @@ class BrowserAutomation:
     def switch_to_default_content(self):
         try:
             self.driver.switch_to.default_content()
-            logger.info("Switched to default content")
+            logger.debug("Switched to default content")
             return True
         except Exception as e:
             logger.error(f"Error switching to default content: {e}")
@@ -268,7 +580,7 @@ class BrowserAutomation:
     def add_cookie(self, cookie_dict):
         try:
             self.driver.add_cookie(cookie_dict)
-            logger.info(f"Added cookie: {cookie_dict.get('name', 'unknown')}")
+            logger.debug("Added cookie: %s", cookie_dict.get('name', 'unknown'))
             return True
         except Exception as e:
             logger.error(f"Error adding cookie: {e}")
@@ -277,7 +589,7 @@ class BrowserAutomation:
     def delete_all_cookies(self):
         try:
             self.driver.delete_all_cookies()
-            logger.info("Deleted all cookies")
+            logger.debug("Deleted all cookies")
             return True
         except Exception as e:
             logger.error(f"Error deleting cookies: {e}")
@@ -286,7 +598,7 @@ class BrowserAutomation:
     def refresh_page(self):
         try:
             self.driver.refresh()
-            logger.info("Page refreshed")
+            logger.debug("Page refreshed")
             return True
         except Exception as e:
             logger.error(f"Error refreshing page: {e}")
@@ -295,7 +607,7 @@ class BrowserAutomation:
     def go_back(self):
         try:
             self.driver.back()
-            logger.info("Went back to previous page")
+            logger.debug("Went back to previous page")
             return True
         except Exception as e:
             logger.error(f"Error going back: {e}")
@@ -304,7 +616,7 @@ class BrowserAutomation:
     def go_forward(self):
         try:
             self.driver.forward()
-            logger.info("Went forward to next page")
+            logger.debug("Went forward to next page")
             return True
         except Exception as e:
             logger.error(f"Error going forward: {e}")
@@ -313,7 +625,7 @@ class BrowserAutomation:
     def maximize_window(self):
         try:
             self.driver.maximize_window()
-            logger.info("Window maximized")
+            logger.debug("Window maximized")
             return True
         except Exception as e:
             logger.error(f"Error maximizing window: {e}")
@@ -322,7 +634,7 @@ class BrowserAutomation:
     def set_window_size(self, width, height):
         try:
             self.driver.set_window_size(width, height)
-            logger.info(f"Window size set to {width}x{height}")
+            logger.debug("Window size set to %sx%s", width, height)
             return True
         except Exception as e:
             logger.error(f"Error setting window size: {e}")
@@ -337,10 +649,13 @@ class BrowserAutomation:
     
     def is_element_present(self, by, value, timeout=5):
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            element = self._wait_until(
+                EC.presence_of_element_located((resolve_by(by), value)),
+                timeout
             )
             return element is not None
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             return False
         except Exception as e:
@@ -349,10 +664,13 @@ class BrowserAutomation:
     
     def is_element_visible(self, by, value, timeout=5):
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
+            element = self._wait_until(
+                EC.visibility_of_element_located((resolve_by(by), value)),
+                timeout
             )
             return element.is_displayed()
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             return False
         except Exception as e:
@@ -361,11 +679,13 @@ class BrowserAutomation:
     
     def wait_for_element_clickable(self, by, value, timeout=None):
         try:
-            wait_time = timeout or config.IMPLICIT_WAIT
-            element = WebDriverWait(self.driver, wait_time).until(
-                EC.element_to_be_clickable((by, value))
+            element = self._wait_until(
+                EC.element_to_be_clickable((resolve_by(by), value)),
+                timeout
             )
             return element
+        except DeadlineExceeded:
+            raise
         except TimeoutException:
             logger.warning(f"Element not clickable: {by}={value}")
             return None
@@ -378,9 +698,11 @@ class BrowserAutomation:
             element = self.find_element(by, value, timeout)
             if element:
                 self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                logger.info(f"Scrolled to element: {by}={value}")
+                logger.debug("Scrolled to element: %s=%s", by, value)
                 return True
             return False
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error scrolling to element: {e}")
             return False
@@ -388,7 +710,7 @@ class BrowserAutomation:
     def scroll_to_bottom(self):
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            logger.info("Scrolled to bottom of page")
+            logger.debug("Scrolled to bottom of page")
             return True
         except Exception as e:
             logger.error(f"Error scrolling to bottom: {e}")
@@ -397,12 +719,19 @@ class BrowserAutomation:
     def scroll_to_top(self):
         try:
             self.driver.execute_script("window.scrollTo(0, 0);")
-            logger.info("Scrolled to top of page")
+            logger.debug("Scrolled to top of page")
             return True
         except Exception as e:
             logger.error(f"Error scrolling to top: {e}")
             return False
     
+    def evaluate_indicators(self, indicator_sets):
+        try:
+            return self.driver.execute_script(INDICATOR_SCRIPT, indicator_sets) or {}
+        except Exception as e:
+            logger.error(f"Error evaluating page indicators: {e}")
+            return None
+    
     def get_page_source(self):
         try:
             return self.driver.page_source
@@ -414,7 +743,7 @@ class BrowserAutomation:
         try:
             alert = self.driver.switch_to.alert
             alert.accept()
-            logger.info("Alert accepted")
+            logger.debug("Alert accepted")
             return True
         except Exception as e:
             logger.error(f"Error accepting alert: {e}")
@@ -424,7 +753,7 @@ class BrowserAutomation:
         try:
             alert = self.driver.switch_to.alert
             alert.dismiss()
-            logger.info("Alert dismissed")
+            logger.debug("Alert dismissed")
             return True
         except Exception as e:
             logger.error(f"Error dismissing alert: {e}")
@@ -434,7 +763,7 @@ class BrowserAutomation:
         try:
             alert = self.driver.switch_to.alert
             text = alert.text
-            logger.info(f"Alert text: {text}")
+            logger.debug("Alert text: %s", text)
             return text
         except Exception as e:
             logger.error(f"Error getting alert text: {e}")
@@ -444,7 +773,7 @@ class BrowserAutomation:
         try:
             alert = self.driver.switch_to.alert
             alert.send_keys(text)
-            logger.info(f"Sent keys to alert: {text}")
+            logger.debug("Sent keys to alert: %s", text)
             return True
         except Exception as e:
             logger.error(f"Error sending keys to alert: {e}")
@@ -0,0 +1,218 @@
+import argparse
+import json
+import random
+import string
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import cv2
+import numpy as np
+import config
+from captcha_solver import CaptchaSolver
+from stats import summarize
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+FONTS = [
+    cv2.FONT_HERSHEY_SIMPLEX,
+    cv2.FONT_HERSHEY_DUPLEX,
+    cv2.FONT_HERSHEY_COMPLEX,
+    cv2.FONT_HERSHEY_TRIPLEX
+]
+
+PREPROCESSING_CONFIGS = {
+    'staged': {
+        'preprocessing': config.CAPTCHA_PREPROCESSING,
+        'parallel_variants': config.CAPTCHA_PARALLEL_VARIANTS,
+        'early_exit': True
+    },
+    'exhaustive': {
+        'preprocessing': config.CAPTCHA_PREPROCESSING,
+        'parallel_variants': [],
+        'early_exit': False
+    },
+    'no-denoise': {
+        'preprocessing': [name for name in config.CAPTCHA_PREPROCESSING if name != 'denoise'],
+        'parallel_variants': [],
+        'early_exit': True
+    },
+    'cheap': {
+        'preprocessing': ['gray', 'threshold'],
+        'parallel_variants': [],
+        'early_exit': True
+    }
+}
+
+def render_challenge(text, rng, width=180, height=60):
+    image = np.full((height, width, 3), 255, np.uint8)
+
+    for _ in range(rng.randint(3, 6)):
+        color = tuple(rng.randint(120, 220) for _ in range(3))
+        start = (rng.randint(0, width), rng.randint(0, height))
+        end = (rng.randint(0, width), rng.randint(0, height))
+        cv2.line(image, start, end, color, 1)
+
+    font = rng.choice(FONTS)
+    scale = rng.uniform(0.9, 1.2)
+    (text_width, text_height), _ = cv2.getTextSize(text, font, scale, 2)
+    x = max(2, (width - text_width) // 2 + rng.randint(-8, 8))
+    y = max(text_height + 2, (height + text_height) // 2 + rng.randint(-4, 4))
+    cv2.putText(image, text, (x, y), font, scale, (20, 20, 20), 2, cv2.LINE_AA)
+
+    noise = np.random.default_rng(rng.randint(0, 2 ** 32 - 1)).normal(0, 12, image.shape)
+    return np.clip(image + noise, 0, 255).astype(np.uint8)
+
+def generate_corpus(count, kinds=("text", "math"), seed=0):
+    rng = random.Random(seed)
+    corpus = []
+
+    for index in range(count):
+        kind = kinds[index % len(kinds)]
+        if kind == "math":
+            left, right = rng.randint(1, 20), rng.randint(1, 20)
+            operator = rng.choice(['+', '-', '*'])
+            challenge = f"{left} {operator} {right}"
+            answer = str(eval(challenge))
+        else:
+            alphabet = string.ascii_uppercase + string.digits
+            challenge = ''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 6)))
+            answer = challenge
+
+        corpus.append({
+            'kind': kind,
+            'challenge': challenge,
+            'answer': answer,
+            'image': render_challenge(challenge, rng)
+        })
+
+    return corpus
+
+def save_corpus(corpus, directory):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    answers = []
+    for index, sample in enumerate(corpus):
+        filename = f"{index:05d}_{sample['kind']}.png"
+        cv2.imwrite(str(directory / filename), sample['image'])
+        answers.append({'file': filename, 'kind': sample['kind'], 'answer': sample['answer']})
+
+    with open(directory / "answers.json", 'w') as answers_file:
+        json.dump(answers, answers_file, indent=2)
+
+def current_rss_mb():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    return None
+
+def peak_rss_mb():
+    if sys.platform == "win32":
+        if psutil is not None:
+            return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+        return None
+
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def run_benchmark(corpus, config_name, workers):
+    settings = PREPROCESSING_CONFIGS[config_name]
+    stage_times = defaultdict(list)
+    stage_lock = threading.Lock()
+
+    def record_stage(stage, seconds):
+        with stage_lock:
+            stage_times[stage].append(seconds)
+
+    solver = CaptchaSolver(
+        preprocessing=settings['preprocessing'],
+        parallel_variants=settings['parallel_variants'],
+        stage_listener=record_stage
+    )
+    if not settings['early_exit']:
+        solver.early_exit_confidence = float('inf')
+
+    def solve(sample):
+        started = time.perf_counter()
+        result = solver.solve_captcha(sample['image'], sample['kind'])
+        elapsed = time.perf_counter() - started
+        correct = result is not None and result.strip().upper() == sample['answer'].upper()
+        return elapsed, correct
+
+    rss_before = current_rss_mb()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(solve, corpus))
+    wall_time = time.perf_counter() - started
+    rss_after = current_rss_mb()
+
+    latencies = [elapsed for elapsed, _ in outcomes]
+    return {
+        'config': config_name,
+        'workers': workers,
+        'images': len(corpus),
+        'images_per_second': len(corpus) / wall_time if wall_time else None,
+        'accuracy': sum(1 for _, correct in outcomes if correct) / len(corpus) if corpus else None,
+        'latency': summarize(latencies),
+        'stages': {stage: summarize(times) for stage, times in sorted(stage_times.items())},
+        'rss_mb': rss_after,
+        'rss_delta_mb': rss_after - rss_before if rss_before is not None else None,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+def format_ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.1f}"
+
+def print_report(result):
+    print(f"\n{result['config']} / {result['workers']} worker(s)")
+    print("-" * 60)
+    print(f"Images/s: {result['images_per_second']:.2f}   Accuracy: {result['accuracy']:.1%}")
+
+    rss = "-" if result['rss_mb'] is None else f"{result['rss_mb']:.1f}"
+    peak = "-" if result['peak_rss_mb'] is None else f"{result['peak_rss_mb']:.1f}"
+    print(f"RSS: {rss} MB   Peak RSS: {peak} MB")
+
+    print(f"{'Stage':<24} {'Count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    rows = [('total', result['latency'])] + list(result['stages'].items())
+    for stage, summary in rows:
+        print(f"{stage:<24} {summary['count']:>7} {format_ms(summary['p50']):>9} "
+              f"{format_ms(summary['p95']):>9} {format_ms(summary['p99']):>9}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline CAPTCHA solver benchmark")
+    parser.add_argument("--count", type=int, default=50, help="Number of synthetic challenges")
+    parser.add_argument("--kinds", nargs="+", default=["text", "math"], choices=["text", "math"])
+    parser.add_argument("--configs", nargs="+", default=list(PREPROCESSING_CONFIGS),
+                       choices=list(PREPROCESSING_CONFIGS), help="Preprocessing configurations to compare")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4], help="Worker counts to run")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--save-corpus", metavar="DIR", help="Write the generated corpus to DIR")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON lines")
+
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, tuple(args.kinds), args.seed)
+    if args.save_corpus:
+        save_corpus(corpus, args.save_corpus)
+
+    if not args.json:
+        print("CAPTCHA Solver Benchmark")
+        print("=" * 60)
+        print(f"Corpus: {len(corpus)} images ({', '.join(args.kinds)}), seed {args.seed}")
+
+    for config_name in args.configs:
+        for workers in args.workers:
+            result = run_benchmark(corpus, config_name, workers)
+            if args.json:
+                print(json.dumps(result))
+            else:
+                print_report(result)
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,54 @@
 import cv2
-import pytesseract
 import numpy as np
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PIL import Image
 import config
+from ocr_backends import get_ocr_backend
+from page_matching import get_page_classifier, captcha_type_from_matches
 
 logger = logging.getLogger(__name__)
 
+_variant_executor = None
+_variant_executor_lock = threading.Lock()
+
+def _get_variant_executor():
+    global _variant_executor
+    with _variant_executor_lock:
+        if _variant_executor is None:
+            _variant_executor = ThreadPoolExecutor(
+                max_workers=config.CAPTCHA_VARIANT_WORKERS,
+                thread_name_prefix="captcha-variant"
+            )
+        return _variant_executor
+
 class CaptchaSolver:
-    def __init__(self):
-        self.tesseract_config = '--oem 3 --psm 8'
-        self.preprocessing_methods = [
-            self._preprocess_gray,
-            self._preprocess_threshold,
-            self._preprocess_adaptive,
-            self._preprocess_morphology,
-            self._preprocess_denoise
-        ]
+    def __init__(self, ocr_backend=None, preprocessing=None, parallel_variants=None, stage_listener=None):
+        self._ocr_backend = ocr_backend
+        self.preprocessors = {
+            'gray': self._preprocess_gray,
+            'threshold': self._preprocess_threshold,
+            'adaptive': self._preprocess_adaptive,
+            'morphology': self._preprocess_morphology,
+            'denoise': self._preprocess_denoise
+        }
+        self.preprocessing = list(preprocessing or config.CAPTCHA_PREPROCESSING)
+        self.parallel_variants = list(
+            config.CAPTCHA_PARALLEL_VARIANTS if parallel_variants is None else parallel_variants
+        )
+        self.early_exit_confidence = config.CAPTCHA_EARLY_EXIT_CONFIDENCE
+        self.stage_listener = stage_listener
     
-    def solve_captcha(self, image_path, captcha_type="text"):
+    def solve_captcha(self, image_source, captcha_type="text"):
         try:
             if captcha_type == "text":
-                return self._solve_text_captcha(image_path)
+                return self._solve_text_captcha(image_source)
             elif captcha_type == "math":
-                return self._solve_math_captcha(image_path)
+                return self._solve_math_captcha(image_source)
             elif captcha_type == "image":
-                return self._solve_image_captcha(image_path)
+                return self._solve_image_captcha(image_source)
             else:
                 logger.warning(f"Unsupported captcha type: {captcha_type}")
                 return None
@@ -33,32 +56,53 @@ class CaptchaSolver:
             logger.error(f"Error solving captcha: {e}")
             return None
     
-    def _solve_text_captcha(self, image_path):
+    def _load_image(self, image_source):
+        if isinstance(image_source, np.ndarray):
+            return image_source
+        if isinstance(image_source, (bytes, bytearray, memoryview)):
+            return cv2.imdecode(np.frombuffer(image_source, np.uint8), cv2.IMREAD_COLOR)
+        return cv2.imread(str(image_source))
+    
+    def _solve_text_captcha(self, image_source):
         try:
-            image = cv2.imread(str(image_path))
+            image = self._load_image(image_source)
             if image is None:
-                logger.error(f"Could not read image: {image_path}")
+                logger.error("Could not read captcha image")
                 return None
             
+            started = time.perf_counter()
+            gray = self._to_gray(image)
+            self._record_stage("grayscale", started)
+            sequential = [name for name in self.preprocessing if name not in self.parallel_variants]
+            parallel = [name for name in self.preprocessing if name in self.parallel_variants]
+            
             best_result = None
             best_confidence = 0
             
-            for preprocess_method in self.preprocessing_methods:
-                try:
-                    processed_image = preprocess_method(image)
-                    text = pytesseract.image_to_string(
-                        processed_image, 
-                        config=self.tesseract_config
-                    )
-                    
-                    confidence = self._calculate_confidence(text)
+            for name in sequential:
+                text, confidence = self._run_variant(name, gray)
+                if confidence > best_confidence:
+                    best_confidence = confidence
+                    best_result = text
+                if best_confidence >= self.early_exit_confidence:
+                    break
+            
+            if best_confidence < self.early_exit_confidence and parallel:
+                executor = _get_variant_executor()
+                stop = threading.Event()
+                futures = [executor.submit(self._run_variant, name, gray, stop) for name in parallel]
+                for future in as_completed(futures):
+                    text, confidence = future.result()
                     if confidence > best_confidence:
                         best_confidence = confidence
-                        best_result = text.strip()
-                        
-                except Exception as e:
-                    logger.debug(f"Preprocessing method failed: {e}")
-                    continue
+                        best_result = text
+                    if best_confidence >= self.early_exit_confidence:
+                        stop.set()
+                        for pending in futures:
+                            pending.cancel()
+                        break
+            
+            self._record_stage("solve", started)
             
             if best_result:
                 logger.info(f"Solved text captcha: {best_result}")
@@ -71,9 +115,9 @@ class CaptchaSolver:
             logger.error(f"Error solving text captcha: {e}")
             return None
     
-    def _solve_math_captcha(self, image_path):
+    def _solve_math_captcha(self, image_source):
         try:
-            text_result = self._solve_text_captcha(image_path)
+            text_result = self._solve_text_captcha(image_source)
             if not text_result:
                 return None
             
@@ -94,9 +138,9 @@ class CaptchaSolver:
             logger.error(f"Error solving math captcha: {e}")
             return None
     
-    def _solve_image_captcha(self, image_path):
+    def _solve_image_captcha(self, image_source):
         try:
-            image = cv2.imread(str(image_path))
+            image = self._load_image(image_source)
             if image is None:
                 return None
             
@@ -112,27 +156,54 @@ class CaptchaSolver:
             logger.error(f"Error solving image captcha: {e}")
             return None
     
-    def _preprocess_gray(self, image):
+    @property
+    def ocr_backend(self):
+        if self._ocr_backend is None:
+            self._ocr_backend = get_ocr_backend()
+        return self._ocr_backend
+    
+    def _record_stage(self, stage, started):
+        if self.stage_listener is not None:
+            self.stage_listener(stage, time.perf_counter() - started)
+    
+    def _run_variant(self, name, gray, stop=None):
+        try:
+            started = time.perf_counter()
+            processed_image = self.preprocessors[name](gray)
+            self._record_stage(f"preprocess.{name}", started)
+            if stop is not None and stop.is_set():
+                return None, 0
+            
+            started = time.perf_counter()
+            text = self.ocr_backend.image_to_string(processed_image)
+            self._record_stage(f"ocr.{name}", started)
+            return text.strip(), self._calculate_confidence(text)
+        except Exception as e:
+            logger.debug(f"Preprocessing method {name} failed: {e}")
+            return None, 0
+    
+    def _to_gray(self, image):
+        if image.ndim == 2:
+            return image
         return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     
-    def _preprocess_threshold(self, image):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _preprocess_gray(self, gray):
+        return gray
+    
+    def _preprocess_threshold(self, gray):
         _, threshold = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         return threshold
     
-    def _preprocess_adaptive(self, image):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _preprocess_adaptive(self, gray):
         adaptive = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
         return adaptive
     
-    def _preprocess_morphology(self, image):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _preprocess_morphology(self, gray):
         kernel = np.ones((1, 1), np.uint8)
         morphology = cv2.morphologyEx(gray, cv2.MORPH_CLOSE, kernel)
         return morphology
     
-    def _preprocess_denoise(self, image):
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _preprocess_denoise(self, gray):
         denoised = cv2.fastNlMeansDenoising(gray)
         return denoised
     
@@ -198,40 +269,13 @@ class CaptchaSolver:
             return None
     
     def detect_captcha_presence(self, page_source):
-        captcha_indicators = [
-            'captcha', 'recaptcha', 'verify', 'robot', 'human',
-            'security check', 'verification', 'challenge'
-        ]
-        
-        page_lower = page_source.lower()
-        for indicator in captcha_indicators:
-            if indicator in page_lower:
-                return True
-        return False
+        return 'captcha' in get_page_classifier().match(page_source)
     
     def detect_captcha_type(self, page_source):
-        page_lower = page_source.lower()
-        
-        if 'recaptcha' in page_lower:
-            return 'recaptcha'
-        elif 'math' in page_lower or 'calculate' in page_lower:
-            return 'math'
-        elif 'image' in page_lower and 'select' in page_lower:
-            return 'image'
-        else:
-            return 'text'
+        return captcha_type_from_matches(get_page_classifier().match(page_source))
     
     def is_captcha_solved(self, page_source):
-        success_indicators = [
-            'success', 'verified', 'correct', 'passed',
-            'completed', 'validated', 'approved'
-        ]
-        
-        page_lower = page_source.lower()
-        for indicator in success_indicators:
-            if indicator in page_lower:
-                return True
-        return False
+        return 'captcha_solved' in get_page_classifier().match(page_source)
     
     def get_captcha_field_info(self, page_source):
         import re
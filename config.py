@@ -10,7 +10,35 @@ TEMPLATES_DIR = BASE_DIR / "templates"
 BROWSER_TYPE = "chrome"
 HEADLESS = False
 IMPLICIT_WAIT = 10
+DRIVER_IMPLICIT_WAIT = 0
 PAGE_LOAD_TIMEOUT = 30
+JOB_TIMEOUT = 120
+CANCEL_POLL_INTERVAL = 0.25
+TRACE_JOBS = True
+INSTRUMENT_WEBDRIVER = True
+COMMAND_STATS_MAX_JOBS = 200
+BENCHMARK_TOP_COMMANDS = 8
+LATENCY_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+BATCH_WORKERS = 2
+
+DRIVER_HEALTH_CHECKS = True
+DRIVER_MAX_RSS_MB = 1500
+DRIVER_MAX_PAGES = 500
+DRIVER_MAX_JOBS = 100
+DRIVER_MAX_AGE = 4 * 60 * 60
+DRIVER_MAX_ERROR_RATE = 0.5
+DRIVER_ERROR_WINDOW = 50
+DRIVER_PING_TIMEOUT = 10
+DRIVER_COMMAND_TIMEOUT = 180
+DRIVER_WATCHDOG_INTERVAL = 5
+
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 8765
+
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = None
+METRICS_TEXTFILE = None
+METRICS_TEXTFILE_INTERVAL = 15
 
 ENCRYPTION_KEY_FILE = DATA_DIR / "encryption_key.key"
 DATABASE_FILE = DATA_DIR / "credentials.db"
@@ -18,6 +46,59 @@ DATABASE_FILE = DATA_DIR / "credentials.db"
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FILE = LOGS_DIR / "automation.log"
+LOG_JSON = True
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+LOG_ROTATE_WHEN = None
+LOG_COMPRESS = True
+
+PROFILES_DIR = LOGS_DIR / "profiles"
+PROFILE_SAMPLE_RATE = 0.0
+
+INDICATOR_MODE = "browser"
+LOGIN_SUCCESS_INDICATORS = ['logout', 'profile', 'dashboard', 'welcome']
+FORM_SUCCESS_INDICATORS = ['success', 'thank you', 'submitted', 'received']
+CAPTCHA_INDICATORS = [
+    'captcha', 'recaptcha', 'verify', 'robot', 'human',
+    'security check', 'verification', 'challenge'
+]
+CAPTCHA_TYPE_INDICATORS = {
+    'recaptcha': ['recaptcha'],
+    'math': ['math', 'calculate'],
+    'image': ['image'],
+    'select': ['select']
+}
+LOGIN_FORM_INDICATORS = ['password', 'sign in', 'log in', 'login', 'forgot password']
+FAILURE_INDICATORS = [
+    'invalid password', 'incorrect password', 'invalid username', 'login failed',
+    'authentication failed', 'try again', 'access denied'
+]
+CAPTCHA_SOLVED_INDICATORS = [
+    'success', 'verified', 'correct', 'passed',
+    'completed', 'validated', 'approved'
+]
+
+OCR_BACKEND = "auto"
+OCR_LANGUAGE = "eng"
+OCR_PAGE_SEG_MODE = 8
+OCR_MAX_ENGINES = 4
+TESSERACT_CONFIG = f'--oem 3 --psm {OCR_PAGE_SEG_MODE}'
+
+CAPTCHA_PREPROCESSING = ['gray', 'threshold', 'adaptive', 'morphology', 'denoise']
+CAPTCHA_PARALLEL_VARIANTS = ['adaptive', 'morphology', 'denoise']
+CAPTCHA_EARLY_EXIT_CONFIDENCE = 28
+CAPTCHA_VARIANT_WORKERS = 3
+
+OCR_WORKERS = 2
+OCR_START_METHOD = "spawn"
+
+GUI_LOG_FLUSH_MS = 100
+GUI_LOG_BATCH_SIZE = 500
+GUI_LOG_MAX_LINES = 2000
+GUI_LOG_PAGE_SIZE = 200
+GUI_LOG_PREFETCH_RATIO = 0.9
+GUI_DASHBOARD_REFRESH_MS = 500
+GUI_DB_WORKERS = 2
 
 CAPTCHA_TIMEOUT = 30
 CAPTCHA_RETRY_ATTEMPTS = 3
@@ -25,7 +106,8 @@ CAPTCHA_RETRY_ATTEMPTS = 3
 SECURITY_DELAY_MIN = 1
 SECURITY_DELAY_MAX = 3
 
-for directory in [DATA_DIR, LOGS_DIR, SCREENSHOTS_DIR, TEMPLATES_DIR]:
-    directory.mkdir(exist_ok=True)
+def ensure_directories():
+    for directory in [DATA_DIR, LOGS_DIR, SCREENSHOTS_DIR, TEMPLATES_DIR]:
+        directory.mkdir(exist_ok=True)
 
 
@@ -0,0 +1,155 @@
+import http.client
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import as_completed
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import config
+from batch_runner import BatchRunner, future_result, prepare_job
+from metrics import REGISTRY
+from profiling import get_job_profiler
+
+logger = logging.getLogger(__name__)
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"
+    
+    def do_GET(self):
+        if self.path == "/status":
+            self._send_json(200, self.server.automation_daemon.status())
+        elif self.path == "/profile":
+            self._send_json(200, get_job_profiler().settings())
+        elif self.path == "/metrics":
+            self._send(200, 'text/plain; version=0.0.4; charset=utf-8', REGISTRY.render().encode())
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+    
+    def do_POST(self):
+        if self.path == "/jobs":
+            self._handle_jobs()
+        elif self.path == "/profile":
+            self._handle_profile()
+        elif self.path == "/shutdown":
+            self._send_json(200, {'status': 'stopping'})
+            threading.Thread(target=self.server.automation_daemon.stop, daemon=True).start()
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+    
+    def _handle_jobs(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'[]')
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {'error': f"Invalid job payload: {e}"})
+            return
+        
+        jobs = payload if isinstance(payload, list) else [payload]
+        try:
+            futures = self.server.automation_daemon.submit(jobs)
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        
+        try:
+            for future in as_completed(futures):
+                self.wfile.write((json.dumps(future_result(futures[future], future)) + "\n").encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            logger.warning("Client disconnected before all results were streamed")
+    
+    def _handle_profile(self):
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            settings = get_job_profiler().configure(payload.get('sample_rate'), payload.get('job_ids'))
+        except (ValueError, TypeError, AttributeError, json.JSONDecodeError) as e:
+            self._send_json(400, {'error': f"Invalid profile settings: {e}"})
+            return
+        self._send_json(200, settings)
+    
+    def _send_json(self, status, body):
+        self._send(status, 'application/json', json.dumps(body).encode())
+    
+    def _send(self, status, content_type, data):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+class AutomationDaemon:
+    def __init__(self, host=None, port=None, workers=None, headless=True, runner=None):
+        self.host = host or config.DAEMON_HOST
+        self.port = config.DAEMON_PORT if port is None else port
+        self.runner = runner or BatchRunner(workers=workers, headless=headless)
+        self.server = None
+    
+    def submit(self, jobs):
+        errors = []
+        for index, job in enumerate(jobs):
+            error = prepare_job(job, uuid.uuid4().hex)
+            if error:
+                errors.append(f"job {index}: {error}")
+        if errors:
+            raise ValueError(f"Invalid jobs: {'; '.join(errors)}")
+        
+        return {self.runner.submit(job): job for job in jobs}
+    
+    def status(self):
+        return self.runner.snapshot()
+    
+    def serve_forever(self):
+        self.runner.start()
+        self.server = ThreadingHTTPServer((self.host, self.port), DaemonRequestHandler)
+        self.server.daemon_threads = True
+        self.server.automation_daemon = self
+        self.port = self.server.server_address[1]
+        logger.info(f"Automation daemon listening on http://{self.host}:{self.port}")
+        
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.runner.shutdown()
+            logger.info("Automation daemon stopped")
+    
+    def stop(self):
+        self.runner.stop(cancel_running=True)
+        if self.server:
+            self.server.shutdown()
+
+def _connect(host=None, port=None, timeout=None):
+    return http.client.HTTPConnection(host or config.DAEMON_HOST, port or config.DAEMON_PORT, timeout=timeout)
+
+def submit_jobs(jobs, host=None, port=None):
+    connection = _connect(host, port)
+    try:
+        connection.request('POST', '/jobs', body=json.dumps(jobs), headers={'Content-Type': 'application/json'})
+        response = connection.getresponse()
+        if response.status != 200:
+            raise RuntimeError(f"Daemon rejected jobs: {response.read().decode()}")
+
+        for line in response:
+            if line.strip():
+                yield json.loads(line)
+    finally:
+        connection.close()
+
+def request_json(method, path, body=None, host=None, port=None):
+    connection = _connect(host, port, timeout=10)
+    try:
+        if body is None:
+            connection.request(method, path)
+        else:
+            connection.request(method, path, body=json.dumps(body), headers={'Content-Type': 'application/json'})
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
@@ -1,21 +1,34 @@
 import sqlite3
 import logging
+import threading
 from pathlib import Path
-from cryptography.fernet import Fernet
 import json
 from datetime import datetime
 import config
+import metrics
 
 logger = logging.getLogger(__name__)
 
+_key_lock = threading.Lock()
+
 class CredentialManager:
     def __init__(self):
+        config.ensure_directories()
         self.db_path = config.DATABASE_FILE
         self.key_path = config.ENCRYPTION_KEY_FILE
-        self.fernet = self._get_or_create_key()
+        self._fernet = None
         self._init_database()
     
+    @property
+    def fernet(self):
+        with _key_lock:
+            if self._fernet is None:
+                self._fernet = self._get_or_create_key()
+            return self._fernet
+    
     def _get_or_create_key(self):
+        from cryptography.fernet import Fernet
+        
         if self.key_path.exists():
             with open(self.key_path, 'rb') as key_file:
                 return Fernet(key_file.read())
@@ -60,12 +73,47 @@ class CredentialManager:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS locator_hints (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    website TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    by_kind TEXT NOT NULL,
+                    selector TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(website, field)
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS job_spans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    trace_id TEXT NOT NULL,
+                    job_id TEXT NOT NULL,
+                    website TEXT,
+                    thread TEXT,
+                    step TEXT NOT NULL,
+                    started_at REAL NOT NULL,
+                    duration REAL NOT NULL
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_automation_logs_timestamp
+                ON automation_logs (timestamp, id)
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_spans_job
+                ON job_spans (job_id)
+            ''')
             conn.commit()
     
     def add_credential(self, website, username, password, notes=""):
         try:
             encrypted_password = self.fernet.encrypt(password.encode())
-            with sqlite3.connect(self.db_path) as conn:
+            with metrics.DB_WRITE_SECONDS.time(operation='add_credential'), sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO credentials (website, username, encrypted_password, notes)
@@ -100,7 +148,7 @@ class CredentialManager:
     
     def _update_last_used(self, website, username):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with metrics.DB_WRITE_SECONDS.time(operation='update_last_used'), sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     UPDATE credentials SET last_used = CURRENT_TIMESTAMP
@@ -150,7 +198,7 @@ class CredentialManager:
     
     def log_automation(self, website, action, status, details=""):
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with metrics.DB_WRITE_SECONDS.time(operation='log_automation'), sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO automation_logs (website, action, status, details)
@@ -175,6 +223,55 @@ class CredentialManager:
             logger.error(f"Error getting automation logs: {e}")
             return []
     
+    def get_automation_logs_page(self, limit=100, before=None, website=None, status=None):
+        try:
+            conditions = []
+            params = []
+            if website:
+                conditions.append('website = ?')
+                params.append(website)
+            if status:
+                conditions.append('status = ?')
+                params.append(status)
+            if before:
+                conditions.append('(timestamp < ? OR (timestamp = ? AND id < ?))')
+                params.extend([before[0], before[0], before[1]])
+            
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(f'''
+                    SELECT id, website, action, status, timestamp, details
+                    FROM automation_logs
+                    {where}
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT ?
+                ''', params + [limit])
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error getting automation logs page: {e}")
+            return []
+    
+    def get_log_filter_values(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT DISTINCT website FROM automation_logs ORDER BY website')
+                websites = [row[0] for row in cursor.fetchall()]
+                cursor.execute('SELECT DISTINCT status FROM automation_logs ORDER BY status')
+                statuses = [row[0] for row in cursor.fetchall()]
+                return websites, statuses
+        except Exception as e:
+            logger.error(f"Error getting log filter values: {e}")
+            return [], []
+    
+    def clear_automation_logs(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('DELETE FROM automation_logs')
+            conn.commit()
+            logger.info("Cleared automation logs")
+    
     def save_form_template(self, website, template_name, form_data):
         try:
             with sqlite3.connect(self.db_path) as conn:
@@ -218,5 +315,65 @@ class CredentialManager:
         except Exception as e:
             logger.error(f"Error listing form templates: {e}")
             return []
-
-
+    
+    def save_locator_hint(self, website, field, by_kind, selector):
+        try:
+            with metrics.DB_WRITE_SECONDS.time(operation='save_locator_hint'), sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO locator_hints (website, field, by_kind, selector, updated_at)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (website, field, by_kind, selector))
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error saving locator hint: {e}")
+            return False
+    
+    def save_job_trace(self, trace):
+        try:
+            with metrics.DB_WRITE_SECONDS.time(operation='save_job_trace'), sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO job_spans (trace_id, job_id, website, thread, step, started_at, duration)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', [(trace.trace_id, trace.job_id, trace.website, trace.thread, step, started_at, duration)
+                      for step, started_at, duration in trace.spans])
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error saving job trace: {e}")
+            return False
+    
+    def get_job_spans(self, job_id=None, limit=1000):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if job_id is not None:
+                    cursor.execute('''
+                        SELECT trace_id, job_id, website, thread, step, started_at, duration FROM job_spans
+                        WHERE job_id = ? ORDER BY started_at
+                    ''', (str(job_id),))
+                else:
+                    cursor.execute('''
+                        SELECT trace_id, job_id, website, thread, step, started_at, duration FROM (
+                            SELECT * FROM job_spans ORDER BY id DESC LIMIT ?
+                        ) ORDER BY started_at
+                    ''', (limit,))
+                return cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Error getting job spans: {e}")
+            return []
+    
+    def get_locator_hints(self, website):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT field, by_kind, selector FROM locator_hints
+                    WHERE website = ?
+                ''', (website,))
+                return {field: (by_kind, selector) for field, by_kind, selector in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Error getting locator hints: {e}")
+            return {}
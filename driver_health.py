@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidSelectorException,
+    JavascriptException, MoveTargetOutOfBoundsException, NoAlertPresentException, NoSuchElementException,
+    NoSuchFrameException, StaleElementReferenceException, TimeoutException
+)
+import config
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+_psutil_warning_logged = False
+
+PAGE_COMMANDS = {'get'}
+
+# Errors that describe the page rather than the driver; they are routine
+# while polling for elements and must not count against driver health.
+PAGE_ERRORS = (
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidSelectorException,
+    JavascriptException, MoveTargetOutOfBoundsException, NoAlertPresentException, NoSuchElementException,
+    NoSuchFrameException, StaleElementReferenceException, TimeoutException
+)
+
+def process_tree(pid):
+    if psutil is None or pid is None:
+        return []
+    try:
+        process = psutil.Process(pid)
+        return [process] + process.children(recursive=True)
+    except psutil.Error:
+        return []
+
+def process_tree_rss_mb(pid):
+    processes = process_tree(pid)
+    if not processes:
+        return None
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+def kill_process_tree(pid):
+    processes = process_tree(pid)
+    for process in reversed(processes):
+        try:
+            process.kill()
+        except psutil.Error:
+            pass
+    return len(processes)
+
+def _warn_without_psutil():
+    global _psutil_warning_logged
+    if psutil is None and not _psutil_warning_logged:
+        _psutil_warning_logged = True
+        logger.warning("psutil is not installed: browser memory limits are not enforced and a hung "
+                       "driver's browser processes cannot be killed")
+
+class DriverHealth:
+    def __init__(self, window=None):
+        _warn_without_psutil()
+        self.started_at = time.monotonic()
+        self.pages = 0
+        self.jobs = 0
+        self.commands = 0
+        self.recent_errors = deque(maxlen=window or config.DRIVER_ERROR_WINDOW)
+        self.in_flight = {}
+        self.killed_reason = None
+        self._lock = threading.Lock()
+    
+    def command_started(self, command):
+        with self._lock:
+            self.in_flight[threading.get_ident()] = (command, time.monotonic())
+    
+    def command_finished(self, command, error=None):
+        with self._lock:
+            self.in_flight.pop(threading.get_ident(), None)
+            self.commands += 1
+            self.recent_errors.append(error is not None and not isinstance(error, PAGE_ERRORS))
+            if command in PAGE_COMMANDS and error is None:
+                self.pages += 1
+    
+    def record_job(self):
+        with self._lock:
+            self.jobs += 1
+    
+    def oldest_command(self):
+        with self._lock:
+            if not self.in_flight:
+                return None, 0.0
+            command, started = min(self.in_flight.values(), key=lambda item: item[1])
+        return command, time.monotonic() - started
+    
+    def error_rate(self):
+        with self._lock:
+            if len(self.recent_errors) < self.recent_errors.maxlen:
+                return 0.0
+            return sum(self.recent_errors) / len(self.recent_errors)
+    
+    def snapshot(self, pid=None):
+        with self._lock:
+            snapshot = {
+                'age': time.monotonic() - self.started_at,
+                'pages': self.pages,
+                'jobs': self.jobs,
+                'commands': self.commands,
+                'recent_errors': sum(self.recent_errors)
+            }
+        snapshot['error_rate'] = self.error_rate()
+        snapshot['rss_mb'] = process_tree_rss_mb(pid)
+        return snapshot
+    
+    def recycle_reason(self, pid=None):
+        snapshot = self.snapshot(pid)
+        if snapshot['rss_mb'] is not None and snapshot['rss_mb'] > config.DRIVER_MAX_RSS_MB:
+            return 'memory', snapshot
+        if snapshot['pages'] >= config.DRIVER_MAX_PAGES:
+            return 'pages', snapshot
+        if snapshot['jobs'] >= config.DRIVER_MAX_JOBS:
+            return 'jobs', snapshot
+        if snapshot['age'] >= config.DRIVER_MAX_AGE:
+            return 'age', snapshot
+        if snapshot['error_rate'] > config.DRIVER_MAX_ERROR_RATE:
+            return 'errors', snapshot
+        return None, snapshot
+
+class HungCommandWatchdog:
+    def __init__(self, timeout=None, interval=None):
+        self.timeout = timeout or config.DRIVER_COMMAND_TIMEOUT
+        self.interval = interval or config.DRIVER_WATCHDOG_INTERVAL
+        self.browsers = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._thread = None
+    
+    def watch(self, browser):
+        with self._lock:
+            self.browsers.add(browser)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="driver-watchdog", daemon=True)
+                self._thread.start()
+    
+    def unwatch(self, browser):
+        with self._lock:
+            self.browsers.discard(browser)
+    
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                browsers = list(self.browsers)
+            for browser in browsers:
+                health = browser.health
+                if health is None or health.killed_reason is not None:
+                    continue
+                command, running_for = health.oldest_command()
+                if command is not None and running_for > self.timeout:
+                    logger.warning(f"WebDriver command {command} hung for {running_for:.0f}s, killing the driver")
+                    browser.kill_driver('hung_command')
+
+_watchdog = None
+_watchdog_lock = threading.Lock()
+
+def get_watchdog():
+    global _watchdog
+    with _watchdog_lock:
+        if _watchdog is None:
+            _watchdog = HungCommandWatchdog()
+        return _watchdog
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+import config
+from stats import LatencyHistogram
+
+class CommandStats:
+    def __init__(self, buckets=None, max_jobs=None):
+        self.buckets = list(buckets or config.LATENCY_BUCKETS)
+        self.max_jobs = max_jobs or config.COMMAND_STATS_MAX_JOBS
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        with self._lock:
+            self.commands = defaultdict(self._new_histogram)
+            self.errors = defaultdict(int)
+            self.websites = defaultdict(lambda: defaultdict(self._new_histogram))
+            self.jobs = OrderedDict()
+    
+    def _new_histogram(self):
+        return LatencyHistogram(self.buckets)
+    
+    def record(self, command, seconds, website=None, job_id=None, error=False):
+        with self._lock:
+            self.commands[command].observe(seconds)
+            if error:
+                self.errors[command] += 1
+            if website is not None:
+                self.websites[website][command].observe(seconds)
+            if job_id is not None:
+                job = self.jobs.get(job_id)
+                if job is None:
+                    job = self.jobs[job_id] = defaultdict(self._new_histogram)
+                    while len(self.jobs) > self.max_jobs:
+                        self.jobs.popitem(last=False)
+                job[command].observe(seconds)
+    
+    def _summaries(self, histograms):
+        return {command: histogram.summary() for command, histogram in sorted(histograms.items())}
+    
+    def job_totals(self, job_id):
+        with self._lock:
+            job = self.jobs.get(job_id, {})
+            return {
+                'count': sum(histogram.count for histogram in job.values()),
+                'seconds': sum(histogram.total for histogram in job.values())
+            }
+    
+    def snapshot(self, website=None, job_id=None):
+        with self._lock:
+            snapshot = {'commands': self._summaries(self.commands), 'errors': dict(self.errors)}
+            if website is not None:
+                snapshot['website'] = self._summaries(self.websites.get(website, {}))
+            if job_id is not None:
+                snapshot['job'] = self._summaries(self.jobs.get(job_id, {}))
+            return snapshot
+    
+    def by_website(self):
+        with self._lock:
+            return {website: self._summaries(commands) for website, commands in self.websites.items()}
+
+def instrument_driver(driver, stats, context, health=None):
+    original_execute = driver.execute
+    
+    def execute(driver_command, params=None):
+        if health is not None:
+            health.command_started(driver_command)
+        started = time.perf_counter()
+        error = None
+        try:
+            return original_execute(driver_command, params)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if stats is not None:
+                website, job_id = context()
+                stats.record(driver_command, time.perf_counter() - started, website, job_id, error is not None)
+            if health is not None:
+                health.command_finished(driver_command, error)
+    
+    driver.execute = execute
+    return driver
+
+_command_stats = None
+_command_stats_lock = threading.Lock()
+
+def get_command_stats():
+    global _command_stats
+    with _command_stats_lock:
+        if _command_stats is None:
+            _command_stats = CommandStats()
+        return _command_stats
@@ -2,10 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import threading
 import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import config
 from database import CredentialManager
-from automation_engine import AutomationEngine
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +21,27 @@ class AutomationGUI:
         self.credential_manager = CredentialManager()
         self.automation_engine = None
         self.current_automation = None
+        self.log_queue = queue.Queue()
+        self.ui_callbacks = queue.Queue()
+        self.db_executor = ThreadPoolExecutor(max_workers=config.GUI_DB_WORKERS, thread_name_prefix="gui-db")
+        self.task_generations = {}
+        self.logs_generation = 0
+        self.logs_cursor = None
+        self.logs_loading = False
+        self.logs_exhausted = False
+        self.batch_runner = None
+        self.batch_jobs = []
+        self.batch_futures = []
+        self.dashboard_events = queue.Queue()
         
         self.setup_styles()
         self.create_widgets()
         self.setup_logging()
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        self.root.after(config.GUI_LOG_FLUSH_MS, self._drain_log_queue)
+        self.root.after(config.GUI_LOG_FLUSH_MS, self._drain_ui_callbacks)
+        self.root.after(config.GUI_DASHBOARD_REFRESH_MS, self._drain_dashboard_events)
     
     def setup_styles(self):
         style = ttk.Style()
@@ -60,6 +77,7 @@ class AutomationGUI:
         
         self.create_credentials_tab()
         self.create_automation_tab()
+        self.create_dashboard_tab()
         self.create_logs_tab()
         self.create_settings_tab()
     
@@ -103,9 +121,9 @@ class AutomationGUI:
         ttk.Label(right_frame, text="Stored Credentials", style='Header.TLabel').pack(anchor='w', pady=(0, 10))
         
         self.website_var = tk.StringVar()
-        website_combo = ttk.Combobox(right_frame, textvariable=self.website_var, state='readonly')
-        website_combo.pack(fill='x', pady=(0, 10))
-        website_combo.bind('<<ComboboxSelected>>', self.on_website_selected)
+        self.website_combo = ttk.Combobox(right_frame, textvariable=self.website_var, state='readonly')
+        self.website_combo.pack(fill='x', pady=(0, 10))
+        self.website_combo.bind('<<ComboboxSelected>>', self.on_website_selected)
         
         self.credentials_tree = ttk.Treeview(right_frame, columns=('Username', 'Created', 'Last Used', 'Notes'), show='headings')
         self.credentials_tree.heading('Username', text='Username')
@@ -192,6 +210,67 @@ class AutomationGUI:
         
         self.refresh_websites()
     
+    def create_dashboard_tab(self):
+        dashboard_frame = ttk.Frame(self.notebook)
+        self.notebook.add(dashboard_frame, text="Dashboard")
+        
+        ttk.Label(dashboard_frame, text="Batch Dashboard", style='Header.TLabel').pack(anchor='w', padx=20, pady=10)
+        
+        controls_frame = ttk.Frame(dashboard_frame)
+        controls_frame.pack(fill='x', padx=20, pady=(0, 10))
+        
+        ttk.Button(controls_frame, text="Load Batch File", command=self.load_batch_file).pack(side='left', padx=(0, 10))
+        ttk.Button(controls_frame, text="Queue Stored Logins", command=self.queue_stored_logins).pack(side='left', padx=(0, 20))
+        
+        ttk.Label(controls_frame, text="Workers:").pack(side='left')
+        self.batch_workers_var = tk.StringVar(value=str(config.BATCH_WORKERS))
+        ttk.Spinbox(controls_frame, from_=1, to=16, textvariable=self.batch_workers_var, width=5).pack(side='left', padx=(10, 20))
+        
+        self.batch_headless_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(controls_frame, text="Headless", variable=self.batch_headless_var).pack(side='left', padx=(0, 20))
+        
+        self.batch_start_button = ttk.Button(controls_frame, text="Start Batch", command=self.start_batch)
+        self.batch_start_button.pack(side='left', padx=(0, 10))
+        
+        self.batch_stop_button = ttk.Button(controls_frame, text="Stop Batch", command=self.stop_batch, state='disabled')
+        self.batch_stop_button.pack(side='left')
+        
+        stats_frame = ttk.LabelFrame(dashboard_frame, text="Throughput", padding=10)
+        stats_frame.pack(fill='x', padx=20, pady=(0, 10))
+        
+        self.dashboard_labels = {}
+        for column, (key, title) in enumerate([
+            ('jobs', "Jobs Loaded"),
+            ('queue_depth', "Queue Depth"),
+            ('completed', "Completed"),
+            ('failed', "Failed"),
+            ('cancelled', "Cancelled"),
+            ('jobs_per_minute', "Jobs/min"),
+            ('p50', "p50 Duration"),
+            ('p95', "p95 Duration")
+        ]):
+            ttk.Label(stats_frame, text=title).grid(row=0, column=column, padx=10, sticky='w')
+            label = ttk.Label(stats_frame, text="-", style='Header.TLabel')
+            label.grid(row=1, column=column, padx=10, sticky='w')
+            self.dashboard_labels[key] = label
+        
+        tree_frame = ttk.Frame(dashboard_frame)
+        tree_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        
+        self.workers_tree = ttk.Treeview(tree_frame, columns=('Worker', 'Status', 'Website', 'Step', 'Running For'), show='headings')
+        self.workers_tree.heading('Worker', text='Worker')
+        self.workers_tree.heading('Status', text='Status')
+        self.workers_tree.heading('Website', text='Website')
+        self.workers_tree.heading('Step', text='Step')
+        self.workers_tree.heading('Running For', text='Running For')
+        
+        self.workers_tree.column('Worker', width=100)
+        self.workers_tree.column('Status', width=80)
+        self.workers_tree.column('Website', width=200)
+        self.workers_tree.column('Step', width=120)
+        self.workers_tree.column('Running For', width=100)
+        self.workers_tree.pack(fill='both', expand=True)
+    
     def create_logs_tab(self):
         logs_frame = ttk.Frame(self.notebook)
         self.notebook.add(logs_frame, text="Logs")
@@ -201,8 +280,22 @@ class AutomationGUI:
         controls_frame = ttk.Frame(logs_frame)
         controls_frame.pack(fill='x', padx=20, pady=(0, 10))
         
-        ttk.Label(controls_frame, text="Limit:").pack(side='left')
-        self.log_limit_var = tk.StringVar(value="100")
+        ttk.Label(controls_frame, text="Website:").pack(side='left')
+        self.log_website_var = tk.StringVar(value="All")
+        self.log_website_combo = ttk.Combobox(controls_frame, textvariable=self.log_website_var,
+                                              values=["All"], state='readonly', width=20)
+        self.log_website_combo.pack(side='left', padx=(10, 20))
+        self.log_website_combo.bind('<<ComboboxSelected>>', lambda event: self.refresh_logs())
+        
+        ttk.Label(controls_frame, text="Status:").pack(side='left')
+        self.log_status_var = tk.StringVar(value="All")
+        self.log_status_combo = ttk.Combobox(controls_frame, textvariable=self.log_status_var,
+                                             values=["All"], state='readonly', width=12)
+        self.log_status_combo.pack(side='left', padx=(10, 20))
+        self.log_status_combo.bind('<<ComboboxSelected>>', lambda event: self.refresh_logs())
+        
+        ttk.Label(controls_frame, text="Page Size:").pack(side='left')
+        self.log_limit_var = tk.StringVar(value=str(config.GUI_LOG_PAGE_SIZE))
         log_limit_combo = ttk.Combobox(controls_frame, textvariable=self.log_limit_var, 
                                       values=["50", "100", "200", "500"], width=10)
         log_limit_combo.pack(side='left', padx=(10, 20))
@@ -210,7 +303,10 @@ class AutomationGUI:
         ttk.Button(controls_frame, text="Refresh Logs", command=self.refresh_logs).pack(side='left', padx=(0, 10))
         ttk.Button(controls_frame, text="Clear Logs", command=self.clear_logs).pack(side='left')
         
-        self.logs_tree = ttk.Treeview(logs_frame, columns=('Website', 'Action', 'Status', 'Timestamp', 'Details'), show='headings')
+        tree_frame = ttk.Frame(logs_frame)
+        tree_frame.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        
+        self.logs_tree = ttk.Treeview(tree_frame, columns=('Website', 'Action', 'Status', 'Timestamp', 'Details'), show='headings')
         self.logs_tree.heading('Website', text='Website')
         self.logs_tree.heading('Action', text='Action')
         self.logs_tree.heading('Status', text='Status')
@@ -223,7 +319,10 @@ class AutomationGUI:
         self.logs_tree.column('Timestamp', width=150)
         self.logs_tree.column('Details', width=200)
         
-        self.logs_tree.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+        self.logs_scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.logs_tree.yview)
+        self.logs_scrollbar.pack(side='right', fill='y')
+        self.logs_tree.configure(yscrollcommand=self._on_logs_scroll)
+        self.logs_tree.pack(side='left', fill='both', expand=True)
         
         self.refresh_logs()
     
@@ -278,14 +377,8 @@ class AutomationGUI:
         self.status_bar.pack(side='bottom', fill='x')
     
     def setup_logging(self):
-        logging.basicConfig(
-            level=getattr(logging, config.LOG_LEVEL),
-            format=config.LOG_FORMAT,
-            handlers=[
-                logging.FileHandler(config.LOG_FILE),
-                logging.StreamHandler()
-            ]
-        )
+        from log_setup import setup_logging
+        setup_logging()
     
     def add_credential(self):
         website = self.website_entry.get().strip()
@@ -297,7 +390,13 @@ class AutomationGUI:
             messagebox.showerror("Error", "Please fill in all required fields")
             return
         
-        if self.credential_manager.add_credential(website, username, password, notes):
+        self._run_in_background(
+            lambda: self.credential_manager.add_credential(website, username, password, notes),
+            self._credential_added
+        )
+    
+    def _credential_added(self, success):
+        if success:
             messagebox.showinfo("Success", "Credential added successfully")
             self.clear_credential_form()
             self.refresh_websites()
@@ -312,13 +411,12 @@ class AutomationGUI:
         self.notes_entry.delete(0, tk.END)
     
     def refresh_websites(self):
-        websites = self.credential_manager.list_websites()
+        self._run_in_background(self.credential_manager.list_websites, self._apply_websites, key='websites')
+    
+    def _apply_websites(self, websites):
         self.website_var.set('')
         self.auto_website_var.set('')
-        
-        website_combo = self.notebook.children['!frame2'].children['!frame2'].children['!combobox']
-        website_combo['values'] = websites
-        
+        self.website_combo['values'] = websites
         self.auto_website_combo['values'] = websites
     
     def on_website_selected(self, event=None):
@@ -331,10 +429,16 @@ class AutomationGUI:
         if not website:
             return
         
+        self._run_in_background(
+            lambda: self.credential_manager.list_credentials(website),
+            self._apply_credentials,
+            key='credentials'
+        )
+    
+    def _apply_credentials(self, credentials):
         for item in self.credentials_tree.get_children():
             self.credentials_tree.delete(item)
         
-        credentials = self.credential_manager.list_credentials(website)
         for cred in credentials:
             username, created, last_used, notes = cred
             self.credentials_tree.insert('', 'end', values=(username, created, last_used, notes))
@@ -350,11 +454,17 @@ class AutomationGUI:
         website = self.website_var.get()
         
         if messagebox.askyesno("Confirm", f"Delete credential for {username} on {website}?"):
-            if self.credential_manager.delete_credential(website, username):
-                messagebox.showinfo("Success", "Credential deleted successfully")
-                self.refresh_credentials()
-            else:
-                messagebox.showerror("Error", "Failed to delete credential")
+            self._run_in_background(
+                lambda: self.credential_manager.delete_credential(website, username),
+                self._credential_deleted
+            )
+    
+    def _credential_deleted(self, success):
+        if success:
+            messagebox.showinfo("Success", "Credential deleted successfully")
+            self.refresh_credentials()
+        else:
+            messagebox.showerror("Error", "Failed to delete credential")
     
     def start_automation(self):
         website = self.auto_website_var.get()
@@ -366,11 +476,12 @@ class AutomationGUI:
             messagebox.showerror("Error", "Please select website and username")
             return
         
-        self.automation_engine = AutomationEngine()
+        from automation_engine import AutomationEngine
+        engine = self.automation_engine = AutomationEngine()
         
         def run_automation():
             try:
-                if not self.automation_engine.start_automation(website, username, headless):
+                if not engine.start_automation(website, username, headless):
                     self.log_message("Failed to start automation")
                     return
                 
@@ -378,9 +489,11 @@ class AutomationGUI:
                 
                 if action == "login":
                     login_config = self._get_default_login_config(website)
-                    success = self.automation_engine.login_to_website(website, username, login_config)
+                    success = engine.login_to_website(website, username, login_config)
                     if success:
                         self.log_message("Login successful")
+                    elif engine.cancel_token.cancelled():
+                        self.log_message("Login cancelled")
                     else:
                         self.log_message("Login failed")
                 
@@ -389,7 +502,8 @@ class AutomationGUI:
             except Exception as e:
                 self.log_message(f"Automation error: {e}")
             finally:
-                self.root.after(0, self._automation_finished)
+                engine.stop_automation()
+                self.ui_callbacks.put((lambda _: self._automation_finished(), None))
         
         self.current_automation = threading.Thread(target=run_automation, daemon=True)
         self.current_automation.start()
@@ -401,12 +515,10 @@ class AutomationGUI:
     
     def stop_automation(self):
         if self.automation_engine:
-            self.automation_engine.stop_automation()
+            self.automation_engine.cancel()
         
-        self.start_button.config(state='normal')
         self.stop_button.config(state='disabled')
-        self.progress_bar.stop()
-        self.status_label.config(text="Automation stopped", style='Info.TLabel')
+        self.status_label.config(text="Stopping automation...", style='Info.TLabel')
     
     def _automation_finished(self):
         self.start_button.config(state='normal')
@@ -423,44 +535,275 @@ class AutomationGUI:
             'success_indicators': ['logout', 'profile', 'dashboard']
         }
     
+    def load_batch_file(self):
+        path = filedialog.askopenfilename(
+            title="Select batch file",
+            filetypes=[("JSON Lines", "*.jsonl"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+        
+        from batch_runner import load_jobs
+        try:
+            self.batch_jobs = load_jobs(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load batch file: {e}")
+            return
+        
+        self.dashboard_labels['jobs'].config(text=str(len(self.batch_jobs)))
+        self.log_message(f"Loaded {len(self.batch_jobs)} jobs from {Path(path).name}")
+    
+    def queue_stored_logins(self):
+        def collect_jobs():
+            jobs = []
+            for website in self.credential_manager.list_websites():
+                for credential in self.credential_manager.list_credentials(website):
+                    jobs.append({
+                        'id': f"{website}:{credential[0]}",
+                        'type': 'login',
+                        'website': website,
+                        'username': credential[0],
+                        'login_config': self._get_default_login_config(website)
+                    })
+            return jobs
+        
+        def apply_jobs(jobs):
+            self.batch_jobs = jobs
+            self.dashboard_labels['jobs'].config(text=str(len(jobs)))
+            self.log_message(f"Queued {len(jobs)} stored logins")
+        
+        self._run_in_background(collect_jobs, apply_jobs)
+    
+    def start_batch(self):
+        if not self.batch_jobs:
+            messagebox.showerror("Error", "Please load a batch file or queue stored logins first")
+            return
+        
+        try:
+            workers = max(1, int(self.batch_workers_var.get()))
+        except ValueError:
+            messagebox.showerror("Error", "Workers must be a number")
+            return
+        
+        from batch_runner import BatchRunner
+        self.batch_runner = BatchRunner(
+            workers=workers,
+            headless=self.batch_headless_var.get(),
+            listener=lambda event, data: self.dashboard_events.put((event, data))
+        )
+        self.batch_runner.start()
+        self.batch_futures = [self.batch_runner.submit(job) for job in self.batch_jobs]
+        
+        self.batch_start_button.config(state='disabled')
+        self.batch_stop_button.config(state='normal')
+        self.log_message(f"Started batch of {len(self.batch_jobs)} jobs on {workers} workers")
+        self._render_dashboard()
+    
+    def stop_batch(self):
+        if self.batch_runner:
+            self.batch_runner.stop(cancel_running=True)
+        self.batch_stop_button.config(state='disabled')
+        self.log_message("Cancelling batch")
+    
+    def _drain_dashboard_events(self):
+        changed = False
+        try:
+            while True:
+                event, data = self.dashboard_events.get_nowait()
+                changed = True
+                if event == 'job_finished':
+                    if data['success']:
+                        outcome = "succeeded"
+                    elif data.get('cancelled'):
+                        outcome = "cancelled"
+                    else:
+                        outcome = "failed"
+                    self.log_message(f"[{data['worker']}] {data['website']} {outcome} in {data['elapsed']:.1f}s")
+        except queue.Empty:
+            pass
+        
+        if self.batch_runner and (changed or self.batch_futures):
+            self._render_dashboard()
+        
+        self.root.after(config.GUI_DASHBOARD_REFRESH_MS, self._drain_dashboard_events)
+    
+    def _render_dashboard(self):
+        snapshot = self.batch_runner.snapshot()
+        duration = snapshot['duration']
+        
+        self.dashboard_labels['queue_depth'].config(text=str(snapshot['queue_depth']))
+        self.dashboard_labels['completed'].config(text=str(snapshot['completed']))
+        self.dashboard_labels['failed'].config(text=str(snapshot['failed']))
+        self.dashboard_labels['cancelled'].config(text=str(snapshot['cancelled']))
+        self.dashboard_labels['jobs_per_minute'].config(text=f"{snapshot['jobs_per_minute']:.1f}")
+        self.dashboard_labels['p50'].config(text="-" if duration['p50'] is None else f"{duration['p50']:.1f}s")
+        self.dashboard_labels['p95'].config(text="-" if duration['p95'] is None else f"{duration['p95']:.1f}s")
+        
+        for worker in snapshot['workers']:
+            values = (
+                worker['name'],
+                worker['status'],
+                worker['website'] or "",
+                worker['step'] or "",
+                "" if worker['running_for'] is None else f"{worker['running_for']:.1f}s"
+            )
+            if self.workers_tree.exists(worker['name']):
+                self.workers_tree.item(worker['name'], values=values)
+            else:
+                self.workers_tree.insert('', 'end', iid=worker['name'], values=values)
+        
+        if self.batch_futures and all(future.done() for future in self.batch_futures):
+            self.batch_futures = []
+            self.batch_runner.stop()
+            self.batch_start_button.config(state='normal')
+            self.batch_stop_button.config(state='disabled')
+            self.log_message(f"Batch finished: {snapshot['completed']} completed, {snapshot['failed']} failed, "
+                             f"{snapshot['cancelled']} cancelled")
+    
     def log_message(self, message):
         timestamp = time.strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        self.log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def _drain_log_queue(self):
+        entries = []
+        try:
+            while len(entries) < config.GUI_LOG_BATCH_SIZE:
+                entries.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
         
-        self.automation_log.insert(tk.END, log_entry)
-        self.automation_log.see(tk.END)
+        if entries:
+            self.automation_log.insert(tk.END, ''.join(entries))
+            
+            line_count = int(self.automation_log.index('end-1c').split('.')[0])
+            overflow = line_count - config.GUI_LOG_MAX_LINES
+            if overflow > 0:
+                self.automation_log.delete('1.0', f'{overflow + 1}.0')
+            
+            self.automation_log.see(tk.END)
         
-        self.root.update_idletasks()
+        self.root.after(config.GUI_LOG_FLUSH_MS, self._drain_log_queue)
+    
+    def _run_in_background(self, func, callback, errback=None, key=None):
+        generation = None
+        if key is not None:
+            generation = self.task_generations.get(key, 0) + 1
+            self.task_generations[key] = generation
+        
+        def is_stale():
+            return key is not None and self.task_generations.get(key) != generation
+        
+        def apply(handler):
+            def apply_result(result):
+                if not is_stale():
+                    handler(result)
+            return apply_result
+        
+        def worker():
+            if is_stale():
+                return
+            try:
+                result = func()
+            except Exception as e:
+                if errback:
+                    self.ui_callbacks.put((apply(errback), e))
+                else:
+                    logger.error(f"Background task failed: {e}")
+                return
+            self.ui_callbacks.put((apply(callback), result))
+        
+        try:
+            self.db_executor.submit(worker)
+        except RuntimeError as e:
+            logger.warning(f"Background executor unavailable: {e}")
+    
+    def _drain_ui_callbacks(self):
+        try:
+            while True:
+                callback, result = self.ui_callbacks.get_nowait()
+                try:
+                    callback(result)
+                except Exception as e:
+                    logger.error(f"Error applying background result: {e}")
+        except queue.Empty:
+            pass
+        
+        self.root.after(config.GUI_LOG_FLUSH_MS, self._drain_ui_callbacks)
     
     def refresh_logs(self):
-        for item in self.logs_tree.get_children():
-            self.logs_tree.delete(item)
+        self.logs_generation += 1
+        self.logs_cursor = None
+        self.logs_loading = False
+        self.logs_exhausted = False
+        self.logs_tree.delete(*self.logs_tree.get_children())
+        
+        self._run_in_background(self.credential_manager.get_log_filter_values, self._apply_log_filter_values,
+                                key='log_filters')
+        self._load_logs_page()
+    
+    def _apply_log_filter_values(self, values):
+        websites, statuses = values
+        self.log_website_combo['values'] = ["All"] + websites
+        self.log_status_combo['values'] = ["All"] + statuses
+    
+    def _on_logs_scroll(self, first, last):
+        self.logs_scrollbar.set(first, last)
+        if float(last) >= config.GUI_LOG_PREFETCH_RATIO:
+            self._load_logs_page()
+    
+    def _load_logs_page(self):
+        if self.logs_loading or self.logs_exhausted:
+            return
         
         try:
             limit = int(self.log_limit_var.get())
-            logs = self.credential_manager.get_automation_logs(limit)
-            
-            for log in logs:
-                website, action, status, timestamp, details = log
-                self.logs_tree.insert('', 'end', values=(website, action, status, timestamp, details))
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load logs: {e}")
+        except ValueError:
+            limit = config.GUI_LOG_PAGE_SIZE
+        
+        website = self.log_website_var.get()
+        status = self.log_status_var.get()
+        generation = self.logs_generation
+        cursor = self.logs_cursor
+        self.logs_loading = True
+        
+        self._run_in_background(
+            lambda: self.credential_manager.get_automation_logs_page(
+                limit, cursor,
+                website if website != "All" else None,
+                status if status != "All" else None
+            ),
+            lambda rows: self._append_logs_page(generation, limit, rows),
+            lambda error: self._logs_page_failed(generation, error)
+        )
+    
+    def _append_logs_page(self, generation, limit, rows):
+        if generation != self.logs_generation:
+            return
+        
+        for log_id, website, action, status, timestamp, details in rows:
+            self.logs_tree.insert('', 'end', values=(website, action, status, timestamp, details))
+        
+        if rows:
+            self.logs_cursor = (rows[-1][4], rows[-1][0])
+        self.logs_exhausted = len(rows) < limit
+        self.logs_loading = False
+    
+    def _logs_page_failed(self, generation, error):
+        if generation == self.logs_generation:
+            self.logs_loading = False
+            messagebox.showerror("Error", f"Failed to load logs: {error}")
     
     def clear_logs(self):
         if messagebox.askyesno("Confirm", "Clear all logs?"):
-            try:
-                import sqlite3
-                with sqlite3.connect(config.DATABASE_FILE) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM automation_logs")
-                    conn.commit()
-                
-                self.refresh_logs()
-                messagebox.showinfo("Success", "Logs cleared successfully")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to clear logs: {e}")
+            self._run_in_background(
+                self.credential_manager.clear_automation_logs,
+                self._logs_cleared,
+                lambda e: messagebox.showerror("Error", f"Failed to clear logs: {e}")
+            )
+    
+    def _logs_cleared(self, result):
+        self.refresh_logs()
+        messagebox.showinfo("Success", "Logs cleared successfully")
     
     def save_settings(self):
         try:
@@ -486,15 +829,18 @@ class AutomationGUI:
             messagebox.showinfo("Success", "Settings reset to defaults")
     
     def on_closing(self):
+        if self.batch_runner:
+            self.batch_runner.stop(cancel_running=True)
         if self.automation_engine:
+            self.automation_engine.cancel()
             self.automation_engine.stop_automation()
+        self.db_executor.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
     
     def run(self):
         self.root.mainloop()
 
 if __name__ == "__main__":
-    import time
     app = AutomationGUI()
     app.run()
 
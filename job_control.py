@@ -0,0 +1,76 @@
+import threading
+import time
+import config
+
+class DeadlineExceeded(Exception):
+    pass
+
+class JobCancelled(DeadlineExceeded):
+    pass
+
+class CancellationToken:
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = None
+    
+    def cancel(self, reason="Job cancelled"):
+        self.reason = reason
+        self._event.set()
+    
+    def cancelled(self):
+        return self._event.is_set()
+    
+    def check(self):
+        if self._event.is_set():
+            raise JobCancelled(self.reason)
+    
+    def wait(self, seconds):
+        return self._event.wait(seconds)
+
+class Deadline:
+    def __init__(self, seconds=None, token=None):
+        self.seconds = seconds
+        self.token = token
+        self.started_at = time.monotonic()
+        self.expires_at = None if seconds is None else self.started_at + seconds
+    
+    @classmethod
+    def for_job(cls, seconds=None, token=None):
+        return cls(config.JOB_TIMEOUT if seconds is None else seconds, token)
+    
+    def remaining(self):
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def elapsed(self):
+        return time.monotonic() - self.started_at
+    
+    def expired(self):
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+    
+    def cancelled(self):
+        return self.token is not None and self.token.cancelled()
+    
+    def check(self):
+        if self.token is not None:
+            self.token.check()
+        if self.expired():
+            raise DeadlineExceeded(f"Job budget of {self.seconds}s exhausted")
+    
+    def timeout(self, requested):
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return requested
+        if requested is None:
+            return remaining
+        return min(requested, remaining)
+    
+    def sleep(self, seconds):
+        seconds = self.timeout(seconds)
+        if self.token is not None:
+            self.token.wait(seconds)
+        else:
+            time.sleep(seconds)
+        self.check()
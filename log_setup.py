@@ -0,0 +1,117 @@
+import atexit
+import contextvars
+import copy
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import config
+
+_job_context = contextvars.ContextVar('job_context', default={})
+_listener = None
+_listener_lock = threading.Lock()
+
+CONTEXT_FIELDS = ('job_id', 'website', 'trace_id')
+
+@contextmanager
+def job_context(**fields):
+    merged = dict(_job_context.get())
+    merged.update({key: value for key, value in fields.items() if value is not None})
+    token = _job_context.set(merged)
+    try:
+        yield merged
+    finally:
+        _job_context.reset(token)
+
+class JobContextQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        for key, value in _job_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return record
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, default=str)
+
+def _gzip_namer(name):
+    return name + ".gz"
+
+def _gzip_rotator(source, dest):
+    with open(source, 'rb') as source_file, gzip.open(dest, 'wb') as dest_file:
+        shutil.copyfileobj(source_file, dest_file)
+    os.remove(source)
+
+def _file_handler():
+    if config.LOG_ROTATE_WHEN:
+        handler = logging.handlers.TimedRotatingFileHandler(
+            config.LOG_FILE, when=config.LOG_ROTATE_WHEN, backupCount=config.LOG_BACKUP_COUNT, encoding='utf-8')
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            config.LOG_FILE, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT, encoding='utf-8')
+    if config.LOG_COMPRESS:
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    handler.setFormatter(JsonFormatter() if config.LOG_JSON else logging.Formatter(config.LOG_FORMAT))
+    return handler
+
+def setup_logging():
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return _listener
+        
+        config.ensure_directories()
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter(config.LOG_FORMAT))
+        
+        queue_handler = JobContextQueueHandler(queue.SimpleQueue())
+        
+        root = logging.getLogger()
+        root.setLevel(getattr(logging, config.LOG_LEVEL))
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(queue_handler)
+        
+        _listener = logging.handlers.QueueListener(queue_handler.queue, _file_handler(), console,
+                                                   respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+def shutdown_logging():
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -1,23 +1,15 @@
 import argparse
-import logging
+import json
 import sys
 from pathlib import Path
 import config
-from database import CredentialManager
-from automation_engine import AutomationEngine
-from gui import AutomationGUI
 
 def setup_logging():
-    logging.basicConfig(
-        level=getattr(logging, config.LOG_LEVEL),
-        format=config.LOG_FORMAT,
-        handlers=[
-            logging.FileHandler(config.LOG_FILE),
-            logging.StreamHandler()
-        ]
-    )
+    from log_setup import setup_logging as start_log_listener
+    start_log_listener()
 
 def add_credentials():
+    from database import CredentialManager
     credential_manager = CredentialManager()
     
     print("Add Website Credentials")
@@ -40,6 +32,7 @@ def add_credentials():
         return False
 
 def list_websites():
+    from database import CredentialManager
     credential_manager = CredentialManager()
     websites = credential_manager.list_websites()
     
@@ -53,6 +46,7 @@ def list_websites():
         print(f"{i}. {website}")
 
 def show_logs(limit=50):
+    from database import CredentialManager
     credential_manager = CredentialManager()
     logs = credential_manager.get_automation_logs(limit)
     
@@ -72,6 +66,8 @@ def show_logs(limit=50):
             print(f"  Details: {details}")
 
 def run_automation(website, username, headless=False):
+    from automation_engine import AutomationEngine
+    
     print(f"Starting automation for {website}")
     
     automation_engine = AutomationEngine()
@@ -91,7 +87,9 @@ def run_automation(website, username, headless=False):
             'success_indicators': ['logout', 'profile', 'dashboard']
         }
         
-        if automation_engine.login_to_website(website, username, login_config):
+        job = {'id': 'automate', 'type': 'login', 'website': website, 'username': username,
+               'login_config': login_config}
+        if automation_engine.run_job(job)['success']:
             print("✓ Login successful")
             return True
         else:
@@ -104,6 +102,134 @@ def run_automation(website, username, headless=False):
     finally:
         automation_engine.stop_automation()
 
+def load_finished_job_ids(results_file):
+    finished = set()
+    if not Path(results_file).exists():
+        return finished
+    
+    with open(results_file, 'r') as results:
+        for line in results:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if not result.get('cancelled') and 'error' not in result:
+                finished.add(str(result.get('id')))
+    return finished
+
+def open_results_file(results_file):
+    path = Path(results_file)
+    needs_newline = False
+    if path.exists() and path.stat().st_size:
+        with open(path, 'rb') as results:
+            results.seek(-1, 2)
+            needs_newline = results.read(1) != b"\n"
+    
+    results_out = open(path, 'a')
+    if needs_newline:
+        results_out.write("\n")
+    return results_out
+
+def run_batch(jobs_file, workers, headless, resume_file=None):
+    from concurrent.futures import as_completed
+    from batch_runner import BatchRunner, future_result, load_jobs
+    
+    jobs = load_jobs(jobs_file)
+    if resume_file:
+        finished = load_finished_job_ids(resume_file)
+        skipped = sum(1 for job in jobs if str(job['id']) in finished)
+        jobs = [job for job in jobs if str(job['id']) not in finished]
+        print(f"Resuming batch: {skipped} jobs already finished, {len(jobs)} remaining", file=sys.stderr)
+    
+    runner = BatchRunner(workers=workers, headless=headless)
+    runner.start()
+    futures = {runner.submit(job): job for job in jobs}
+    results_out = open_results_file(resume_file) if resume_file else None
+    
+    reported = set()
+    try:
+        while len(reported) < len(futures):
+            try:
+                for future in as_completed([future for future in futures if future not in reported]):
+                    reported.add(future)
+                    line = json.dumps(future_result(futures[future], future))
+                    print(line, flush=True)
+                    if results_out:
+                        results_out.write(line + "\n")
+                        results_out.flush()
+            except KeyboardInterrupt:
+                print("Cancelling batch...", file=sys.stderr)
+                runner.stop(cancel_running=True)
+    finally:
+        runner.shutdown()
+        if results_out:
+            results_out.close()
+    
+    snapshot = runner.snapshot()
+    print(f"Batch finished: {snapshot['completed']} completed, {snapshot['failed']} failed, "
+          f"{snapshot['cancelled']} cancelled", file=sys.stderr)
+    return snapshot['failed'] == 0 and snapshot['cancelled'] == 0
+
+def export_trace(path, job_id=None):
+    from database import CredentialManager
+    from tracing import export_chrome_trace
+    
+    rows = CredentialManager().get_job_spans(job_id, limit=10000)
+    if not rows:
+        print("No job spans found")
+        return False
+    
+    export_chrome_trace(rows, path)
+    print(f"✓ Wrote {len(rows)} spans to {path} (open in chrome://tracing or Perfetto)")
+    return True
+
+def start_metrics_exporter(port=None, textfile=None):
+    if port is None and not textfile and config.METRICS_PORT is None and not config.METRICS_TEXTFILE:
+        return None
+    
+    from metrics import MetricsExporter
+    return MetricsExporter(port=port, textfile=textfile).start()
+
+def configure_profiling(sample_rate=None, job_ids=None):
+    if sample_rate is None and not job_ids:
+        return
+    
+    from profiling import get_job_profiler
+    get_job_profiler().configure(sample_rate, job_ids)
+    print(f"Profiling jobs, writing to {config.PROFILES_DIR}", file=sys.stderr)
+
+def run_daemon(workers, headless):
+    from daemon import AutomationDaemon
+    
+    print(f"Starting automation daemon on http://{config.DAEMON_HOST}:{config.DAEMON_PORT}")
+    AutomationDaemon(workers=workers, headless=headless).serve_forever()
+
+def submit_to_daemon(jobs_file):
+    from batch_runner import load_jobs
+    from daemon import submit_jobs
+    
+    jobs = load_jobs(jobs_file)
+    try:
+        for result in submit_jobs(jobs):
+            print(json.dumps(result), flush=True)
+        return True
+    except ConnectionError as e:
+        print(f"✗ Could not reach daemon: {e}", file=sys.stderr)
+        return False
+    except RuntimeError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        return False
+
+def daemon_command(method, path, body=None):
+    from daemon import request_json
+    
+    try:
+        print(json.dumps(request_json(method, path, body), indent=2))
+        return True
+    except ConnectionError as e:
+        print(f"✗ Could not reach daemon: {e}", file=sys.stderr)
+        return False
+
 def main():
     parser = argparse.ArgumentParser(description="AI-Powered Automation System")
     parser.add_argument("--gui", action="store_true", help="Launch GUI interface")
@@ -113,14 +239,50 @@ def main():
     parser.add_argument("--list-websites", action="store_true", help="List saved websites")
     parser.add_argument("--show-logs", action="store_true", help="Show automation logs")
     parser.add_argument("--headless", action="store_true", help="Run in headless mode")
+    parser.add_argument("--show-browser", action="store_true",
+                       help="Show browser windows in the daemon (it runs headless otherwise)")
     parser.add_argument("--limit", type=int, default=50, help="Number of logs to show")
+    parser.add_argument("--batch", metavar="JOBS_FILE", help="Run a JSONL job file and stream JSON results to stdout")
+    parser.add_argument("--resume", metavar="RESULTS_FILE",
+                       help="Append batch results to RESULTS_FILE and skip jobs already finished there")
+    parser.add_argument("--export-trace", metavar="TRACE_FILE", help="Export recorded job step spans as Chrome trace JSON")
+    parser.add_argument("--job-id", help="Only export spans for this job ID")
+    parser.add_argument("--benchmark", nargs=argparse.REMAINDER, metavar="ARGS",
+                       help="Benchmark against the bundled local test site (see --benchmark --help)")
+    parser.add_argument("--daemon", action="store_true", help="Run the automation daemon with warm browsers")
+    parser.add_argument("--submit", metavar="JOBS_FILE", help="Submit a JSONL job file to the daemon and stream results")
+    parser.add_argument("--daemon-status", action="store_true", help="Show daemon queue and worker status")
+    parser.add_argument("--daemon-stop", action="store_true", help="Stop the running daemon")
+    parser.add_argument("--workers", type=int, default=config.BATCH_WORKERS, help="Number of parallel browser workers")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                       help="Serve Prometheus metrics on localhost:PORT/metrics while automating")
+    parser.add_argument("--profile", nargs="?", type=float, const=1.0, metavar="FRACTION",
+                       help="Profile jobs with cProfile (all jobs, or a sampled FRACTION) and write to logs/profiles")
+    parser.add_argument("--profile-jobs", nargs="+", metavar="JOB_ID", help="Only profile these job IDs")
+    parser.add_argument("--daemon-profile", nargs="?", type=float, const=1.0, metavar="FRACTION",
+                       help="Change profiling on a running daemon (0 turns it off; combine with --profile-jobs)")
+    parser.add_argument("--metrics-textfile", metavar="PATH",
+                       help="Periodically write Prometheus metrics to PATH for node-exporter's textfile collector")
     
     args = parser.parse_args()
     
     setup_logging()
     
+    metrics_exporter = None
+    if args.automate or args.batch or args.daemon:
+        metrics_exporter = start_metrics_exporter(args.metrics_port, args.metrics_textfile)
+        configure_profiling(args.profile, args.profile_jobs)
+    
+    try:
+        dispatch(args, parser)
+    finally:
+        if metrics_exporter:
+            metrics_exporter.stop()
+
+def dispatch(args, parser):
     if args.gui:
         print("Launching GUI...")
+        from gui import AutomationGUI
         app = AutomationGUI()
         app.run()
     elif args.automate:
@@ -132,6 +294,26 @@ def main():
         list_websites()
     elif args.show_logs:
         show_logs(args.limit)
+    elif args.export_trace:
+        export_trace(args.export_trace, args.job_id)
+    elif args.benchmark is not None:
+        from automation_benchmark import main as run_benchmark
+        run_benchmark(args.benchmark)
+    elif args.batch:
+        sys.exit(0 if run_batch(args.batch, args.workers, args.headless, args.resume) else 1)
+    elif args.daemon:
+        run_daemon(args.workers, not args.show_browser)
+    elif args.submit:
+        sys.exit(0 if submit_to_daemon(args.submit) else 1)
+    elif args.daemon_status:
+        sys.exit(0 if daemon_command('GET', '/status') else 1)
+    elif args.daemon_stop:
+        sys.exit(0 if daemon_command('POST', '/shutdown') else 1)
+    elif args.daemon_profile is not None:
+        settings = {'sample_rate': args.daemon_profile}
+        if args.profile_jobs is not None or args.daemon_profile == 0:
+            settings['job_ids'] = args.profile_jobs or []
+        sys.exit(0 if daemon_command('POST', '/profile', settings) else 1)
     else:
         parser.print_help()
         print("\nNo arguments provided. Use --gui to launch the interface.")
@@ -0,0 +1,261 @@
+import logging
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import config
+from stats import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+def _format_value(value):
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value))
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = []
+    for name, value in labels:
+        value = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+class Metric:
+    metric_type = None
+    
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.values = {} if self.labelnames else {(): self._new_value()}
+        self._lock = threading.Lock()
+    
+    def _new_value(self):
+        return 0
+    
+    def _key(self, labels):
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _samples(self):
+        with self._lock:
+            return [(self.name, list(zip(self.labelnames, key)), value) for key, value in sorted(self.values.items())]
+    
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        for name, labels, value in self._samples():
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    metric_type = "counter"
+    
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        with self._lock:
+            return self.values.get(self._key(labels), 0)
+
+class Gauge(Metric):
+    metric_type = "gauge"
+    
+    def set(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = value
+    
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self.values[key] = self.values.get(key, 0) + amount
+    
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+    
+    def value(self, **labels):
+        with self._lock:
+            return self.values.get(self._key(labels), 0)
+
+class Histogram(Metric):
+    metric_type = "histogram"
+    
+    def __init__(self, name, help_text, labelnames=(), buckets=None):
+        self.buckets = list(buckets or config.LATENCY_BUCKETS)
+        super().__init__(name, help_text, labelnames)
+    
+    def _new_value(self):
+        return LatencyHistogram(self.buckets)
+    
+    def observe(self, seconds, **labels):
+        key = self._key(labels)
+        with self._lock:
+            histogram = self.values.get(key)
+            if histogram is None:
+                histogram = self.values[key] = self._new_value()
+            histogram.observe(seconds)
+    
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+    
+    def summary(self, **labels):
+        with self._lock:
+            histogram = self.values.get(self._key(labels))
+            return (histogram or self._new_value()).summary()
+    
+    def _samples(self):
+        samples = []
+        with self._lock:
+            for key, histogram in sorted(self.values.items()):
+                labels = list(zip(self.labelnames, key))
+                for bound, count in histogram.cumulative():
+                    samples.append((f"{self.name}_bucket", labels + [('le', _format_value(bound))], count))
+                samples.append((f"{self.name}_sum", labels, histogram.total))
+                samples.append((f"{self.name}_count", labels, histogram.count))
+        return samples
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}
+        self._lock = threading.Lock()
+    
+    def _register(self, metric):
+        with self._lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} is already registered with a different type or labels")
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+    
+    def counter(self, name, help_text, labelnames=()):
+        return self._register(Counter(name, help_text, labelnames))
+    
+    def gauge(self, name, help_text, labelnames=()):
+        return self._register(Gauge(name, help_text, labelnames))
+    
+    def histogram(self, name, help_text, labelnames=(), buckets=None):
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+    
+    def render(self):
+        with self._lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+    
+    def write_textfile(self, path):
+        path = Path(path)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.render())
+        os.replace(temp_path, path)
+
+REGISTRY = MetricsRegistry()
+
+JOBS_STARTED = REGISTRY.counter("automation_jobs_started_total", "Jobs started", ["website"])
+JOBS_COMPLETED = REGISTRY.counter("automation_jobs_completed_total", "Jobs that finished successfully", ["website"])
+JOBS_FAILED = REGISTRY.counter("automation_jobs_failed_total", "Jobs that finished unsuccessfully", ["website"])
+JOBS_CANCELLED = REGISTRY.counter("automation_jobs_cancelled_total", "Jobs cancelled by a stop request", ["website"])
+JOB_SECONDS = REGISTRY.histogram("automation_job_duration_seconds", "End-to-end job duration", ["type"])
+QUEUE_DEPTH = REGISTRY.gauge("automation_queue_depth", "Jobs waiting for a batch worker")
+ACTIVE_BROWSERS = REGISTRY.gauge("automation_active_browsers", "Browser sessions currently open")
+BROWSER_STARTUP_SECONDS = REGISTRY.histogram("automation_browser_startup_seconds", "Time to launch a browser session",
+                                             ["browser"])
+STEP_SECONDS = REGISTRY.histogram("automation_step_duration_seconds", "Duration of traced job steps", ["step"])
+OCR_SECONDS = REGISTRY.histogram("automation_ocr_duration_seconds", "CAPTCHA OCR latency including queueing",
+                                 ["captcha_type"])
+BROWSER_RECYCLES = REGISTRY.counter("automation_browser_recycles_total", "Browser sessions replaced by health checks",
+                                    ["reason"])
+BROWSER_RSS_MB = REGISTRY.histogram("automation_browser_rss_megabytes", "Browser process tree RSS at health checks",
+                                    buckets=[100, 250, 500, 750, 1000, 1500, 2000, 3000, 4000])
+DB_WRITE_SECONDS = REGISTRY.histogram("automation_db_write_seconds", "SQLite write latency", ["operation"])
+
+def record_job_result(result):
+    website = result['website']
+    JOB_SECONDS.observe(result['elapsed'], type=result.get('type', 'login'))
+    if result['success']:
+        JOBS_COMPLETED.inc(website=website)
+    elif result.get('cancelled'):
+        JOBS_CANCELLED.inc(website=website)
+    else:
+        JOBS_FAILED.inc(website=website)
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404, "Only /metrics is served here")
+            return
+        
+        data = self.server.registry.render().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+class MetricsExporter:
+    def __init__(self, port=None, textfile=None, host=None, interval=None, registry=None):
+        self.host = host or config.METRICS_HOST
+        self.port = config.METRICS_PORT if port is None else port
+        self.textfile = textfile or config.METRICS_TEXTFILE
+        self.interval = interval or config.METRICS_TEXTFILE_INTERVAL
+        self.registry = registry or REGISTRY
+        self.server = None
+        self._stop_event = threading.Event()
+        self._writer = None
+    
+    def start(self):
+        if self.port is not None:
+            self.server = ThreadingHTTPServer((self.host, self.port), MetricsRequestHandler)
+            self.server.daemon_threads = True
+            self.server.registry = self.registry
+            self.port = self.server.server_address[1]
+            threading.Thread(target=self.server.serve_forever, name="metrics-http", daemon=True).start()
+            logger.info(f"Serving Prometheus metrics on http://{self.host}:{self.port}/metrics")
+        
+        if self.textfile:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True)
+            self._writer.start()
+            logger.info(f"Writing Prometheus metrics to {self.textfile} every {self.interval}s")
+        return self
+    
+    def _write_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self._write_textfile()
+    
+    def _write_textfile(self):
+        try:
+            self.registry.write_textfile(self.textfile)
+        except Exception as e:
+            logger.error(f"Error writing metrics textfile: {e}")
+    
+    def stop(self):
+        self._stop_event.set()
+        if self._writer:
+            self._writer.join()
+            self._writer = None
+            self._write_textfile()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
@@ -0,0 +1,117 @@
+import logging
+import queue
+import threading
+from abc import ABC, abstractmethod
+import numpy as np
+import pytesseract
+import config
+
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+logger = logging.getLogger(__name__)
+
+class OCRBackend(ABC):
+    name = "base"
+    
+    @abstractmethod
+    def image_to_string(self, image):
+        pass
+    
+    def close(self):
+        pass
+
+class PytesseractBackend(OCRBackend):
+    name = "pytesseract"
+    
+    def __init__(self, tesseract_config=None):
+        self.tesseract_config = tesseract_config or config.TESSERACT_CONFIG
+    
+    def image_to_string(self, image):
+        return pytesseract.image_to_string(image, config=self.tesseract_config)
+
+class TesserocrBackend(OCRBackend):
+    name = "tesserocr"
+    
+    def __init__(self, language=None, page_seg_mode=None, max_engines=None):
+        if tesserocr is None:
+            raise RuntimeError("tesserocr is not installed")
+        
+        self.language = language or config.OCR_LANGUAGE
+        self.page_seg_mode = page_seg_mode if page_seg_mode is not None else config.OCR_PAGE_SEG_MODE
+        self.max_engines = max_engines or config.OCR_MAX_ENGINES
+        self._engines = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        
+        self._engines.put(self._create_engine())
+    
+    def _create_engine(self):
+        engine = tesserocr.PyTessBaseAPI(
+            lang=self.language,
+            psm=self.page_seg_mode,
+            oem=tesserocr.OEM.DEFAULT
+        )
+        self._created += 1
+        logger.info(f"Loaded tesserocr engine {self._created} for language {self.language}")
+        return engine
+    
+    def _acquire(self):
+        try:
+            return self._engines.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if self._created < self.max_engines:
+                return self._create_engine()
+        return self._engines.get()
+    
+    def image_to_string(self, image):
+        image = np.ascontiguousarray(image)
+        bytes_per_pixel = 1 if image.ndim == 2 else image.shape[2]
+        height, width = image.shape[:2]
+        
+        engine = self._acquire()
+        try:
+            engine.SetImageBytes(image.tobytes(), width, height, bytes_per_pixel, width * bytes_per_pixel)
+            return engine.GetUTF8Text()
+        finally:
+            engine.Clear()
+            self._engines.put(engine)
+    
+    def close(self):
+        while True:
+            try:
+                self._engines.get_nowait().End()
+            except queue.Empty:
+                break
+        self._created = 0
+
+OCR_BACKENDS = {
+    'tesserocr': TesserocrBackend,
+    'pytesseract': PytesseractBackend
+}
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+def create_ocr_backend(name=None):
+    name = name or config.OCR_BACKEND
+    if name != "auto":
+        return OCR_BACKENDS[name]()
+
+    try:
+        return TesserocrBackend()
+    except Exception as e:
+        logger.warning(f"In-process OCR unavailable, falling back to pytesseract: {e}")
+        return PytesseractBackend()
+
+def get_ocr_backend(name=None):
+    name = name or config.OCR_BACKEND
+    with _backends_lock:
+        if name not in _backends:
+            _backends[name] = create_ocr_backend(name)
+        return _backends[name]
@@ -0,0 +1,87 @@
+import atexit
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import config
+
+logger = logging.getLogger(__name__)
+
+_worker_solver = None
+
+def _init_worker(preprocessing):
+    global _worker_solver
+    from captcha_solver import CaptchaSolver
+    _worker_solver = CaptchaSolver(preprocessing=preprocessing)
+
+def _solve_shared(shm_name, shape, dtype, captcha_type):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        image = view.copy()
+        del view
+    finally:
+        shm.close()
+
+    return _worker_solver.solve_captcha(image, captcha_type)
+
+class OCRService:
+    def __init__(self, workers=None, preprocessing=None):
+        self.workers = workers or config.OCR_WORKERS
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context(config.OCR_START_METHOD),
+            initializer=_init_worker,
+            initargs=(list(preprocessing or config.CAPTCHA_PREPROCESSING),)
+        )
+        logger.info(f"Started OCR service with {self.workers} worker processes")
+    
+    def submit(self, image, captcha_type="text"):
+        image = np.ascontiguousarray(image)
+        shm = shared_memory.SharedMemory(create=True, size=max(image.nbytes, 1))
+        buffer = np.ndarray(image.shape, dtype=image.dtype, buffer=shm.buf)
+        buffer[...] = image
+        del buffer
+        
+        try:
+            future = self.executor.submit(_solve_shared, shm.name, image.shape, image.dtype.str, captcha_type)
+        except Exception:
+            self._release(shm)
+            raise
+        
+        future.add_done_callback(lambda _: self._release(shm))
+        return future
+    
+    def _release(self, shm):
+        try:
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error releasing OCR shared memory: {e}")
+    
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait, cancel_futures=True)
+        logger.info("OCR service stopped")
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_ocr_service():
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = OCRService()
+        return _service
+
+def shutdown_ocr_service():
+    global _service
+    with _service_lock:
+        if _service is not None:
+            _service.shutdown()
+            _service = None
+
+atexit.register(shutdown_ocr_service)
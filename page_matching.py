@@ -0,0 +1,106 @@
+import threading
+import config
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+class PageClassifier:
+    def __init__(self, indicator_sets):
+        self.indicator_sets = indicator_sets
+        self.patterns = {}
+        for label, indicators in indicator_sets.items():
+            for indicator in indicators:
+                pattern = indicator.lower()
+                if pattern:
+                    self.patterns.setdefault(pattern, []).append(label)
+        
+        self.automaton = None
+        if ahocorasick is not None and self.patterns:
+            self.automaton = ahocorasick.Automaton()
+            for pattern, labels in self.patterns.items():
+                self.automaton.add_word(pattern, (pattern, tuple(labels)))
+            self.automaton.make_automaton()
+        
+        self._last = (None, {})
+    
+    def _search(self, text):
+        text_lower = text.lower()
+        if self.automaton is not None:
+            found = {}
+            for _, (pattern, labels) in self.automaton.iter(text_lower):
+                found[pattern] = labels
+        else:
+            found = {pattern: labels for pattern, labels in self.patterns.items() if pattern in text_lower}
+        
+        matches = {}
+        for pattern, labels in found.items():
+            for label in labels:
+                matches.setdefault(label, []).append(pattern)
+        return matches
+    
+    def match(self, text):
+        last_text, last_matches = self._last
+        if text == last_text:
+            return last_matches
+        matches = self._search(text)
+        self._last = (text, matches)
+        return matches
+    
+    def classify(self, text):
+        matches = self.match(text)
+        return {
+            'login_form': 'login_form' in matches,
+            'captcha': captcha_type_from_matches(matches) if 'captcha' in matches else None,
+            'success': 'login_success' in matches or 'form_success' in matches,
+            'failure': 'failure' in matches,
+            'matches': matches
+        }
+
+_classifiers = {}
+_classifiers_lock = threading.Lock()
+_MAX_CLASSIFIERS = 64
+
+def _classifier_for(indicator_sets):
+    key = tuple((label, tuple(indicators)) for label, indicators in indicator_sets.items())
+    with _classifiers_lock:
+        classifier = _classifiers.get(key)
+        if classifier is None:
+            if len(_classifiers) >= _MAX_CLASSIFIERS:
+                _classifiers.clear()
+            classifier = PageClassifier(indicator_sets)
+            _classifiers[key] = classifier
+        return classifier
+
+def page_indicator_sets():
+    indicator_sets = {
+        'login_form': config.LOGIN_FORM_INDICATORS,
+        'login_success': config.LOGIN_SUCCESS_INDICATORS,
+        'form_success': config.FORM_SUCCESS_INDICATORS,
+        'failure': config.FAILURE_INDICATORS,
+        'captcha_solved': config.CAPTCHA_SOLVED_INDICATORS
+    }
+    indicator_sets.update(captcha_indicator_sets())
+    return indicator_sets
+
+def get_page_classifier():
+    return _classifier_for(page_indicator_sets())
+
+def match_indicators(text, indicator_sets):
+    return _classifier_for(indicator_sets).match(text)
+
+def captcha_indicator_sets():
+    indicator_sets = {'captcha': config.CAPTCHA_INDICATORS}
+    indicator_sets.update(config.CAPTCHA_TYPE_INDICATORS)
+    return indicator_sets
+
+def captcha_type_from_matches(matches):
+    if 'recaptcha' in matches:
+        return 'recaptcha'
+    elif 'math' in matches:
+        return 'math'
+    elif 'image' in matches and 'select' in matches:
+        return 'image'
+    else:
+        return 'text'
@@ -0,0 +1,80 @@
+import cProfile
+import logging
+import random
+import re
+import threading
+import time
+import config
+
+logger = logging.getLogger(__name__)
+
+class JobProfiler:
+    def __init__(self, sample_rate=0.0, job_ids=None, output_dir=None):
+        self.output_dir = output_dir or config.PROFILES_DIR
+        self._lock = threading.Lock()
+        self.sample_rate = 0.0
+        self.job_ids = frozenset()
+        self.enabled = False
+        self._apply(sample_rate, job_ids)
+    
+    def configure(self, sample_rate=None, job_ids=None):
+        self._apply(sample_rate, job_ids)
+        logger.info(f"Job profiling {'enabled' if self.enabled else 'disabled'} "
+                    f"(sample rate {self.sample_rate:.2f}, {len(self.job_ids)} selected jobs)")
+        return self.settings()
+    
+    def _apply(self, sample_rate, job_ids):
+        with self._lock:
+            if sample_rate is not None:
+                self.sample_rate = min(max(float(sample_rate), 0.0), 1.0)
+            if job_ids is not None:
+                self.job_ids = frozenset(str(job_id) for job_id in job_ids)
+            self.enabled = self.sample_rate > 0 or bool(self.job_ids)
+    
+    def settings(self):
+        return {'enabled': self.enabled, 'sample_rate': self.sample_rate, 'job_ids': sorted(self.job_ids)}
+    
+    def should_profile(self, job):
+        if job.get('profile'):
+            return True
+        if not self.enabled:
+            return False
+        return str(job.get('id')) in self.job_ids or random.random() < self.sample_rate
+    
+    def start(self, job):
+        if not self.enabled and not job.get('profile'):
+            return None
+        if not self.should_profile(job):
+            return None
+        
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            logger.warning(f"Could not profile job {job.get('id')}: {e}")
+            return None
+        return profile
+    
+    def finish(self, profile, job):
+        profile.disable()
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            site = re.sub(r'[^A-Za-z0-9.-]+', '_', str(job.get('website') or 'unknown'))
+            job_id = re.sub(r'[^A-Za-z0-9.-]+', '_', str(job.get('id') or 'job'))
+            path = self.output_dir / f"{site}_{job_id}_{time.strftime('%Y%m%d-%H%M%S')}.prof"
+            profile.dump_stats(path)
+            logger.info(f"Wrote profile for job {job.get('id')} on {job.get('website')} to {path}")
+            return path
+        except Exception as e:
+            logger.error(f"Error writing job profile: {e}")
+            return None
+
+_profiler = None
+_profiler_lock = threading.Lock()
+
+def get_job_profiler():
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = JobProfiler(config.PROFILE_SAMPLE_RATE)
+        return _profiler
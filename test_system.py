@@ -192,6 +192,1252 @@ def test_dependencies():
     
     return True
 
+def test_import_time():
+    print("\nTesting CLI import time...")
+    
+    try:
+        probe = (
+            "import sys, time\n"
+            "started = time.perf_counter()\n"
+            "import main\n"
+            "elapsed = time.perf_counter() - started\n"
+            "heavy = ['selenium', 'webdriver_manager', 'cv2', 'numpy', 'pytesseract', 'tkinter', 'cryptography']\n"
+            "print(f'{elapsed:.4f}')\n"
+            "print(','.join(name for name in heavy if name in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            print(f"✗ Importing main failed: {result.stderr[:200]}")
+            return False
+        
+        elapsed, loaded = (result.stdout.splitlines() + ['', ''])[:2]
+        if loaded:
+            print(f"✗ Importing main loaded heavy modules: {loaded}")
+            return False
+        
+        print(f"✓ main imports in {float(elapsed) * 1000:.1f} ms without heavy dependencies")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Import time test failed: {e}")
+        return False
+
+def test_deadline():
+    print("\nTesting job deadlines...")
+    
+    try:
+        import config
+        from browser_automation import BrowserAutomation
+        from job_control import Deadline, DeadlineExceeded
+        
+        deadline = Deadline(60)
+        if deadline.timeout(10) != 10 or deadline.timeout(None) > 60:
+            print("✗ Deadline did not bound timeouts to the remaining budget")
+            return False
+        
+        expired = Deadline(0)
+        try:
+            expired.timeout(10)
+            print("✗ Expired deadline did not abort")
+            return False
+        except DeadlineExceeded:
+            pass
+        
+        if Deadline(None).timeout(10) != 10:
+            print("✗ Unbounded deadline changed the requested timeout")
+            return False
+        
+        class TimeoutDriver:
+            def __init__(self):
+                self.page_load_timeouts = []
+            
+            def set_page_load_timeout(self, seconds):
+                self.page_load_timeouts.append(seconds)
+            
+            def get(self, url):
+                if self.page_load_timeouts[-1] >= config.PAGE_LOAD_TIMEOUT:
+                    raise RuntimeError("page load timeout was not bounded by the deadline")
+        
+        browser = BrowserAutomation()
+        browser.driver = TimeoutDriver()
+        browser.deadline = Deadline(2)
+        if not browser.navigate_to("http://localhost/"):
+            print("✗ Navigation under a deadline failed")
+            return False
+        if browser.driver.page_load_timeouts[-1] != config.PAGE_LOAD_TIMEOUT:
+            print(f"✗ Page load timeout left at {browser.driver.page_load_timeouts[-1]}s after the job")
+            return False
+        
+        print("✓ Deadline bounds and expiry work")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Deadline test failed: {e}")
+        return False
+
+def test_cancellation():
+    print("\nTesting job cancellation...")
+    
+    try:
+        import threading
+        import time
+        from job_control import CancellationToken, Deadline, JobCancelled
+        
+        token = CancellationToken()
+        deadline = Deadline(60, token)
+        threading.Timer(0.1, token.cancel).start()
+        
+        started = time.monotonic()
+        try:
+            deadline.sleep(30)
+            print("✗ Cancelled deadline kept sleeping")
+            return False
+        except JobCancelled:
+            pass
+        
+        if time.monotonic() - started > 1:
+            print("✗ Cancellation took longer than a second to land")
+            return False
+        
+        print("✓ Cancellation interrupts waits promptly")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Cancellation test failed: {e}")
+        return False
+
+def test_job_trace():
+    print("\nTesting job step tracing...")
+    
+    try:
+        from tracing import JobTrace, chrome_trace
+        
+        trace = JobTrace("job-1", "example.com")
+        trace.mark('navigate')
+        trace.mark('fill')
+        spans = trace.finish()
+        
+        if [span[0] for span in spans] != ['navigate', 'fill', 'job'] or any(span[2] < 0 for span in spans):
+            print(f"✗ Unexpected spans: {spans}")
+            return False
+        
+        rows = [(trace.trace_id, trace.job_id, trace.website, trace.thread) + span for span in spans]
+        events = chrome_trace(rows)['traceEvents']
+        complete = [event for event in events if event['ph'] == 'X']
+        if len(complete) != 3 or complete[0]['args']['job_id'] != "job-1":
+            print("✗ Chrome trace export is incomplete")
+            return False
+        
+        print("✓ Job spans recorded and exported")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Job trace test failed: {e}")
+        return False
+
+def test_command_stats():
+    print("\nTesting WebDriver command instrumentation...")
+    
+    try:
+        from driver_metrics import CommandStats, instrument_driver
+        
+        class FakeDriver:
+            def execute(self, driver_command, params=None):
+                if driver_command == 'fail':
+                    raise RuntimeError("boom")
+                return {'value': None}
+        
+        stats = CommandStats(buckets=[0.01, 0.1, 1])
+        driver = instrument_driver(FakeDriver(), stats, lambda: ("example.com", "job-1"))
+        driver.execute('findElement')
+        driver.execute('findElement')
+        try:
+            driver.execute('fail')
+        except RuntimeError:
+            pass
+        
+        snapshot = stats.snapshot(website="example.com", job_id="job-1")
+        if snapshot['commands']['findElement']['count'] != 2 or snapshot['errors'] != {'fail': 1}:
+            print(f"✗ Unexpected command counts: {snapshot}")
+            return False
+        if stats.job_totals("job-1")['count'] != 3 or set(snapshot['website']) != {'fail', 'findElement'}:
+            print("✗ Per-job or per-site stats are incomplete")
+            return False
+        
+        print("✓ WebDriver commands counted per command, job and site")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Command stats test failed: {e}")
+        return False
+
+def test_metrics():
+    print("\nTesting Prometheus metrics...")
+    
+    try:
+        import tempfile
+        import urllib.request
+        from metrics import MetricsExporter, MetricsRegistry
+        
+        registry = MetricsRegistry()
+        jobs = registry.counter("test_jobs_total", "Jobs", ["website"])
+        latency = registry.histogram("test_latency_seconds", "Latency", buckets=[0.1, 1])
+        jobs.inc(website='example.com')
+        latency.observe(0.05)
+        latency.observe(0.5)
+        
+        text = registry.render()
+        expected = ['# TYPE test_jobs_total counter', 'test_jobs_total{website="example.com"} 1.0',
+                    'test_latency_seconds_bucket{le="0.1"} 1.0', 'test_latency_seconds_bucket{le="+Inf"} 2.0',
+                    'test_latency_seconds_count 2.0']
+        missing = [line for line in expected if line not in text.splitlines()]
+        if missing:
+            print(f"✗ Missing exposition lines: {missing}")
+            return False
+        
+        exporter = MetricsExporter(port=0, registry=registry).start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+                served = response.read().decode()
+        finally:
+            exporter.stop()
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = f"{directory}/automation.prom"
+            registry.write_textfile(path)
+            with open(path) as textfile:
+                written = textfile.read()
+        
+        if served != text or written != text:
+            print("✗ HTTP or textfile output differs from the registry")
+            return False
+        
+        print("✓ Metrics rendered, served and written")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Metrics test failed: {e}")
+        return False
+
+def test_structured_logging():
+    print("\nTesting structured logging...")
+    
+    try:
+        import gzip
+        import json
+        import logging
+        import logging.handlers
+        import queue
+        import tempfile
+        from pathlib import Path
+        import log_setup
+        
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = Path(directory) / "automation.log"
+            file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=300, backupCount=2)
+            file_handler.namer = log_setup._gzip_namer
+            file_handler.rotator = log_setup._gzip_rotator
+            file_handler.setFormatter(log_setup.JsonFormatter())
+            
+            queue_handler = log_setup.JobContextQueueHandler(queue.SimpleQueue())
+            listener = logging.handlers.QueueListener(queue_handler.queue, file_handler)
+            test_logger = logging.getLogger("test_structured_logging")
+            test_logger.propagate = False
+            test_logger.setLevel(logging.INFO)
+            test_logger.addHandler(queue_handler)
+            listener.start()
+            try:
+                with log_setup.job_context(job_id="job-1", website="example.com"):
+                    for index in range(10):
+                        test_logger.info("Step %s finished", index)
+                    test_logger.debug("Suppressed %s", "message")
+            finally:
+                listener.stop()
+                test_logger.removeHandler(queue_handler)
+                file_handler.close()
+            
+            entries = [json.loads(line) for line in log_file.read_text().splitlines()]
+            backups = sorted(Path(directory).glob("automation.log.*.gz"))
+            if not entries or entries[-1]['message'] != "Step 9 finished" or entries[-1]['job_id'] != "job-1":
+                print(f"✗ Unexpected log entries: {entries}")
+                return False
+            if not backups or 'Step' not in gzip.open(backups[0], 'rt').read():
+                print("✗ Rotated log was not compressed")
+                return False
+        
+        print("✓ JSON log lines carry job context and rotate compressed")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Structured logging test failed: {e}")
+        return False
+
+def test_job_profiler():
+    print("\nTesting job profiling...")
+    
+    try:
+        import pstats
+        import tempfile
+        from pathlib import Path
+        from profiling import JobProfiler
+        
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = JobProfiler(output_dir=Path(directory))
+            job = {'id': 'job-1', 'website': 'example.com'}
+            if profiler.start(job) is not None:
+                print("✗ Disabled profiler started a profile")
+                return False
+            
+            profiler.configure(job_ids=['job-1'])
+            profile = profiler.start(job)
+            sum(range(10000))
+            path = profiler.finish(profile, job)
+            if path is None or not path.name.startswith("example.com_job-1_") or not pstats.Stats(str(path)).total_calls:
+                print(f"✗ Unexpected profile output: {path}")
+                return False
+            
+            profiler.configure(sample_rate=0, job_ids=[])
+            if profiler.enabled or profiler.start({'id': 'job-2', 'website': 'example.com'}) is not None:
+                print("✗ Profiler did not switch off at runtime")
+                return False
+        
+        print("✓ Selected jobs profiled and profiling switched off at runtime")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Job profiling test failed: {e}")
+        return False
+
+def test_driver_health():
+    print("\nTesting driver health checks...")
+    
+    try:
+        import threading
+        from selenium.common.exceptions import NoSuchElementException, WebDriverException
+        import config
+        from browser_automation import BrowserAutomation
+        from driver_health import DriverHealth
+        from driver_metrics import instrument_driver
+        
+        hang = threading.Event()
+        release = threading.Event()
+        
+        class FakeDriver:
+            def execute(self, driver_command, params=None):
+                if driver_command == 'findElement':
+                    raise NoSuchElementException("missing")
+                if driver_command == 'crash':
+                    raise WebDriverException("chrome not reachable")
+                if driver_command == 'getCurrentUrl' and hang.is_set():
+                    release.wait(5)
+                return {'value': "about:blank"}
+            
+            @property
+            def current_url(self):
+                return self.execute('getCurrentUrl')['value']
+        
+        browser = BrowserAutomation()
+        browser.driver = FakeDriver()
+        browser.health = DriverHealth(window=4)
+        instrument_driver(browser.driver, None, lambda: (None, None), browser.health)
+        
+        for command in ['get', 'findElement', 'findElement', 'get']:
+            try:
+                browser.driver.execute(command)
+            except WebDriverException:
+                pass
+        reason, snapshot = browser.check_health()
+        if reason is not None or snapshot['pages'] != 2 or snapshot['error_rate'] != 0:
+            print(f"✗ Element lookups counted against driver health: {reason} {snapshot}")
+            return False
+        
+        for _ in range(4):
+            try:
+                browser.driver.execute('crash')
+            except WebDriverException:
+                pass
+        if browser.health.recycle_reason()[0] != 'errors':
+            print("✗ Driver errors did not trigger a recycle")
+            return False
+        
+        max_pages = config.DRIVER_MAX_PAGES
+        config.DRIVER_MAX_PAGES = 2
+        try:
+            if DriverHealth().recycle_reason()[0] is not None or browser.health.recycle_reason()[0] != 'pages':
+                print("✗ Page threshold not applied")
+                return False
+        finally:
+            config.DRIVER_MAX_PAGES = max_pages
+        
+        hang.set()
+        try:
+            if browser.is_responsive(timeout=0.2):
+                print("✗ Hung driver reported as responsive")
+                return False
+        finally:
+            hang.clear()
+            release.set()
+        
+        print("✓ Driver health thresholds and unresponsiveness detected")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Driver health test failed: {e}")
+        return False
+
+def test_page_classifier():
+    print("\nTesting page classification...")
+    
+    try:
+        import page_matching
+        
+        page = "<html><body>Please solve the CAPTCHA: what is 3 + 4? Calculate below. Logout</body></html>"
+        classifier = page_matching.PageClassifier(page_matching.page_indicator_sets())
+        result = classifier.classify(page)
+        
+        if result['captcha'] != 'math' or not result['success'] or result['failure']:
+            print(f"✗ Unexpected classification: {result}")
+            return False
+        
+        automaton = page_matching.ahocorasick
+        page_matching.ahocorasick = None
+        try:
+            fallback = page_matching.PageClassifier(page_matching.page_indicator_sets()).match(page)
+        finally:
+            page_matching.ahocorasick = automaton
+        
+        if {label: set(found) for label, found in fallback.items()} != \
+                {label: set(found) for label, found in result['matches'].items()}:
+            print("✗ Substring fallback disagrees with the automaton")
+            return False
+        
+        print("✓ Page classification works")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Page classification test failed: {e}")
+        return False
+
+def test_captcha_corpus():
+    print("\nTesting CAPTCHA benchmark corpus...")
+    
+    try:
+        from captcha_benchmark import generate_corpus
+        
+        corpus = generate_corpus(6, ("text", "math"), seed=1)
+        if len(corpus) != 6 or {sample['kind'] for sample in corpus} != {"text", "math"}:
+            print("✗ Corpus does not contain the requested challenges")
+            return False
+        
+        for sample in corpus:
+            if sample['image'].ndim != 3 or not sample['answer']:
+                print(f"✗ Invalid sample: {sample['challenge']}")
+                return False
+            if sample['kind'] == "math" and str(eval(sample['challenge'])) != sample['answer']:
+                print(f"✗ Wrong answer for {sample['challenge']}")
+                return False
+        
+        if generate_corpus(6, ("text", "math"), seed=1)[0]['answer'] != corpus[0]['answer']:
+            print("✗ Corpus is not reproducible for a fixed seed")
+            return False
+        
+        print("✓ Synthetic CAPTCHA corpus generated")
+        return True
+        
+    except Exception as e:
+        print(f"✗ CAPTCHA corpus test failed: {e}")
+        return False
+
+def test_benchmark_site():
+    print("\nTesting benchmark site...")
+    
+    try:
+        import urllib.parse
+        import urllib.request
+        from benchmark_site import BenchmarkSite
+        
+        site = BenchmarkSite(users={'bench': 'secret'}).start()
+        try:
+            def post(path, fields):
+                data = urllib.parse.urlencode(fields).encode()
+                return urllib.request.urlopen(site.base_url + path, data, timeout=10).read().decode()
+            
+            if 'Logout' not in post('/login', {'username': 'bench', 'password': 'secret'}):
+                print("✗ Valid login was rejected")
+                return False
+            
+            if 'Invalid password' not in post('/login', {'username': 'bench', 'password': 'wrong'}):
+                print("✗ Invalid login was accepted")
+                return False
+            
+            if 'submitted' not in post('/form', {'full_name': 'A', 'email': 'a@b.c', 'phone': '1',
+                                                 'company': 'C', 'country': 'Canada', 'agree': 'yes'}):
+                print("✗ Complete form was rejected")
+                return False
+        finally:
+            site.stop()
+        
+        print("✓ Benchmark site serves login and form pages")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Benchmark site test failed: {e}")
+        return False
+
+def test_benchmark_workloads():
+    print("\nTesting benchmark workloads...")
+    
+    try:
+        from types import SimpleNamespace
+        from automation_benchmark import WORKLOADS
+        
+        site = SimpleNamespace(base_url="http://127.0.0.1:1")
+        for workload, build_job in WORKLOADS.items():
+            jobs = [build_job(site, index) for index in range(2 * len(WORKLOADS))]
+            if any(job['website'] != "benchmark.local" or job['type'] not in ('login', 'form_submission')
+                   for job in jobs):
+                print(f"✗ Workload {workload} built an invalid job")
+                return False
+        
+        print("✓ Every benchmark workload builds jobs")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Benchmark workload test failed: {e!r}")
+        return False
+
+def test_page_classifier_threads():
+    print("\nTesting page classification across threads...")
+    
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        import page_matching
+        
+        pages = {
+            'captcha': "<html>Please solve the CAPTCHA below</html>",
+            'success': "<html>Welcome to your dashboard. Logout</html>",
+            'plain': "<html>Nothing to see here</html>"
+        }
+        expected = {name: page_matching.PageClassifier(page_matching.page_indicator_sets()).match(page)
+                    for name, page in pages.items()}
+        classifier = page_matching.get_page_classifier()
+        
+        def check(index):
+            name = list(pages)[index % len(pages)]
+            return classifier.match(pages[name]) == expected[name]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            if not all(executor.map(check, range(3000))):
+                print("✗ A page was classified with another page's matches")
+                return False
+        
+        print("✓ Shared classifier returns each page's own matches")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Threaded classification test failed: {e!r}")
+        return False
+
+class _StubSolver:
+    def solve_captcha(self, image, captcha_type="text"):
+        return f"{captcha_type}:{image.shape}:{image.dtype}:{int(image.sum())}"
+
+def _init_stub_ocr_worker(preprocessing):
+    import ocr_service
+    ocr_service._worker_solver = _StubSolver()
+
+def test_ocr_service():
+    print("\nTesting OCR service...")
+    
+    try:
+        import numpy as np
+        import config
+        import ocr_service
+        
+        original_init = ocr_service._init_worker
+        ocr_service._init_worker = _init_stub_ocr_worker
+        try:
+            service = ocr_service.OCRService()
+        finally:
+            ocr_service._init_worker = original_init
+        
+        try:
+            if service.workers != config.OCR_WORKERS or service.executor._max_workers != config.OCR_WORKERS:
+                print(f"✗ Pool size {service.workers} does not follow OCR_WORKERS")
+                return False
+            
+            images = [np.full((3, 7), index, dtype=np.uint8) for index in range(4)]
+            images.append(np.arange(24, dtype=np.float32).reshape(2, 3, 4))
+            futures = [service.submit(image, "math") for image in images]
+            results = [future.result(timeout=60) for future in futures]
+        finally:
+            service.shutdown()
+        
+        expected = [f"math:{image.shape}:{image.dtype}:{int(image.sum())}" for image in images]
+        if results != expected:
+            print(f"✗ Shared-memory round trip changed the images: {results}")
+            return False
+        
+        print("✓ Images round-trip through shared memory to the worker pool")
+        return True
+        
+    except Exception as e:
+        print(f"✗ OCR service test failed: {e!r}")
+        return False
+
+def test_probe_elements():
+    print("\nTesting element probing...")
+    
+    try:
+        from browser_automation import BrowserAutomation
+        
+        class FakeDriver:
+            def __init__(self):
+                self.implicit_waits = []
+                self.script_calls = 0
+                self.lookups = []
+            
+            def implicitly_wait(self, seconds):
+                self.implicit_waits.append(seconds)
+            
+            def execute_script(self, script, locators):
+                self.script_calls += 1
+                return [value == '.present' for _, value in locators]
+            
+            def find_elements(self, by, value):
+                self.lookups.append((by, value, self.implicit_waits[-1] if self.implicit_waits else None))
+                return ['element'] if value == 'present-widget' else []
+        
+        browser = BrowserAutomation()
+        browser.driver = FakeDriver()
+        browser.implicit_wait = 5
+        present = browser.probe_elements({
+            'css_present': ('css', '.present'),
+            'css_missing': ('css', '.missing'),
+            'custom_present': ('-custom', 'present-widget'),
+            'custom_missing': ('-custom', 'missing-widget')
+        })
+        
+        expected = {'css_present': True, 'css_missing': False, 'custom_present': True, 'custom_missing': False}
+        if present != expected:
+            print(f"✗ Unexpected probe result: {present}")
+            return False
+        if browser.driver.script_calls != 1 or [lookup[2] for lookup in browser.driver.lookups] != [0, 0]:
+            print("✗ Probe did not batch scripted locators or disable the implicit wait for the rest")
+            return False
+        if browser.driver.implicit_waits != [0, 5]:
+            print(f"✗ Implicit wait not restored: {browser.driver.implicit_waits}")
+            return False
+        
+        print("✓ Elements probed in one script with the implicit wait off and restored")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Element probe test failed: {e!r}")
+        return False
+
+def test_captcha_detection():
+    print("\nTesting CAPTCHA detection...")
+    
+    try:
+        from automation_engine import AutomationEngine
+        
+        class FakeBrowser:
+            def __init__(self, page, elements):
+                self.page = page
+                self.elements = elements
+            
+            def evaluate_indicators(self, indicator_sets):
+                return None
+            
+            def get_page_source(self):
+                return self.page
+            
+            def probe_elements(self, locators):
+                return {name: name in self.elements for name in locators}
+        
+        engine = AutomationEngine.__new__(AutomationEngine)
+        solved = []
+        engine._solve_text_captcha = lambda: solved.append('text') or True
+        engine._solve_math_captcha = lambda: solved.append('math') or True
+        
+        engine.browser = FakeBrowser("<div id='challenge'>Please verify you are human</div>", set())
+        if engine._handle_captcha_if_present() or solved:
+            print("✗ Keyword-only CAPTCHA was treated as absent")
+            return False
+        
+        engine.browser = FakeBrowser("<p>Type the captcha text</p>", {'image', 'input'})
+        if not engine._handle_captcha_if_present() or solved != ['text']:
+            print(f"✗ Text CAPTCHA not solved: {solved}")
+            return False
+        
+        engine.browser = FakeBrowser("<p>Welcome back</p>", {'image', 'input'})
+        if not engine._handle_captcha_if_present() or solved != ['text']:
+            print("✗ CAPTCHA-free page was not passed through")
+            return False
+        
+        print("✓ CAPTCHA decision follows page indicators, probe checks its elements")
+        return True
+        
+    except Exception as e:
+        print(f"✗ CAPTCHA detection test failed: {e!r}")
+        return False
+
+def test_unhealthy_browser_job():
+    print("\nTesting jobs on an unhealthy browser...")
+    
+    try:
+        import logging
+        import log_setup
+        from automation_engine import AutomationEngine
+        from job_control import CancellationToken
+        
+        class UnhealthyBrowser:
+            deadline = None
+            
+            def prepare_for_job(self):
+                logging.getLogger("test_unhealthy_browser").warning("Browser could not be replaced")
+                return False
+        
+        class TraceStore:
+            def save_job_trace(self, trace):
+                self.trace = trace
+        
+        class ContextRecorder(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.contexts = []
+            
+            def emit(self, record):
+                self.contexts.append(dict(log_setup._job_context.get()))
+        
+        engine = AutomationEngine.__new__(AutomationEngine)
+        engine.browser = UnhealthyBrowser()
+        engine.credential_manager = TraceStore()
+        engine.current_website = None
+        engine.listeners = []
+        engine.cancel_token = CancellationToken()
+        engine.trace = None
+        
+        finished = []
+        engine.add_listener(lambda event, data: finished.append((data, dict(log_setup._job_context.get())))
+                            if event == 'job_finished' else None)
+        
+        recorder = ContextRecorder()
+        test_logger = logging.getLogger("test_unhealthy_browser")
+        test_logger.addHandler(recorder)
+        try:
+            result = engine.run_job({'id': 'job-9', 'website': 'example.com', 'username': 'user',
+                                     'login_config': {}})
+        finally:
+            test_logger.removeHandler(recorder)
+        
+        if result['success'] or not result.get('trace_id'):
+            print(f"✗ Unexpected result: {result}")
+            return False
+        if not finished or finished[0][1].get('job_id') != 'job-9':
+            print("✗ job_finished was emitted outside the job context")
+            return False
+        if not recorder.contexts or recorder.contexts[0].get('trace_id') != result['trace_id']:
+            print("✗ Health failure was logged without job context")
+            return False
+        if [span[0] for span in engine.credential_manager.trace.spans][0] != 'browser_health':
+            print("✗ Health check missing from the job trace")
+            return False
+        
+        print("✓ Unhealthy-browser failures are traced and carry job context")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Unhealthy browser test failed: {e!r}")
+        return False
+
+def test_daemon():
+    print("\nTesting automation daemon...")
+    
+    try:
+        import threading
+        from concurrent.futures import Future
+        from daemon import AutomationDaemon, request_json, submit_jobs
+        
+        class StubRunner:
+            def __init__(self):
+                self.submitted = []
+                self.stopped = False
+            
+            def start(self):
+                pass
+            
+            def submit(self, job):
+                self.submitted.append(job)
+                future = Future()
+                future.set_result({'id': job['id'], 'website': job['website'], 'success': True})
+                return future
+            
+            def snapshot(self):
+                return {'submitted': len(self.submitted)}
+            
+            def stop(self, cancel_running=False):
+                self.stopped = True
+            
+            def shutdown(self):
+                pass
+        
+        runner = StubRunner()
+        daemon = AutomationDaemon(host='127.0.0.1', port=0, runner=runner)
+        server_thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        server_thread.start()
+        for _ in range(100):
+            if daemon.server is not None and daemon.port:
+                break
+            threading.Event().wait(0.05)
+        
+        try:
+            jobs = [{'id': 'a', 'website': 'example.com', 'username': 'user', 'login_config': {}},
+                    {'website': 'example.org', 'username': 'user', 'login_config': {}}]
+            results = list(submit_jobs(jobs, host='127.0.0.1', port=daemon.port))
+            if sorted(result['website'] for result in results) != ['example.com', 'example.org']:
+                print(f"✗ Unexpected NDJSON results: {results}")
+                return False
+            if not all(result['success'] and result['id'] for result in results):
+                print(f"✗ Results missing ids: {results}")
+                return False
+            
+            try:
+                list(submit_jobs([{'website': 'example.com', 'login_config': {}}, "not a job"], host='127.0.0.1', port=daemon.port))
+                print("✗ Invalid jobs were accepted")
+                return False
+            except RuntimeError as e:
+                if 'missing username' not in str(e) or 'not a JSON object' not in str(e):
+                    print(f"✗ Rejection does not name the bad jobs: {e}")
+                    return False
+            
+            status = request_json('GET', '/status', host='127.0.0.1', port=daemon.port)
+            if status != {'submitted': 2}:
+                print(f"✗ Unexpected status: {status}")
+                return False
+        finally:
+            daemon.stop()
+            server_thread.join(5)
+        
+        if server_thread.is_alive() or not runner.stopped:
+            print("✗ Daemon did not stop")
+            return False
+        
+        print("✓ Daemon streams NDJSON results, rejects invalid jobs and reports status")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Daemon test failed: {e!r}")
+        return False
+
+def test_ocr_backends():
+    print("\nTesting OCR backend selection...")
+    
+    try:
+        import config
+        import ocr_backends
+        from captcha_solver import CaptchaSolver
+        
+        saved_tesserocr, saved_backends = ocr_backends.tesserocr, dict(ocr_backends._backends)
+        ocr_backends.tesserocr = None
+        ocr_backends._backends.clear()
+        try:
+            backend = ocr_backends.get_ocr_backend('auto')
+            if not isinstance(backend, ocr_backends.PytesseractBackend):
+                print(f"✗ Expected the pytesseract fallback, got {backend.name}")
+                return False
+            if ocr_backends.get_ocr_backend('auto') is not backend:
+                print("✗ OCR backend was created again instead of reused")
+                return False
+            
+            solver = CaptchaSolver()
+            if solver.ocr_backend is not backend or solver.ocr_backend is not backend:
+                print("✗ Solver did not reuse the shared OCR backend")
+                return False
+        finally:
+            ocr_backends.tesserocr = saved_tesserocr
+            ocr_backends._backends.clear()
+            ocr_backends._backends.update(saved_backends)
+        
+        if f"--psm {config.OCR_PAGE_SEG_MODE}" not in config.TESSERACT_CONFIG:
+            print("✗ Page segmentation mode differs between OCR backends")
+            return False
+        try:
+            ocr_backends.OCRBackend()
+            print("✗ Abstract OCR backend could be instantiated")
+            return False
+        except TypeError:
+            pass
+        
+        print("✓ pytesseract is the fallback and the backend is created once and reused")
+        return True
+        
+    except Exception as e:
+        print(f"✗ OCR backend test failed: {e!r}")
+        return False
+
+def test_browser_start_failure():
+    print("\nTesting browser start failures...")
+    
+    try:
+        import metrics
+        from browser_automation import BrowserAutomation
+        
+        class BrokenDriver:
+            quit_calls = 0
+            
+            def implicitly_wait(self, seconds):
+                raise RuntimeError("session deleted")
+            
+            def quit(self):
+                BrokenDriver.quit_calls += 1
+        
+        browser = BrowserAutomation(browser_type="chrome")
+        browser._setup_chrome = BrokenDriver
+        active = metrics.ACTIVE_BROWSERS.value()
+        
+        if browser.start_browser():
+            print("✗ Broken browser reported as started")
+            return False
+        browser.close_browser()
+        
+        if browser.driver is not None or BrokenDriver.quit_calls != 1:
+            print("✗ Half-started driver was not quit and cleared")
+            return False
+        if metrics.ACTIVE_BROWSERS.value() != active:
+            print(f"✗ Active browser gauge moved from {active} to {metrics.ACTIVE_BROWSERS.value()}")
+            return False
+        
+        print("✓ Failed starts quit the driver and leave the browser gauge unchanged")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Browser start failure test failed: {e!r}")
+        return False
+
+def test_locator_hints():
+    print("\nTesting locator resolution and hints...")
+    
+    try:
+        from automation_engine import AutomationEngine
+        from browser_automation import BrowserAutomation
+        
+        class FakeDriver:
+            def __init__(self, present):
+                self.present = present
+                self.calls = []
+            
+            def execute_script(self, script, locators):
+                self.calls.append([value for by, value in locators])
+                for index, (by, value) in enumerate(locators):
+                    if value in self.present:
+                        return [index, f"element {value}"]
+                return None
+        
+        class HintStore:
+            def __init__(self):
+                self.saved = []
+            
+            def get_locator_hints(self, website):
+                return {}
+            
+            def save_locator_hint(self, website, field, by_kind, selector):
+                self.saved.append((website, field, by_kind, selector))
+                return True
+        
+        browser = BrowserAutomation()
+        browser.driver = FakeDriver({'#b', '#form-submit'})
+        
+        index, element = browser.find_first_element([('css', '#a'), ('css', '#b')])
+        if (index, element) != (1, "element #b") or browser.driver.calls[-1] != ['#a', '#b']:
+            print(f"✗ find_first_element returned {index}, {element}")
+            return False
+        if browser.find_first_element([('css', '#missing')], timeout=0.2) != (None, None):
+            print("✗ Missing locators did not return (None, None)")
+            return False
+        
+        engine = AutomationEngine.__new__(AutomationEngine)
+        engine.browser = browser
+        engine.credential_manager = HintStore()
+        engine.locator_hints = {}
+        engine.current_website = "example.com"
+        
+        engine._pause = lambda seconds: None
+        engine._checkpoint = lambda: None
+        browser.type_into_element = lambda element, text: True
+        browser.click_on_element = lambda element: True
+        browser.driver.present = {'#b', '#user', '#pass'}
+        
+        def log_in():
+            return engine._fill_login_form("user", {'password': "secret"}, '#user', '#pass', ['#a', '#b'])
+        
+        log_in()
+        log_in()
+        if browser.driver.calls[-1] != ['#b', '#a']:
+            print("✗ Learned locator was not tried first")
+            return False
+        
+        browser.driver.present = {'#form-submit', '#a', '#b', '#user', '#pass'}
+        engine._submit_form(['#form-submit', '#b'])
+        log_in()
+        if browser.driver.calls[-1] != ['#b', '#a']:
+            print("✗ Form submit hint overwrote the login submit hint")
+            return False
+        
+        expected = [("example.com", 'login_submit', 'css', '#b'), ("example.com", 'form_submit', 'css', '#form-submit')]
+        if [hint for hint in engine.credential_manager.saved if hint[1].endswith('submit')] != expected:
+            print(f"✗ Unexpected hint writes: {engine.credential_manager.saved}")
+            return False
+        
+        print("✓ First matching locator is found in one script and hints are cached per purpose")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Locator hint test failed: {e!r}")
+        return False
+
+def test_captcha_pipeline():
+    print("\nTesting staged CAPTCHA pipeline...")
+    
+    try:
+        import threading
+        import time
+        import numpy as np
+        from captcha_solver import CaptchaSolver
+        
+        class ConfidentBackend:
+            name = "fake"
+            
+            def __init__(self, answers):
+                self.answers = answers
+                self.calls = []
+            
+            def image_to_string(self, image):
+                self.calls.append(image)
+                return self.answers.get(image, "")
+        
+        morphology_started = threading.Event()
+        released = threading.Event()
+        
+        def slow_morphology(gray):
+            morphology_started.set()
+            released.wait(5)
+            return 'morphology'
+        
+        def adaptive(gray):
+            morphology_started.wait(5)
+            return 'adaptive'
+        
+        def make_solver(answers):
+            stages = []
+            solver = CaptchaSolver(ConfidentBackend(answers), ['gray', 'threshold', 'adaptive', 'morphology'],
+                                   ['adaptive', 'morphology'], lambda stage, seconds: stages.append(stage))
+            solver.preprocessors = {
+                'gray': lambda gray: 'gray',
+                'threshold': lambda gray: 'threshold',
+                'adaptive': adaptive,
+                'morphology': slow_morphology
+            }
+            return solver, stages
+        
+        image = np.zeros((20, 60), np.uint8)
+        
+        solver, stages = make_solver({'gray': "AB12CD"})
+        if solver.solve_captcha(image) != "AB12CD" or solver.ocr_backend.calls != ['gray']:
+            print(f"✗ Sequential stage did not stop at a confident result: {solver.ocr_backend.calls}")
+            return False
+        if stages != ['grayscale', 'preprocess.gray', 'ocr.gray', 'solve']:
+            print(f"✗ Unexpected stage timings: {stages}")
+            return False
+        
+        solver, stages = make_solver({'adaptive': "AB12CD"})
+        try:
+            answer = solver.solve_captcha(image)
+        finally:
+            released.set()
+        if answer != "AB12CD":
+            print(f"✗ Parallel variants returned {answer}")
+            return False
+        
+        for _ in range(100):
+            if 'preprocess.morphology' in stages:
+                break
+            time.sleep(0.02)
+        else:
+            print("✗ Slow variant never finished preprocessing")
+            return False
+        time.sleep(0.1)
+        if solver.ocr_backend.calls != ['gray', 'threshold', 'adaptive']:
+            print(f"✗ Variant still ran OCR after the early exit: {solver.ocr_backend.calls}")
+            return False
+        
+        print("✓ Confident results stop the pipeline, including variants already preprocessing")
+        return True
+        
+    except Exception as e:
+        print(f"✗ CAPTCHA pipeline test failed: {e!r}")
+        return False
+
+def test_browser_indicators():
+    print("\nTesting browser-side indicator matching...")
+    
+    try:
+        import json
+        import shutil
+        from bs4 import BeautifulSoup
+        from browser_automation import BrowserAutomation
+        from page_matching import match_indicators, page_indicator_sets
+        
+        node = shutil.which("node")
+        if node is None:
+            print("⚠ Node.js not available, skipping browser-side indicator test")
+            return True
+        
+        class NodeDriver:
+            def __init__(self, html):
+                soup = BeautifulSoup(html, "html.parser")
+                for hidden in soup.find_all(['script', 'style', 'noscript', 'template']):
+                    hidden.string = ""
+                nodes = []
+                for tag in soup.body.find_all(True):
+                    if tag.name not in ('script', 'style', 'noscript', 'template'):
+                        nodes.append({name: " ".join(value) if isinstance(value, list) else value
+                                      for name, value in tag.attrs.items()})
+                self.page = {'title': soup.title.string if soup.title else "",
+                             'text': soup.body.get_text("\n"), 'nodes': nodes}
+            
+            def execute_script(self, script, *args):
+                program = (
+                    "const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));\n"
+                    "const document = {title: input.page.title, body: {innerText: input.page.text},\n"
+                    "    querySelectorAll: () => input.page.nodes.map(attrs => ({\n"
+                    "        getAttribute: name => name in attrs ? attrs[name] : null}))};\n"
+                    "const result = (function() {\n" + script + "\n}).apply(null, input.args);\n"
+                    "process.stdout.write(JSON.stringify(result));\n"
+                )
+                output = subprocess.run([node, "-e", program], input=json.dumps({'page': self.page, 'args': args}),
+                                        capture_output=True, text=True, timeout=30, check=True).stdout
+                return json.loads(output)
+        
+        pages = [
+            "<html><head><title>Security Check</title></head><body><form action='/login'>"
+            "<img src='/captcha.png' alt='CAPTCHA'><p>Please calculate 3 + 4 to prove you are human</p>"
+            "<input name='password' placeholder='Password'></form></body></html>",
+            "<html><body><div class='welcome-banner'>Welcome back</div><a id='logout'>Log out</a>"
+            "<p>Invalid password, try again</p></body></html>"
+        ]
+        indicator_sets = page_indicator_sets()
+        browser = BrowserAutomation()
+        
+        for page in pages:
+            browser.driver = NodeDriver(page)
+            dom_matches = browser.evaluate_indicators(indicator_sets)
+            text_matches = match_indicators(page, indicator_sets)
+            if {label: set(found) for label, found in dom_matches.items()} != \
+                    {label: set(found) for label, found in text_matches.items()}:
+                print(f"✗ Browser mode disagrees with text mode: {dom_matches} vs {text_matches}")
+                return False
+        
+        page = "<html><body><p>Dashboard</p><script>loadRecaptcha()</script></body></html>"
+        browser.driver = NodeDriver(page)
+        dom_matches = browser.evaluate_indicators(indicator_sets)
+        if 'captcha' in dom_matches or 'captcha' not in match_indicators(page, indicator_sets):
+            print(f"✗ Script contents leaked into browser-side matching: {dom_matches}")
+            return False
+        
+        print("✓ Browser-side matching agrees with text mode on visible text and attributes")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Browser indicator test failed: {e!r}")
+        return False
+
+def test_batch_resume():
+    print("\nTesting batch job loading and resume...")
+    
+    try:
+        import json
+        import tempfile
+        from concurrent.futures import Future
+        from pathlib import Path
+        import batch_runner
+        import main as cli
+        
+        class StubRunner:
+            submitted = []
+            
+            def __init__(self, workers=None, headless=True):
+                pass
+            
+            def start(self):
+                pass
+            
+            def submit(self, job):
+                StubRunner.submitted.append(job['id'])
+                future = Future()
+                future.set_result({'id': job['id'], 'website': job['website'], 'success': True})
+                return future
+            
+            def shutdown(self):
+                pass
+            
+            def snapshot(self):
+                return {'completed': len(StubRunner.submitted), 'failed': 0, 'cancelled': 0}
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            jobs_file = Path(tmp) / "jobs.jsonl"
+            jobs_file.write_text("\n".join([
+                "# nightly logins",
+                json.dumps({'id': 'a', 'website': 'example.com', 'username': 'user', 'login_config': {}}),
+                json.dumps({'website': 'example.org', 'username': 'user', 'login_config': {}}),
+                json.dumps({'id': 'c', 'website': 'example.net', 'form_config': {}, 'form_data': {}}),
+                json.dumps({'id': 'd', 'website': 'example.com', 'type': 'scrape'}),
+                json.dumps({'id': 'e', 'website': 'example.com', 'username': 'user'}),
+                json.dumps(['not', 'a', 'job']),
+                '{"id": "f", "website":',
+                json.dumps({'id': 'g', 'website': 'example.io', 'username': 'user', 'login_config': {}})
+            ]) + "\n")
+            
+            jobs = batch_runner.load_jobs(jobs_file)
+            if [(job['id'], job['type']) for job in jobs] != \
+                    [('a', 'login'), ('3', 'login'), ('c', 'form_submission'), ('g', 'login')]:
+                print(f"✗ Unexpected jobs loaded: {jobs}")
+                return False
+            
+            results_file = Path(tmp) / "results.jsonl"
+            results_file.write_text("\n".join([
+                json.dumps({'id': 'a', 'website': 'example.com', 'success': True}),
+                json.dumps({'id': '3', 'website': 'example.org', 'success': False, 'cancelled': True}),
+                json.dumps({'id': 'c', 'website': 'example.net', 'success': False, 'error': "driver crashed"}),
+                '{"id": "g", "website": "example.io", "succ'
+            ]))
+            
+            if cli.load_finished_job_ids(results_file) != {'a'}:
+                print(f"✗ Unexpected finished ids: {cli.load_finished_job_ids(results_file)}")
+                return False
+            
+            runner_class = batch_runner.BatchRunner
+            batch_runner.BatchRunner = StubRunner
+            try:
+                cli.run_batch(jobs_file, 1, True, resume_file=results_file)
+            finally:
+                batch_runner.BatchRunner = runner_class
+            
+            if sorted(StubRunner.submitted) != ['3', 'c', 'g']:
+                print(f"✗ Resume re-ran finished jobs or dropped unfinished ones: {StubRunner.submitted}")
+                return False
+            if cli.load_finished_job_ids(results_file) != {'a', '3', 'c', 'g'}:
+                print("✗ Results appended after a partial line were not readable")
+                return False
+        
+        print("✓ Invalid jobs are skipped and resume only re-runs unfinished jobs")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Batch resume test failed: {e!r}")
+        return False
+
 def main():
     print("AI-Powered Automation System - System Test")
     print("=" * 50)
@@ -202,7 +1448,32 @@ def main():
         ("Module Imports", test_imports),
         ("Configuration", test_config),
         ("Database", test_database),
-        ("CLI", test_cli)
+        ("CLI", test_cli),
+        ("Import Time", test_import_time),
+        ("Deadline", test_deadline),
+        ("Cancellation", test_cancellation),
+        ("Batch Resume", test_batch_resume),
+        ("Job Trace", test_job_trace),
+        ("Command Stats", test_command_stats),
+        ("Metrics", test_metrics),
+        ("Daemon", test_daemon),
+        ("Structured Logging", test_structured_logging),
+        ("Job Profiler", test_job_profiler),
+        ("Driver Health", test_driver_health),
+        ("Browser Start Failure", test_browser_start_failure),
+        ("Unhealthy Browser Job", test_unhealthy_browser_job),
+        ("Page Classifier", test_page_classifier),
+        ("Page Classifier Threads", test_page_classifier_threads),
+        ("Browser Indicators", test_browser_indicators),
+        ("Element Probe", test_probe_elements),
+        ("Locator Hints", test_locator_hints),
+        ("CAPTCHA Detection", test_captcha_detection),
+        ("CAPTCHA Corpus", test_captcha_corpus),
+        ("OCR Backends", test_ocr_backends),
+        ("CAPTCHA Pipeline", test_captcha_pipeline),
+        ("OCR Service", test_ocr_service),
+        ("Benchmark Site", test_benchmark_site),
+        ("Benchmark Workloads", test_benchmark_workloads)
     ]
     
     results = {}
@@ -0,0 +1,58 @@
+import json
+import threading
+import time
+import uuid
+
+class JobTrace:
+    def __init__(self, job_id=None, website=None):
+        self.trace_id = uuid.uuid4().hex
+        self.job_id = str(job_id) if job_id is not None else self.trace_id
+        self.website = website
+        self.thread = threading.current_thread().name
+        self.started_at = time.time()
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._open_step = None
+    
+    def mark(self, step):
+        now = time.perf_counter()
+        self._close(now)
+        self._open_step = (step, now)
+    
+    def _close(self, now):
+        if self._open_step is not None:
+            step, started = self._open_step
+            self.spans.append((step, self.started_at + (started - self._origin), now - started))
+            self._open_step = None
+    
+    def finish(self):
+        now = time.perf_counter()
+        self._close(now)
+        self.spans.append(('job', self.started_at, now - self._origin))
+        return self.spans
+
+def chrome_trace(rows):
+    events = []
+    threads = {}
+    for trace_id, job_id, website, thread, step, started_at, duration in rows:
+        tid = threads.setdefault(thread, len(threads) + 1)
+        events.append({
+            'name': step,
+            'cat': website,
+            'ph': 'X',
+            'ts': started_at * 1000000,
+            'dur': duration * 1000000,
+            'pid': 1,
+            'tid': tid,
+            'args': {'job_id': job_id, 'trace_id': trace_id, 'website': website}
+        })
+    
+    for thread, tid in threads.items():
+        events.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': thread}})
+    
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+def export_chrome_trace(rows, path):
+    with open(path, 'w') as trace_file:
+        json.dump(chrome_trace(rows), trace_file)
+    return len(rows)